@@ -12,9 +12,11 @@ from alembic import context
 from src.auth.models import Guest, User  # noqa: F401
 from src.config import get_settings
 from src.datasets.models import Dataset, DatasetRow  # noqa: F401
+from src.embeddings.models import EmbeddingCacheEntry  # noqa: F401
+from src.llm.models import GenerationCacheEntry  # noqa: F401
 from src.profiles.models import EvaluatorProfile  # noqa: F401
 from src.prompts.models import Prompt, PromptVersion  # noqa: F401
-from src.runs.models import Run, RunResult  # noqa: F401
+from src.runs.models import Run, RunAggregate, RunJob, RunResult  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,32 @@
+"""add runs.source_run_id
+
+Revision ID: 0b9e6d4f2c71
+Revises: f7c3b2a6d518
+Create Date: 2026-10-17 15:51:19.842310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b9e6d4f2c71'
+down_revision: Union[str, Sequence[str], None] = 'f7c3b2a6d518'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('runs', sa.Column('source_run_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_runs_source_run_id'), 'runs', ['source_run_id'], unique=False)
+    op.create_foreign_key(None, 'runs', 'runs', ['source_run_id'], ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(op.f('runs_source_run_id_fkey'), 'runs', type_='foreignkey')
+    op.drop_index(op.f('ix_runs_source_run_id'), table_name='runs')
+    op.drop_column('runs', 'source_run_id')
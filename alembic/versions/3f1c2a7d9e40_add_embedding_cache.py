@@ -0,0 +1,36 @@
+"""add embedding_cache
+
+Revision ID: 3f1c2a7d9e40
+Revises: 9049b6c4b524
+Create Date: 2026-10-17 10:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import pgvector.sqlalchemy
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a7d9e40'
+down_revision: Union[str, Sequence[str], None] = '9049b6c4b524'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    op.create_table('embedding_cache',
+    sa.Column('model', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('text_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+    sa.Column('embedding', pgvector.sqlalchemy.Vector(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('model', 'text_hash')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('embedding_cache')
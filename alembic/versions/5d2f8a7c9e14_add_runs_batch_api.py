@@ -0,0 +1,31 @@
+"""add runs batch api columns
+
+Revision ID: 5d2f8a7c9e14
+Revises: 0b9e6d4f2c71
+Create Date: 2026-10-17 17:02:41.519204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8a7c9e14'
+down_revision: Union[str, Sequence[str], None] = '0b9e6d4f2c71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('runs', sa.Column('use_batch_api', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.add_column('runs', sa.Column('batch_job_id', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('runs', 'batch_job_id')
+    op.drop_column('runs', 'use_batch_api')
@@ -0,0 +1,55 @@
+"""add pgvector embedding columns to dataset_rows and run_results
+
+Revision ID: 8c3e5a1f7b20
+Revises: 5d2f8a7c9e14
+Create Date: 2026-10-17 21:08:33.271946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import pgvector.sqlalchemy
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3e5a1f7b20'
+down_revision: Union[str, Sequence[str], None] = '5d2f8a7c9e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('dataset_rows', sa.Column('expected_embedding', pgvector.sqlalchemy.Vector(), nullable=True))
+    op.add_column('dataset_rows', sa.Column('expected_embedding_model', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+    op.add_column('run_results', sa.Column('output_embedding', pgvector.sqlalchemy.Vector(), nullable=True))
+    op.add_column('run_results', sa.Column('output_embedding_model', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+    # HNSW는 고정 차원만 지원하므로 1536차원 벡터만 식 인덱스로 인덱싱
+    op.create_index(
+        'ix_dataset_rows_expected_embedding_hnsw',
+        'dataset_rows',
+        [sa.text('(expected_embedding::vector(1536)) vector_cosine_ops')],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_where=sa.text('vector_dims(expected_embedding) = 1536'),
+    )
+    op.create_index(
+        'ix_run_results_output_embedding_hnsw',
+        'run_results',
+        [sa.text('(output_embedding::vector(1536)) vector_cosine_ops')],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_where=sa.text('vector_dims(output_embedding) = 1536'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_run_results_output_embedding_hnsw', table_name='run_results', postgresql_using='hnsw')
+    op.drop_index('ix_dataset_rows_expected_embedding_hnsw', table_name='dataset_rows', postgresql_using='hnsw')
+    op.drop_column('run_results', 'output_embedding_model')
+    op.drop_column('run_results', 'output_embedding')
+    op.drop_column('dataset_rows', 'expected_embedding_model')
+    op.drop_column('dataset_rows', 'expected_embedding')
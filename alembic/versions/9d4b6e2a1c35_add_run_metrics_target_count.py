@@ -0,0 +1,28 @@
+"""add run_metrics.target_count
+
+Revision ID: 9d4b6e2a1c35
+Revises: 8c3e5a1f7b20
+Create Date: 2026-10-17 23:12:05.418337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4b6e2a1c35'
+down_revision: Union[str, Sequence[str], None] = '8c3e5a1f7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('run_metrics', sa.Column('target_count', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('run_metrics', 'target_count')
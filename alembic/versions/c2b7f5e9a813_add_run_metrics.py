@@ -0,0 +1,57 @@
+"""add run_metrics
+
+Revision ID: c2b7f5e9a813
+Revises: a6d8e1f04b3c
+Create Date: 2026-10-17 13:40:52.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2b7f5e9a813'
+down_revision: Union[str, Sequence[str], None] = 'a6d8e1f04b3c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('run_metrics',
+    sa.Column('run_id', sa.Integer(), nullable=False),
+    sa.Column('total_count', sa.Integer(), nullable=False),
+    sa.Column('pass_count', sa.Integer(), nullable=False),
+    sa.Column('format_pass_count', sa.Integer(), nullable=False),
+    sa.Column('semantic_pass_count', sa.Integer(), nullable=False),
+    sa.Column('semantic_score_sum', sa.Float(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['run_id'], ['runs.id'], ),
+    sa.PrimaryKeyConstraint('run_id')
+    )
+    # 기존 Run 집계 백필
+    op.execute(
+        """
+        INSERT INTO run_metrics (
+            run_id, total_count, pass_count, format_pass_count,
+            semantic_pass_count, semantic_score_sum, updated_at
+        )
+        SELECT
+            run_id,
+            count(*),
+            count(*) FILTER (WHERE status = 'PASS'),
+            count(*) FILTER (WHERE is_format_passed),
+            count(*) FILTER (WHERE status NOT IN ('FORMAT', 'SEMANTIC')),
+            coalesce(sum(semantic_score), 0),
+            now()
+        FROM run_results
+        GROUP BY run_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('run_metrics')
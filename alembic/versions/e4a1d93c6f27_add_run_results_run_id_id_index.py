@@ -0,0 +1,27 @@
+"""add run_results (run_id, id) index
+
+Revision ID: e4a1d93c6f27
+Revises: c2b7f5e9a813
+Create Date: 2026-10-17 14:22:07.604391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a1d93c6f27'
+down_revision: Union[str, Sequence[str], None] = 'c2b7f5e9a813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_run_results_run_id_id', 'run_results', ['run_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_run_results_run_id_id', table_name='run_results')
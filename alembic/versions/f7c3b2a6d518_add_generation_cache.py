@@ -0,0 +1,43 @@
+"""add generation_cache
+
+Revision ID: f7c3b2a6d518
+Revises: e4a1d93c6f27
+Create Date: 2026-10-17 15:08:33.271945
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c3b2a6d518'
+down_revision: Union[str, Sequence[str], None] = 'e4a1d93c6f27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('generation_cache',
+    sa.Column('key', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+    sa.Column('model', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('output', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_generation_cache_model'), 'generation_cache', ['model'], unique=False)
+    op.add_column('runs', sa.Column('use_generation_cache', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('run_metrics', sa.Column('generation_cache_hits', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('run_metrics', sa.Column('generation_cache_misses', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('run_metrics', 'generation_cache_misses')
+    op.drop_column('run_metrics', 'generation_cache_hits')
+    op.drop_column('runs', 'use_generation_cache')
+    op.drop_index(op.f('ix_generation_cache_model'), table_name='generation_cache')
+    op.drop_table('generation_cache')
@@ -0,0 +1,126 @@
+"""인증 캐시 벤치마크 - 요청당 identity 조회 쿼리 수와 JWT 검증 횟수 비교.
+
+DB 대신 쿼리 수를 세는 세션과 고정 지연으로 조회 왕복을 흉내 낸다.
+실행: uv run python -m scripts.bench_identity --requests 20000 --identities 200
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any
+from unittest.mock import patch
+from uuid import uuid4
+
+from fastapi import Request
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from src.auth.cache import clear_auth_caches
+from src.auth.dependencies import get_current_identity
+from src.auth.models import Guest, User
+from src.auth.service import create_access_token
+
+
+class _Result:
+    def __init__(self, value: Any):
+        self._value = value
+
+    def scalar_one_or_none(self) -> Any:
+        return self._value
+
+
+class CountingSession:
+    """execute 호출 수를 세고 조회 대상을 돌려주는 AsyncSession 대역."""
+
+    def __init__(
+        self, users: dict[int, User], guests: dict[Any, Guest], latency: float
+    ):
+        self.users = users
+        self.guests = guests
+        self.latency = latency
+        self.queries = 0
+
+    async def execute(self, statement: Any) -> _Result:
+        self.queries += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        identity_id = statement.whereclause.right.value
+        table = (
+            self.users
+            if statement.column_descriptions[0]["type"] is User
+            else self.guests
+        )
+        return _Result(table.get(identity_id))
+
+    def expunge(self, instance: Any) -> None:
+        pass
+
+
+async def run(
+    requests: int, identities: int, latency: float, cached: bool
+) -> tuple[float, int, int]:
+    users = {
+        i: User(id=i, email=f"u{i}@example.com", provider_id=f"p{i}")
+        for i in range(identities)
+    }
+    guests = {g.id: g for g in (Guest(id=uuid4()) for _ in range(identities))}
+    tokens = [
+        HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=create_access_token(i, "user")[0]
+        )
+        for i in users
+    ]
+    cookies = [f"guest_id={guest_id}".encode() for guest_id in guests]
+    session = CountingSession(users, guests, latency)
+    rng = random.Random(0)
+    clear_auth_caches()
+
+    with patch("src.auth.service.jwt.decode", wraps=jwt.decode) as decode:
+        started = time.perf_counter()
+        for i in range(requests):
+            if not cached:
+                clear_auth_caches()
+            # 절반은 User 토큰, 절반은 Guest Cookie
+            if i % 2:
+                request = Request({"type": "http", "headers": []})
+                credentials = rng.choice(tokens)
+            else:
+                request = Request(
+                    {"type": "http", "headers": [(b"cookie", rng.choice(cookies))]}
+                )
+                credentials = None
+            await get_current_identity(request, credentials, session)  # type: ignore[arg-type]
+        elapsed = time.perf_counter() - started
+    return elapsed, session.queries, decode.call_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--identities", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="조회 1회 지연 (초)")
+    args = parser.parse_args()
+
+    print(
+        f"requests={args.requests}, identities={args.identities}, latency={args.latency}"
+    )
+    baseline = None
+    for label, cached in (("no cache", False), ("cached", True)):
+        elapsed, queries, decodes = asyncio.run(
+            run(args.requests, args.identities, args.latency, cached)
+        )
+        line = (
+            f"{label:8} | {elapsed:7.3f}s | queries/request {queries / args.requests:5.3f}"
+            f" | jwt decodes/request {decodes / args.requests:5.3f}"
+        )
+        if baseline is None:
+            baseline = elapsed
+        else:
+            line += f" | x{baseline / elapsed:5.1f}"
+        print(line)
+    clear_auth_caches()
+
+
+if __name__ == "__main__":
+    main()
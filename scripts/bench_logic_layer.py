@@ -0,0 +1,71 @@
+"""Logic Layer 벤치마크 - row마다 constraint 해석 vs Run마다 한 번 컴파일한 plan.
+
+실행: uv run python -m scripts.bench_logic_layer --rows 100000 --constraints 24
+"""
+
+import argparse
+import time
+
+from src.common.types import LogicConstraint
+from src.runs.evaluator.logic_layer import FieldValue, check_logic, compile_constraints
+
+_KINDS: list[LogicConstraint] = [
+    {"type": "contains", "value": "ok"},
+    {"type": "not_contains", "value": "error"},
+    {"type": "range", "min": 0, "max": 100},
+    {"type": "regex", "pattern": r"^[a-z]+-\d+$"},
+    {"type": "max_length", "value": 64},
+]
+
+
+def build_case(
+    rows: int, constraints: int
+) -> tuple[list[LogicConstraint], list[dict[str, FieldValue]]]:
+    plan: list[LogicConstraint] = []
+    for i in range(constraints):
+        constraint = dict(_KINDS[i % len(_KINDS)])
+        constraint["target"] = f"f{i}"
+        plan.append(constraint)  # type: ignore[arg-type]
+
+    values = {
+        "contains": "ok-1",
+        "not_contains": "fine",
+        "range": 42,
+        "regex": "abc-12",
+        "max_length": "x" * 10,
+    }
+    outputs: list[dict[str, FieldValue]] = []
+    for r in range(rows):
+        output: dict[str, FieldValue] = {c["target"]: values[c["type"]] for c in plan}
+        # 10% row는 하나씩 실패
+        if r % 10 == 0 and plan:
+            output[plan[r % len(plan)]["target"]] = "error" * 20
+        outputs.append(output)
+    return plan, outputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--constraints", type=int, default=24)
+    args = parser.parse_args()
+
+    constraints, outputs = build_case(args.rows, args.constraints)
+    print(f"rows={args.rows}, constraints={args.constraints}")
+
+    started = time.perf_counter()
+    per_row = [check_logic(output, constraints).passed for output in outputs]
+    interpreted = time.perf_counter() - started
+
+    started = time.perf_counter()
+    plan = compile_constraints(constraints)
+    compiled_results = [plan.evaluate(output).passed for output in outputs]
+    compiled = time.perf_counter() - started
+
+    assert per_row == compiled_results
+    print(f"per-row interpret | {interpreted:7.3f}s")
+    print(f"compiled plan     | {compiled:7.3f}s | x{interpreted / compiled:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""프롬프트 조립 벤치마크 - key별 str.replace 방식과 CompiledTemplate 비교.
+
+실행: uv run python -m scripts.bench_prompt_template --rows 2000 --keys 200 --placeholders 50
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
+from src.common.types import JsonValue
+from src.runs.templates import CompiledTemplate
+
+
+def replace_each(user_template: str, input_data: dict[str, JsonValue]) -> str:
+    """기존 assemble_prompt 방식: input key마다 템플릿 전체 검색 + 치환."""
+    result = user_template
+    for key, value in input_data.items():
+        placeholder = f"{{{{{key}}}}}"
+        if placeholder in result:
+            result = result.replace(placeholder, str(value))
+    return result
+
+
+def build_case(
+    keys: int, placeholders: int, literal_len: int
+) -> tuple[str, dict[str, JsonValue]]:
+    literal = "가나다라마바사 lorem ipsum " * (literal_len // 24 + 1)
+    template = "".join(
+        f"{literal[:literal_len]} {{{{field_{i}}}}}\n" for i in range(placeholders)
+    )
+    row: dict[str, JsonValue] = {f"field_{i}": f"값 {i} " * 5 for i in range(keys)}
+    return template, row
+
+
+def measure(render: Callable[[], str], rows: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rows):
+        render()
+    return (time.perf_counter() - started) / rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--keys", type=int, nargs="+", default=[10, 200])
+    parser.add_argument("--placeholders", type=int, nargs="+", default=[5, 50])
+    parser.add_argument("--literal-len", type=int, default=400)
+    args = parser.parse_args()
+
+    print(f"rows={args.rows}, literal_len={args.literal_len}")
+    for keys in args.keys:
+        for placeholders in args.placeholders:
+            template, row = build_case(keys, placeholders, args.literal_len)
+            compiled = CompiledTemplate(template)
+            assert compiled.render(row) == replace_each(template, row)
+
+            before = measure(partial(replace_each, template, row), args.rows)
+            after = measure(partial(compiled.render, row), args.rows)
+            print(
+                f"keys={keys:>4} placeholders={placeholders:>3} template={len(template):>6}B | "
+                f"replace {before * 1e6:8.1f}us | compiled {after * 1e6:8.1f}us | "
+                f"x{before / after:5.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Row 동시 실행 벤치마크 - 가짜 LLM 클라이언트로 동시성별 wall-clock 비교.
+
+실행: uv run python -m scripts.bench_run_concurrency --rows 200 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+
+from src.runs.executor import execute_rows
+
+
+class FakeLLMClient:
+    """고정 지연 후 입력을 그대로 돌려주는 LLMClient 구현."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def generate(
+        self,
+        system_instruction: str,  # noqa: ARG002
+        user_message: str,
+        temperature: float = 1.0,  # noqa: ARG002
+    ) -> str:
+        await asyncio.sleep(self.latency)
+        return user_message
+
+    async def generate_stream(
+        self,
+        system_instruction: str,
+        user_message: str,
+        temperature: float = 1.0,
+    ) -> AsyncGenerator[str, None]:
+        yield await self.generate(system_instruction, user_message, temperature)
+
+    async def aclose(self) -> None:
+        pass
+
+
+async def run_once(rows: int, latency: float, concurrency: int) -> float:
+    llm = FakeLLMClient(latency)
+
+    async def handler(i: int) -> str:
+        return await llm.generate("system", f"row {i}", 0.0)
+
+    started = time.perf_counter()
+    results = await execute_rows(list(range(rows)), handler, concurrency)
+    elapsed = time.perf_counter() - started
+    assert results == [f"row {i}" for i in range(rows)]
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    args = parser.parse_args()
+
+    baseline: float | None = None
+    print(f"rows={args.rows}, latency={args.latency * 1000:.0f}ms")
+    for concurrency in args.concurrency:
+        elapsed = await run_once(args.rows, args.latency, concurrency)
+        baseline = baseline or elapsed
+        print(
+            f"concurrency={concurrency:>3} | {elapsed:7.3f}s | speedup x{baseline / elapsed:5.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
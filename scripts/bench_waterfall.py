@@ -0,0 +1,96 @@
+"""Waterfall 벤치마크 - row별 evaluate_waterfall vs columnar evaluate_waterfall_batch.
+
+embedding은 미리 캐시에 넣어 두므로 API를 호출하지 않고 평가 비용만 측정한다.
+
+실행: uv run python -m scripts.bench_waterfall --rows 10000 --dim 1536
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+
+# 모든 텍스트의 embedding이 LRU에 남도록 캐시 크기를 먼저 지정
+os.environ.setdefault("EMBEDDING_CACHE_SIZE", "1000000")
+
+from src.common.types import LogicConstraint  # noqa: E402
+from src.config import get_settings  # noqa: E402
+from src.embeddings.cache import get_embedding_cache  # noqa: E402
+from src.prompts.models import OutputSchemaType  # noqa: E402
+from src.runs.evaluator.logic_layer import compile_constraints  # noqa: E402
+from src.runs.evaluator.waterfall import (  # noqa: E402
+    evaluate_waterfall,
+    evaluate_waterfall_batch,
+)
+
+_CONSTRAINTS: list[LogicConstraint] = [
+    {"type": "contains", "target": "verdict", "value": "TRUE"},
+    {"type": "range", "target": "confidence", "min": 0, "max": 1},
+    {"type": "max_length", "target": "reason", "value": 200},
+]
+
+
+def build_case(rows: int, dim: int) -> tuple[list[str], list[str]]:
+    """10% Format 실패, 나머지는 embedding 방향에 따라 Semantic 통과/실패가 섞이도록 구성"""
+    rng = random.Random(0)
+    model = get_settings().EMBEDDING_MODEL
+    cache = get_embedding_cache()
+
+    anchor = [rng.gauss(0, 1) for _ in range(dim)]
+    expected_outputs: list[str] = []
+    raw_outputs: list[str] = []
+    for i in range(rows):
+        expected = json.dumps({"verdict": "TRUE", "case": i % 50})
+        raw = json.dumps(
+            {
+                "verdict": "TRUE" if i % 7 else "FALSE",
+                "confidence": rng.random(),
+                "reason": f"row {i}",
+            }
+        )
+        if i % 10 == 0:
+            raw = raw[:-5]
+        noise = rng.uniform(0.1, 2.0)
+        cache.put(model, expected, anchor)
+        cache.put(model, raw, [a + rng.gauss(0, noise) for a in anchor])
+        expected_outputs.append(expected)
+        raw_outputs.append(raw)
+    return raw_outputs, expected_outputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--threshold", type=float, default=0.7)
+    args = parser.parse_args()
+
+    raw_outputs, expected_outputs = build_case(args.rows, args.dim)
+    schema = OutputSchemaType.JSON_OBJECT
+    plan = compile_constraints(_CONSTRAINTS)
+    print(f"rows={args.rows}, dim={args.dim}, threshold={args.threshold}")
+
+    started = time.perf_counter()
+    per_row = [
+        evaluate_waterfall(raw, schema, expected, args.threshold, plan)
+        for raw, expected in zip(raw_outputs, expected_outputs, strict=True)
+    ]
+    per_row_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = evaluate_waterfall_batch(
+        raw_outputs, expected_outputs, schema, args.threshold, plan
+    )
+    batch_elapsed = time.perf_counter() - started
+
+    assert [r.status for r in per_row] == batch.statuses
+    print(f"statuses          | {dict(batch.status_counts())}")
+    print(f"per-row waterfall | {per_row_elapsed:7.3f}s")
+    print(
+        f"columnar batch    | {batch_elapsed:7.3f}s | x{per_row_elapsed / batch_elapsed:5.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""인증 캐시 - JWT 검증 결과와 조회한 Guest/User를 프로세스 메모리에 보관.
+
+모든 인증 요청이 JWT 서명 검증과 users/guests 조회를 반복하지 않도록 한다.
+- TokenCache: 검증에 성공한 토큰의 payload를 토큰 만료 시각까지 보관
+- IdentityCache: ("user", id) / ("guest", uuid) → 조회한 identity를 AUTH_IDENTITY_CACHE_TTL초 보관
+
+User/Guest를 삭제하는 경로는 아직 없으므로 캐시된 identity의 최대 지연은 TTL이다.
+삭제 경로를 추가하면 commit 이후에 IdentityCache.invalidate()를 호출해야 하며,
+다른 프로세스의 캐시에는 여전히 TTL이 지나야 반영된다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+from uuid import UUID
+
+from src.auth.models import Guest, User
+from src.auth.schemas import TokenPayload
+from src.config import get_settings
+
+type IdentityKey = tuple[str, int | UUID]
+
+
+class TokenCache:
+    """검증된 JWT payload LRU - 토큰 만료 시각이 지나면 조회되지 않음."""
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.time):
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[str, TokenPayload] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> TokenPayload | None:
+        with self._lock:
+            payload = self._entries.get(token)
+            if payload is None:
+                return None
+            if payload.exp.timestamp() <= self._clock():
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return payload
+
+    def put(self, token: str, payload: TokenPayload) -> None:
+        with self._lock:
+            self._entries[token] = payload
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class IdentityCache:
+    """조회한 Guest/User의 TTL LRU (세션에서 분리된 인스턴스를 공유하므로 id만 읽을 것)."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[IdentityKey, tuple[float, Guest | User]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: IdentityKey) -> Guest | User | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, identity = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return identity
+
+    def put(self, key: IdentityKey, identity: Guest | User) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, identity)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: IdentityKey) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def user_key(user_id: int) -> IdentityKey:
+    return ("user", user_id)
+
+
+def guest_key(guest_id: UUID) -> IdentityKey:
+    return ("guest", guest_id)
+
+
+@lru_cache
+def get_token_cache() -> TokenCache:
+    return TokenCache(get_settings().AUTH_TOKEN_CACHE_SIZE)
+
+
+@lru_cache
+def get_identity_cache() -> IdentityCache:
+    settings = get_settings()
+    return IdentityCache(
+        settings.AUTH_IDENTITY_CACHE_SIZE, settings.AUTH_IDENTITY_CACHE_TTL
+    )
+
+
+def clear_auth_caches() -> None:
+    """토큰·identity 캐시 전체 삭제 (테스트, 키 교체 시)."""
+    get_token_cache().clear()
+    get_identity_cache().clear()
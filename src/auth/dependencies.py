@@ -6,13 +6,40 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col, select
 
 from src.auth import service
+from src.auth.cache import IdentityKey, get_identity_cache, guest_key, user_key
 from src.auth.models import Guest, User
+from src.common import metrics
 from src.common.exceptions import UnauthorizedError
 from src.database import get_session
 
 security = HTTPBearer(auto_error=False)
 
 
+async def _load_identity[T: (Guest, User)](
+    session: AsyncSession,
+    key: IdentityKey,
+    model: type[T],
+    identity_id: int | UUID,
+) -> T | None:
+    """캐시에 있으면 그대로, 없으면 조회해 캐시 (없는 identity는 캐시하지 않음).
+
+    캐시한 인스턴스는 여러 요청이 공유하므로 세션에서 분리해 둔다.
+    """
+    cache = get_identity_cache()
+    cached = cache.get(key)
+    if isinstance(cached, model):
+        metrics.CACHE_REQUESTS.labels("identity", "hit").inc()
+        return cached
+    metrics.CACHE_REQUESTS.labels("identity", "miss").inc()
+
+    result = await session.execute(select(model).where(col(model.id) == identity_id))
+    identity = result.scalar_one_or_none()
+    if identity is not None:
+        session.expunge(identity)
+        cache.put(key, identity)
+    return identity
+
+
 async def get_current_identity(
     request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
@@ -24,6 +51,9 @@ async def get_current_identity(
     1. Bearer Token → User 인증
     2. Cookie (guest_id) → Guest 인증
 
+    검증한 토큰과 조회한 Guest/User는 src.auth.cache에 캐시되어
+    대부분의 요청은 DB 조회 없이 인증된다.
+
     Raises:
         UnauthorizedError: 인증 정보 없음, 유효하지 않음, 또는 사용자 없음
     """
@@ -34,9 +64,7 @@ async def get_current_identity(
 
         if token_data.type == "user":
             user_id = int(token_data.sub)
-            user_stmt = select(User).where(col(User.id) == user_id)
-            user_result = await session.execute(user_stmt)
-            user = user_result.scalar_one_or_none()
+            user = await _load_identity(session, user_key(user_id), User, user_id)
             if user:
                 return user
             raise UnauthorizedError("User not found")
@@ -47,9 +75,9 @@ async def get_current_identity(
     if guest_id_cookie:
         try:
             guest_uuid = UUID(guest_id_cookie)
-            guest_stmt = select(Guest).where(col(Guest.id) == guest_uuid)
-            guest_result = await session.execute(guest_stmt)
-            guest = guest_result.scalar_one_or_none()
+            guest = await _load_identity(
+                session, guest_key(guest_uuid), Guest, guest_uuid
+            )
             if guest:
                 return guest
         except ValueError:
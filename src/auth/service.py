@@ -3,7 +3,9 @@ from uuid import UUID
 
 from jose import JWTError, jwt
 
+from src.auth.cache import get_token_cache
 from src.auth.schemas import TokenPayload
+from src.common import metrics
 from src.config import get_settings
 
 settings = get_settings()
@@ -40,19 +42,29 @@ def create_access_token(
 def decode_token(token: str) -> TokenPayload | None:
     """JWT 토큰 디코드.
 
+    검증에 성공한 토큰은 만료 시각까지 캐시해 서명 검증을 반복하지 않는다
+    (실패한 토큰은 캐시하지 않음).
+
     Args:
         token: JWT 문자열
 
     Returns:
         TokenPayload 또는 실패 시 None
     """
+    cache = get_token_cache()
+    cached = cache.get(token)
+    if cached is not None:
+        metrics.CACHE_REQUESTS.labels("token", "hit").inc()
+        return cached
+    metrics.CACHE_REQUESTS.labels("token", "miss").inc()
+
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.JWT_ALGORITHM],
         )
-        return TokenPayload(
+        token_data = TokenPayload(
             sub=payload["sub"],
             type=payload["type"],
             iat=datetime.fromtimestamp(payload["iat"], tz=UTC),
@@ -60,3 +72,5 @@ def decode_token(token: str) -> TokenPayload | None:
         )
     except JWTError:
         return None
+    cache.put(token, token_data)
+    return token_data
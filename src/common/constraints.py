@@ -0,0 +1,72 @@
+"""Logic Layer constraint 값 해석과 저장 전 검증.
+
+프로필 스키마(저장 시 거부)와 Logic Layer(컴파일 시 해석)가 같은 규칙을 쓰도록 공유한다.
+"""
+
+import re
+from collections.abc import Sequence
+
+from src.common.types import ConstraintType, LogicConstraint
+
+
+def parse_range_bound(value: object) -> float | None:
+    """range min/max 값을 숫자로 (없으면 None).
+
+    Raises:
+        ValueError: 숫자로 해석할 수 없는 값
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int | float | str):
+        raise ValueError(f"숫자가 아닌 값: {value!r}")
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"숫자가 아닌 값: {value!r}") from None
+
+
+def parse_max_length(value: object) -> int:
+    """max_length value를 0 이상의 정수로 (없으면 0).
+
+    Raises:
+        ValueError: 정수가 아니거나 음수인 값
+    """
+    if value is None or value == "":
+        return 0
+    if isinstance(value, bool):
+        raise ValueError(f"정수가 아닌 값: {value!r}")
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, str):
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValueError(f"정수가 아닌 값: {value!r}") from None
+    if not isinstance(value, int):
+        raise ValueError(f"정수가 아닌 값: {value!r}")
+    if value < 0:
+        raise ValueError(f"음수 길이: {value}")
+    return value
+
+
+def validate_constraints(constraints: Sequence[LogicConstraint]) -> list[str]:
+    """저장 전 검증 - 컴파일할 수 없는 constraint의 오류 메시지 목록."""
+    errors: list[str] = []
+    for index, constraint in enumerate(constraints):
+        constraint_type = constraint.get("type", "")
+        try:
+            if constraint_type == ConstraintType.REGEX:
+                try:
+                    re.compile(constraint.get("pattern") or "")
+                except re.error as e:
+                    raise ValueError(f"잘못된 정규식 패턴: {e}") from None
+            elif constraint_type == ConstraintType.RANGE:
+                lower = parse_range_bound(constraint.get("min"))
+                upper = parse_range_bound(constraint.get("max"))
+                if lower is not None and upper is not None and lower > upper:
+                    raise ValueError(f"min({lower})이 max({upper})보다 큼")
+            elif constraint_type == ConstraintType.MAX_LENGTH:
+                parse_max_length(constraint.get("value"))
+        except ValueError as e:
+            errors.append(f"constraints[{index}]: {e}")
+    return errors
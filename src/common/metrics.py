@@ -0,0 +1,91 @@
+"""프로세스 내 운영 지표 (prometheus_client 기본 registry).
+
+값은 프로세스 메모리에만 있으므로 API 프로세스는 GET /metrics로, 워커 프로세스는
+WORKER_METRICS_PORT로 각각 노출하고 Prometheus가 프로세스별로 수집한다.
+비율(캐시 적중률, 초당 row 수)은 카운터로 기록하고 PromQL rate()로 계산한다.
+자주 기록하는 곳에서는 labels()로 받은 child를 미리 보관해 두고 사용한다.
+"""
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# 외부 API 요청 지연 버킷 (초) - embedding 배치부터 긴 LLM 생성까지
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# 연결 풀 checkout 대기 버킷 (초) - 대부분 즉시, 포화 시 DB_POOL_TIMEOUT까지
+POOL_WAIT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+def render() -> bytes:
+    """등록된 모든 지표를 Prometheus 텍스트 형식으로."""
+    return generate_latest(REGISTRY)
+
+
+ROWS_PROCESSED = Counter(
+    "prs_run_rows_processed_total",
+    "Run에서 평가·저장한 row 수 (rate()로 초당 처리량)",
+    ("kind", "status"),
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "prs_llm_request_duration_seconds",
+    "LLM provider 요청 한 번의 소요 시간 (속도 제한 대기 제외, 성공한 시도만)",
+    ("model",),
+    buckets=LATENCY_BUCKETS,
+)
+LLM_IN_FLIGHT = Gauge(
+    "prs_llm_in_flight_requests", "진행 중인 LLM provider 요청 수", ("model",)
+)
+LLM_RETRIES = Counter(
+    "prs_llm_retries_total",
+    "LLM 요청 재시도 수 (reason=rate_limited는 429)",
+    ("model", "reason"),
+)
+LLM_RATE_LIMITED = Counter(
+    "prs_llm_rate_limited_total", "LLM provider 429 응답 수", ("model",)
+)
+EMBEDDING_REQUEST_SECONDS = Histogram(
+    "prs_embedding_request_duration_seconds",
+    "Embedding API 요청 한 번의 소요 시간",
+    ("model",),
+    buckets=LATENCY_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "prs_cache_requests_total",
+    "캐시 조회 수 (cache=generation|embedding|token|identity, result=hit|miss)",
+    ("cache", "result"),
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "prs_db_pool_checkout_duration_seconds",
+    "연결 checkout 소요 시간 (풀 대기 + 새 연결 + pre-ping)",
+    ("pool",),
+    buckets=POOL_WAIT_BUCKETS,
+)
+DB_POOL_TIMEOUTS = Counter(
+    "prs_db_pool_timeouts_total",
+    "DB_POOL_TIMEOUT 안에 연결을 얻지 못한 checkout 수",
+    ("pool",),
+)
+RUN_QUEUE_DEPTH = Gauge("prs_run_queue_depth", "워커를 기다리는 Run 작업 수 (queued)")
+WORKER_ACTIVE_RUNS = Gauge("prs_worker_active_runs", "이 워커가 처리 중인 Run 수")
@@ -0,0 +1,87 @@
+"""row 단위 실행 trace - 단계별 소요 시간, 횟수, provider 토큰 사용량.
+
+현재 row의 Trace를 contextvar로 전달하므로 LLM 클라이언트 같은 하위 계층이
+인자 변경 없이 기록할 수 있다. 활성 trace가 없으면 기록 함수는 아무것도 하지 않는다.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_current: ContextVar["Trace | None"] = ContextVar("trace", default=None)
+
+
+class Trace:
+    """row 하나의 단계별 소요 시간(초, 누적)과 횟수·토큰 수."""
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self.tokens: dict[str, int] = {}
+
+    def add_timing(self, stage: str, seconds: float) -> None:
+        self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+    def to_dict(self) -> dict[str, Any]:
+        """RunResult.trace 저장 형식 (시간은 ms)."""
+        return {
+            "timings_ms": {
+                stage: round(seconds * 1000, 3)
+                for stage, seconds in self.timings.items()
+            },
+            "counts": self.counts,
+            "tokens": self.tokens,
+        }
+
+
+@contextmanager
+def start_trace() -> Iterator[Trace]:
+    """새 Trace를 현재 컨텍스트의 활성 trace로 지정."""
+    trace = Trace()
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+
+
+def current_trace() -> Trace | None:
+    return _current.get()
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """블록 실행 시간을 활성 trace의 stage에 누적."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace = _current.get()
+        if trace is not None:
+            trace.add_timing(stage, time.perf_counter() - started)
+
+
+def add_timing(stage: str, seconds: float) -> None:
+    trace = _current.get()
+    if trace is not None:
+        trace.add_timing(stage, seconds)
+
+
+def increment(name: str, amount: int = 1) -> None:
+    trace = _current.get()
+    if trace is not None:
+        trace.increment(name, amount)
+
+
+def record_tokens(**counts: int | None) -> None:
+    """provider가 보고한 토큰 사용량 기록 (None은 무시, 재시도 시 마지막 응답 기준)."""
+    trace = _current.get()
+    if trace is not None:
+        trace.tokens.update(
+            {name: count for name, count in counts.items() if count is not None}
+        )
@@ -1,16 +1,139 @@
-from collections.abc import AsyncGenerator
+"""DB 엔진과 세션.
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+API 프로세스와 Run 워커 프로세스는 같은 async_session을 쓰지만 연결 풀 크기는 따로 정한다.
+기본은 API 풀(DB_POOL_SIZE)이고, 워커는 시작할 때 use_pool("worker")로
+WORKER_DB_POOL_SIZE 풀로 바꾼다. 백그라운드 Run이 API 요청의 연결을 빼앗지 않는다.
+
+DB_PGBOUNCER=True면 PgBouncer(transaction pooling) 뒤에서 동작하도록 prepared statement
+캐시를 끄고 문장 이름을 매번 새로 만들며, 풀링은 PgBouncer에 맡긴다(NullPool).
+"""
+
+from collections.abc import AsyncGenerator, Iterator
+from functools import cache
+from time import perf_counter
+from typing import Any, ClassVar, Literal
+from uuid import uuid4
+
+from prometheus_client import REGISTRY, Metric
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
 from sqlmodel import SQLModel
 
-from src.config import get_settings
+from src.common import metrics
+from src.config import Settings, get_settings
+
+type PoolRole = Literal["api", "worker"]
 
 settings = get_settings()
 
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+
+class _TimedCheckout(Pool):
+    """checkout 소요 시간과 timeout을 role label로 기록하는 풀 mixin."""
+
+    role: ClassVar[str] = "api"
+
+    def connect(self) -> Any:
+        started = perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            metrics.DB_POOL_TIMEOUTS.labels(self.role).inc()
+            raise
+        finally:
+            metrics.DB_POOL_CHECKOUT_SECONDS.labels(self.role).observe(
+                perf_counter() - started
+            )
+
+
+@cache
+def _pool_class(base: type[Pool], role: PoolRole) -> type[Pool]:
+    # 풀 재생성(recreate)은 self.__class__를 쓰므로 role은 생성자 인자가 아닌 클래스 속성으로 둠
+    return type(
+        f"{role.title()}{base.__name__}", (_TimedCheckout, base), {"role": role}
+    )
+
+
+def create_engine(
+    role: PoolRole = "api", config: Settings | None = None
+) -> AsyncEngine:
+    """role별 풀 크기와 공통 풀/드라이버 설정으로 AsyncEngine 생성."""
+    config = config or get_settings()
+    connect_args: dict[str, Any] = {
+        "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+    }
+    pool_args: dict[str, Any]
+    if config.DB_PGBOUNCER:
+        # transaction pooling에서는 서버 연결이 트랜잭션마다 바뀌므로
+        # 연결에 묶인 prepared statement를 재사용하거나 이름이 겹치면 안 됨
+        connect_args = {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+        pool_args = {"poolclass": _pool_class(NullPool, role)}
+    else:
+        pool_size, max_overflow = (
+            (config.WORKER_DB_POOL_SIZE, config.WORKER_DB_MAX_OVERFLOW)
+            if role == "worker"
+            else (config.DB_POOL_SIZE, config.DB_MAX_OVERFLOW)
+        )
+        pool_args = {
+            "poolclass": _pool_class(AsyncAdaptedQueuePool, role),
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": config.DB_POOL_TIMEOUT,
+            "pool_recycle": config.DB_POOL_RECYCLE,
+        }
+    return create_async_engine(
+        config.DATABASE_URL,
+        echo=config.DEBUG,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+        **pool_args,
+    )
+
+
+engine = create_engine("api")
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+async def use_pool(role: PoolRole) -> None:
+    """이 프로세스의 async_session을 role 풀로 전환 (연결을 쓰기 전, 진입점에서 호출)."""
+    global engine
+    previous, engine = engine, create_engine(role)
+    async_session.configure(bind=engine)
+    await previous.dispose()
+
+
+class _PoolCollector(Collector):
+    """수집 시점의 연결 풀 상태 (overflow는 pool_size를 넘겨 연 연결 수)."""
+
+    def collect(self) -> Iterator[Metric]:
+        family = GaugeMetricFamily(
+            "prs_db_pool_connections",
+            "SQLAlchemy 연결 풀 상태 (pool=api|worker, state=size|checked_out|overflow)",
+            labels=("pool", "state"),
+        )
+        pool = engine.pool
+        if isinstance(pool, QueuePool):
+            role = pool.role if isinstance(pool, _TimedCheckout) else "api"
+            family.add_metric((role, "size"), pool.size())
+            family.add_metric((role, "checked_out"), pool.checkedout())
+            family.add_metric((role, "overflow"), max(pool.overflow(), 0))
+        yield family
+
+
+REGISTRY.register(_PoolCollector())
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
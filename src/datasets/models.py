@@ -2,10 +2,14 @@ from datetime import UTC, datetime
 from typing import Any, ClassVar
 from uuid import UUID
 
+from pgvector.sqlalchemy import Vector
 from sqlalchemy import Column, DateTime
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
 from sqlmodel import Field, SQLModel
 
+from src.embeddings.models import cosine_index
+
 
 class Dataset(SQLModel, table=True):
     """데이터셋 마스터 - 실험의 '시험 문제' 폴더."""
@@ -23,10 +27,20 @@ class Dataset(SQLModel, table=True):
     )
 
 
+_expected_embedding = Column("expected_embedding", Vector(), nullable=True)
+
+
 class DatasetRow(SQLModel, table=True):
     """데이터셋 행 - 개별 채점 기준을 가진 질문."""
 
     __tablename__: ClassVar[str] = "dataset_rows"
+    __table_args__ = (
+        cosine_index("ix_dataset_rows_expected_embedding_hnsw", _expected_embedding),
+    )
+    # 벡터는 SQL(<=>)에서만 사용하므로 row 조회 시 기본으로 읽지 않음
+    __mapper_args__ = {
+        "properties": {"expected_embedding": deferred(_expected_embedding)}
+    }
 
     id: int | None = Field(default=None, primary_key=True)
     dataset_id: int = Field(foreign_key="datasets.id", index=True)
@@ -34,6 +48,11 @@ class DatasetRow(SQLModel, table=True):
     input_data: dict[str, Any] = Field(sa_column=Column(JSONB))
     expected_output: str
     tags: list[str] | None = Field(default=None, sa_column=Column(JSONB))
+    # expected_output의 embedding (expected_embedding_model로 계산, Run 실행 시 저장)
+    expected_embedding: list[float] | None = Field(
+        default=None, sa_column=_expected_embedding
+    )
+    expected_embedding_model: str | None = None
     updated_at: datetime | None = Field(
         default=None, sa_column=Column(DateTime(timezone=True))
     )
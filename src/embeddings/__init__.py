@@ -0,0 +1,12 @@
+from src.embeddings.base import EmbeddingClient
+from src.embeddings.cache import EmbeddingCache, get_embedding_cache, text_hash
+from src.embeddings.factory import close_embedding_clients, get_embedding_client
+
+__all__ = [
+    "EmbeddingCache",
+    "EmbeddingClient",
+    "close_embedding_clients",
+    "get_embedding_cache",
+    "get_embedding_client",
+    "text_hash",
+]
@@ -0,0 +1,16 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+
+class EmbeddingClient(Protocol):
+    """Embedding 클라이언트 공통 인터페이스."""
+
+    model: str
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """텍스트 목록을 한 번의 요청으로 벡터 변환 (입력 순서 유지)."""
+        ...
+
+    async def aclose(self) -> None:
+        """HTTP 연결 풀 정리."""
+        ...
@@ -0,0 +1,199 @@
+"""Embedding 2단 캐시 - 프로세스 내 LRU + pgvector 영구 저장소.
+
+LRU 조회/저장은 동기식이라 Semantic Layer에서 바로 사용할 수 있고,
+DB 계층은 Run 배치마다 warm()으로 미리 적재, persist()로 기록한다.
+
+캐시는 프로세스에서 공유하지만 persist()는 해당 배치의 텍스트만 기록하고,
+그 트랜잭션이 rollback되면 기록하려던 embedding을 다시 대기시킨다.
+
+embedding은 float32 ndarray로 보관한다 (1536차원 기준 항목당 약 6KB, list[float]의 약 1/8).
+조회·저장 인터페이스는 list[float]이며 변환은 캐시 경계에서만 한다.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from functools import lru_cache
+
+import numpy as np
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlmodel import col, select
+
+from src.config import get_settings
+from src.embeddings.models import EmbeddingCacheEntry
+
+logger = logging.getLogger(__name__)
+
+type CacheKey = tuple[str, str]
+type Vector = np.ndarray
+
+_PERSIST_CHUNK_SIZE = 1000
+
+# 세션에서 기록했지만 아직 commit되지 않은 embedding - Session.info[키][cache][key]
+_UNCOMMITTED_KEY = "embedding_cache_uncommitted"
+
+
+def text_hash(text: str) -> str:
+    """텍스트의 sha256 hex digest."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """(모델, sha256(text)) 키 기반 embedding 캐시."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[CacheKey, Vector] = OrderedDict()
+        self._pending: dict[CacheKey, Vector] = {}
+        # Semantic Layer가 워커 스레드에서 호출될 수 있으므로 잠금 필요
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, model: str, text: str) -> list[float] | None:
+        """LRU에서 조회 (없으면 None)."""
+        key = (model, text_hash(text))
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                return None
+            self._entries.move_to_end(key)
+        values: list[float] = embedding.tolist()
+        return values
+
+    def put(self, model: str, text: str, embedding: list[float]) -> None:
+        """새로 계산된 embedding 저장 (다음 persist() 때 DB에 기록)."""
+        key = (model, text_hash(text))
+        vector = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            self._set(key, vector)
+            self._pending[key] = vector
+
+    def _set(self, key: CacheKey, embedding: Vector) -> None:
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def warm(
+        self, session: AsyncSession, model: str, texts: Iterable[str]
+    ) -> int:
+        """LRU에 없는 텍스트의 embedding을 DB에서 읽어 LRU에 적재.
+
+        Returns:
+            DB에서 적재한 embedding 개수
+        """
+        with self._lock:
+            hashes = {
+                h
+                for h in (text_hash(t) for t in texts)
+                if (model, h) not in self._entries
+            }
+        if not hashes:
+            return 0
+
+        rows = (
+            await session.execute(
+                select(
+                    EmbeddingCacheEntry.text_hash, EmbeddingCacheEntry.embedding
+                ).where(
+                    col(EmbeddingCacheEntry.model) == model,
+                    col(EmbeddingCacheEntry.text_hash).in_(hashes),
+                )
+            )
+        ).all()
+
+        with self._lock:
+            for row in rows:
+                self._set(
+                    (model, row.text_hash), np.asarray(row.embedding, dtype=np.float32)
+                )
+
+        logger.debug(
+            "Embedding 캐시 적재 | model=%s, requested=%d, loaded=%d",
+            model,
+            len(hashes),
+            len(rows),
+        )
+        return len(rows)
+
+    async def persist(
+        self, session: AsyncSession, model: str, texts: Iterable[str]
+    ) -> int:
+        """texts 중 아직 DB에 기록되지 않은 embedding 저장 (commit은 호출자 책임).
+
+        다른 텍스트의 대기 embedding은 그 embedding을 계산한 Run이 자신의 트랜잭션에서
+        기록하도록 남겨 둔다.
+
+        Returns:
+            기록 시도한 embedding 개수
+        """
+        hashes = {text_hash(text) for text in texts}
+        with self._lock:
+            pending = {
+                key: embedding
+                for key in ((model, h) for h in hashes)
+                if (embedding := self._pending.pop(key, None)) is not None
+            }
+        if not pending:
+            return 0
+        self._track_uncommitted(session.sync_session, pending)
+
+        now = datetime.now(UTC)
+        values = [
+            {"model": model, "text_hash": h, "embedding": embedding, "created_at": now}
+            for (model, h), embedding in pending.items()
+        ]
+        # asyncpg 바인드 파라미터 한도(32767)를 넘지 않도록 나눠서 INSERT
+        for start in range(0, len(values), _PERSIST_CHUNK_SIZE):
+            stmt = (
+                insert(EmbeddingCacheEntry)
+                .values(values[start : start + _PERSIST_CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=["model", "text_hash"])
+            )
+            await session.execute(stmt)
+        logger.debug("Embedding 캐시 기록 | count=%d", len(pending))
+        return len(pending)
+
+    def _track_uncommitted(
+        self, session: Session, pending: dict[CacheKey, Vector]
+    ) -> None:
+        """commit되면 잊고, rollback되면 다시 대기시키도록 세션에 기록."""
+        by_cache = session.info.get(_UNCOMMITTED_KEY)
+        if by_cache is None:
+            by_cache = session.info[_UNCOMMITTED_KEY] = {}
+            event.listen(session, "after_commit", _forget_uncommitted)
+            event.listen(session, "after_rollback", _restore_uncommitted)
+        by_cache.setdefault(self, {}).update(pending)
+
+    def _rebuffer(self, entries: dict[CacheKey, Vector]) -> None:
+        with self._lock:
+            for key, embedding in entries.items():
+                self._pending.setdefault(key, embedding)
+        logger.debug("Embedding 캐시 기록 취소, 재대기 | count=%d", len(entries))
+
+
+def _forget_uncommitted(session: Session) -> None:
+    session.info[_UNCOMMITTED_KEY].clear()
+
+
+def _restore_uncommitted(session: Session) -> None:
+    by_cache: dict[EmbeddingCache, dict[CacheKey, Vector]] = session.info[
+        _UNCOMMITTED_KEY
+    ]
+    for cache, entries in by_cache.items():
+        cache._rebuffer(entries)
+    by_cache.clear()
+
+
+@lru_cache
+def get_embedding_cache() -> EmbeddingCache:
+    """프로세스 전역 EmbeddingCache 반환."""
+    return EmbeddingCache(max_size=get_settings().EMBEDDING_CACHE_SIZE)
@@ -0,0 +1,27 @@
+from src.embeddings.base import EmbeddingClient
+from src.embeddings.openai import OpenAIEmbeddingClient
+
+_clients: dict[str, EmbeddingClient] = {}
+
+
+def get_embedding_client(model: str) -> EmbeddingClient:
+    """모델명에 따라 프로세스 전역 Embedding 클라이언트 반환 (연결 풀 재사용)."""
+    client = _clients.get(model)
+    if client is not None:
+        return client
+
+    if model.startswith("text-embedding"):
+        client = OpenAIEmbeddingClient(model=model)
+    else:
+        raise ValueError(f"지원하지 않는 embedding 모델: {model}")
+
+    _clients[model] = client
+    return client
+
+
+async def close_embedding_clients() -> None:
+    """생성된 모든 Embedding 클라이언트의 연결 풀 정리 (앱 종료 시)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,47 @@
+from datetime import UTC, datetime
+from typing import Any, ClassVar
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, ColumnElement, DateTime, Index, cast, func, text
+from sqlmodel import Field, SQLModel
+
+# HNSW 인덱스는 고정 차원만 지원하므로 이 차원(text-embedding-3-small)의 벡터만 인덱싱
+EMBEDDING_INDEX_DIMENSIONS = 1536
+
+
+def cosine_index(name: str, column: Column[Any]) -> Index:
+    """차원이 EMBEDDING_INDEX_DIMENSIONS인 벡터만 대상으로 하는 HNSW 코사인 인덱스."""
+    # 식 인덱스에는 postgresql_ops가 적용되지 않으므로 operator class까지 text로 지정
+    return Index(
+        name,
+        text(
+            f"({column.name}::vector({EMBEDDING_INDEX_DIMENSIONS})) vector_cosine_ops"
+        ),
+        postgresql_using="hnsw",
+        postgresql_where=func.vector_dims(column) == EMBEDDING_INDEX_DIMENSIONS,
+    )
+
+
+def cosine_distance(
+    column: Any, other: Any, dimensions: int | None = None
+) -> ColumnElement[float]:
+    """column <=> other - dimensions가 인덱스 차원이면 cosine_index와 같은 식으로 비교해
+    인덱스를 사용한다 (column은 해당 차원 벡터로 먼저 걸러야 함)."""
+    if dimensions == EMBEDDING_INDEX_DIMENSIONS:
+        column = cast(column, Vector(EMBEDDING_INDEX_DIMENSIONS))
+    distance: ColumnElement[float] = column.cosine_distance(other)
+    return distance
+
+
+class EmbeddingCacheEntry(SQLModel, table=True):
+    """Embedding 영구 캐시 - (모델, 텍스트 sha256) 기준 content-addressed 저장소."""
+
+    __tablename__: ClassVar[str] = "embedding_cache"
+
+    model: str = Field(primary_key=True)
+    text_hash: str = Field(primary_key=True, max_length=64)
+    embedding: list[float] = Field(sa_column=Column(Vector(), nullable=False))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(DateTime(timezone=True)),
+    )
@@ -0,0 +1,39 @@
+from collections.abc import Sequence
+
+import httpx
+from openai import AsyncOpenAI
+
+from src.config import get_settings
+
+
+class OpenAIEmbeddingClient:
+    """OpenAI Embedding 비동기 클라이언트 (HTTP 연결 풀 공유)."""
+
+    def __init__(self, model: str = "text-embedding-3-small"):
+        settings = get_settings()
+        self.http_client: httpx.AsyncClient = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.EMBEDDING_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.EMBEDDING_MAX_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+        # api_key가 None이면 OPENAI_API_KEY 환경변수 사용
+        self.client: AsyncOpenAI = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=self.http_client,
+        )
+        self.model: str = model
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        response = await self.client.embeddings.create(
+            model=self.model,
+            input=list(texts),
+        )
+        embeddings: list[list[float]] = [[] for _ in texts]
+        for item in response.data:
+            embeddings[item.index] = item.embedding
+        return embeddings
+
+    async def aclose(self) -> None:
+        await self.client.close()
@@ -1,4 +1,25 @@
-from src.llm.base import LLMClient
-from src.llm.factory import get_llm_client
+from src.llm.base import (
+    BatchJobState,
+    BatchLLMClient,
+    BatchRequest,
+    GenerationCache,
+    LLMClient,
+)
+from src.llm.batch import wait_for_batch
+from src.llm.cache import CachedLLMClient, generation_key, get_generation_cache
+from src.llm.factory import close_llm_clients, get_batch_llm_client, get_llm_client
 
-__all__ = ["LLMClient", "get_llm_client"]
+__all__ = [
+    "BatchJobState",
+    "BatchLLMClient",
+    "BatchRequest",
+    "CachedLLMClient",
+    "GenerationCache",
+    "LLMClient",
+    "close_llm_clients",
+    "generation_key",
+    "get_batch_llm_client",
+    "get_generation_cache",
+    "get_llm_client",
+    "wait_for_batch",
+]
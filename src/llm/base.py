@@ -1,4 +1,9 @@
-from typing import Protocol
+from collections.abc import AsyncGenerator, Iterable, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Protocol, runtime_checkable
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class LLMClient(Protocol):
@@ -12,3 +17,75 @@ class LLMClient(Protocol):
     ) -> str:
         """LLM 호출 후 응답 텍스트 반환."""
         ...
+
+    def generate_stream(
+        self,
+        system_instruction: str,
+        user_message: str,
+        temperature: float = 1.0,
+    ) -> AsyncGenerator[str, None]:
+        """응답 텍스트를 생성되는 대로 조각 단위로 반환.
+
+        소비 도중 iterator를 닫으면 생성도 중단된다.
+        """
+        ...
+
+    async def aclose(self) -> None:
+        """연결 풀 정리."""
+        ...
+
+
+@dataclass(frozen=True)
+class BatchRequest:
+    """배치 작업의 요청 하나 - key로 결과를 다시 찾는다."""
+
+    key: str
+    system_instruction: str
+    user_message: str
+    temperature: float = 1.0
+
+
+class BatchJobState(StrEnum):
+    """provider 배치 작업 상태."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@runtime_checkable
+class BatchLLMClient(Protocol):
+    """provider 배치 API를 지원하는 LLM 클라이언트 인터페이스."""
+
+    async def submit_batch(self, requests: Sequence[BatchRequest]) -> str:
+        """요청 전체를 하나의 배치 작업으로 제출하고 작업 ID 반환."""
+        ...
+
+    async def get_batch_state(self, job_id: str) -> BatchJobState:
+        """배치 작업 상태 조회."""
+        ...
+
+    async def get_batch_results(self, job_id: str) -> dict[str, str]:
+        """완료된 배치 작업의 결과 반환 (BatchRequest.key → 응답, 실패한 요청은 제외)."""
+        ...
+
+
+class GenerationCache(Protocol):
+    """LLM 생성 결과 캐시 인터페이스 (src.llm.cache 참고)."""
+
+    def get(self, key: str) -> str | None:
+        """캐시된 응답 조회 (없으면 None)."""
+        ...
+
+    def put(self, key: str, model: str, output: str) -> None:
+        """응답 저장."""
+        ...
+
+    async def warm(self, session: AsyncSession, keys: Iterable[str]) -> int:
+        """영구 저장소에서 key들을 미리 적재."""
+        ...
+
+    async def persist(self, session: AsyncSession, keys: Iterable[str]) -> int:
+        """keys 중 새로 저장된 응답을 영구 저장소에 기록 (commit은 호출자 책임)."""
+        ...
@@ -0,0 +1,44 @@
+"""provider 배치 API 실행 - 제출된 배치 작업 완료까지 polling."""
+
+import asyncio
+import logging
+import time
+
+from src.llm.base import BatchJobState, BatchLLMClient
+from src.llm.errors import LLMError
+
+logger = logging.getLogger(__name__)
+
+
+async def wait_for_batch(
+    client: BatchLLMClient,
+    job_id: str,
+    poll_interval: float,
+    timeout: float,
+) -> dict[str, str]:
+    """배치 작업이 끝날 때까지 poll_interval마다 상태를 확인하고 결과 반환.
+
+    Raises:
+        LLMError: 작업 실패 또는 timeout 초과
+    """
+    started = time.monotonic()
+    while True:
+        state = await client.get_batch_state(job_id)
+        if state == BatchJobState.SUCCEEDED:
+            break
+        if state == BatchJobState.FAILED:
+            raise LLMError(f"배치 작업 실패: {job_id}")
+        elapsed = time.monotonic() - started
+        if elapsed > timeout:
+            raise LLMError(f"배치 작업 시간 초과: {job_id}")
+        logger.info(
+            "배치 작업 대기 | job_id=%s, state=%s, elapsed=%.0fs",
+            job_id,
+            state.value,
+            elapsed,
+        )
+        await asyncio.sleep(poll_interval)
+
+    results = await client.get_batch_results(job_id)
+    logger.info("배치 작업 완료 | job_id=%s, results=%d", job_id, len(results))
+    return results
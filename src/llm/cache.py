@@ -0,0 +1,311 @@
+"""LLM 생성 결과 캐시.
+
+같은 (모델, 시스템 지시문, user message, temperature) 요청은 같은 응답을 재사용한다.
+결정적 출력을 기대할 수 있는 temperature=0 요청, 또는 Run에서 명시적으로 요청한 경우에만
+CachedLLMClient로 감싸서 사용한다.
+
+백엔드는 GENERATION_CACHE_BACKEND 설정으로 선택한다.
+- memory: 프로세스 내 LRU
+- postgres: LRU + generation_cache 테이블 (Run 배치마다 warm()/persist())
+
+캐시는 프로세스에서 공유하지만 persist()는 해당 배치의 key만 기록한다. 동시에 도는 다른 Run의
+결과가 이 Run의 트랜잭션에 섞여 함께 rollback되지 않는다.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Iterable
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col, select
+
+from src.common import trace
+from src.config import get_settings
+from src.llm.base import GenerationCache, LLMClient
+from src.llm.models import GenerationCacheEntry
+
+logger = logging.getLogger(__name__)
+
+_PERSIST_CHUNK_SIZE = 1000
+
+
+def generation_key(
+    model: str,
+    system_instruction: str,
+    user_message: str,
+    temperature: float,
+) -> str:
+    """생성 요청 입력의 sha256 hex digest."""
+    payload = json.dumps(
+        [model, system_instruction, user_message, temperature], ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MemoryGenerationCache:
+    """프로세스 내 LRU 생성 캐시 (warm/persist는 no-op)."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        """LRU에서 조회 (없으면 None)."""
+        with self._lock:
+            output = self._entries.get(key)
+            if output is not None:
+                self._entries.move_to_end(key)
+            return output
+
+    def put(self, key: str, model: str, output: str) -> None:  # noqa: ARG002
+        """생성 결과 저장."""
+        with self._lock:
+            self._set(key, output)
+
+    def _set(self, key: str, output: str) -> None:
+        self._entries[key] = output
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def warm(self, session: AsyncSession, keys: Iterable[str]) -> int:  # noqa: ARG002
+        return 0
+
+    async def persist(self, session: AsyncSession, keys: Iterable[str]) -> int:  # noqa: ARG002
+        return 0
+
+
+class PostgresGenerationCache(MemoryGenerationCache):
+    """LRU + generation_cache 테이블 생성 캐시."""
+
+    def __init__(self, max_size: int):
+        super().__init__(max_size)
+        self._pending: dict[str, tuple[str, str]] = {}
+
+    def put(self, key: str, model: str, output: str) -> None:
+        """생성 결과 저장 (다음 persist() 때 DB에 기록)."""
+        with self._lock:
+            self._set(key, output)
+            self._pending[key] = (model, output)
+
+    async def warm(self, session: AsyncSession, keys: Iterable[str]) -> int:
+        """LRU에 없는 key의 생성 결과를 DB에서 읽어 LRU에 적재.
+
+        Returns:
+            DB에서 적재한 결과 개수
+        """
+        with self._lock:
+            missing = {k for k in keys if k not in self._entries}
+        if not missing:
+            return 0
+
+        rows = (
+            await session.execute(
+                select(GenerationCacheEntry.key, GenerationCacheEntry.output).where(
+                    col(GenerationCacheEntry.key).in_(missing)
+                )
+            )
+        ).all()
+
+        with self._lock:
+            for row in rows:
+                self._set(row.key, row.output)
+
+        logger.debug(
+            "생성 캐시 적재 | requested=%d, loaded=%d", len(missing), len(rows)
+        )
+        return len(rows)
+
+    async def persist(self, session: AsyncSession, keys: Iterable[str]) -> int:
+        """keys 중 아직 DB에 기록되지 않은 생성 결과 저장 (commit은 호출자 책임).
+
+        다른 key의 대기 결과는 그 결과를 만든 Run이 자신의 트랜잭션에서 기록하도록 남겨 둔다.
+        INSERT가 실패하면 꺼낸 결과를 다시 대기시킨다.
+
+        Returns:
+            기록 시도한 결과 개수
+        """
+        with self._lock:
+            pending = {
+                key: entry
+                for key in keys
+                if (entry := self._pending.pop(key, None)) is not None
+            }
+        if not pending:
+            return 0
+
+        now = datetime.now(UTC)
+        values = [
+            {"key": key, "model": model, "output": output, "created_at": now}
+            for key, (model, output) in pending.items()
+        ]
+        try:
+            for start in range(0, len(values), _PERSIST_CHUNK_SIZE):
+                stmt = (
+                    insert(GenerationCacheEntry)
+                    .values(values[start : start + _PERSIST_CHUNK_SIZE])
+                    .on_conflict_do_nothing(index_elements=["key"])
+                )
+                await session.execute(stmt)
+        except BaseException:
+            with self._lock:
+                for key, entry in pending.items():
+                    self._pending.setdefault(key, entry)
+            raise
+        logger.debug("생성 캐시 기록 | count=%d", len(pending))
+        return len(pending)
+
+
+@dataclass
+class GenerationCacheStats:
+    """캐시 hit/miss 카운터."""
+
+    hits: int = 0
+    misses: int = 0
+
+    def take(self) -> tuple[int, int]:
+        """현재 카운터를 반환하고 0으로 초기화 (배치 단위 집계용)."""
+        counts = (self.hits, self.misses)
+        self.hits = self.misses = 0
+        return counts
+
+
+class CachedLLMClient:
+    """생성 캐시를 거치는 LLMClient 래퍼.
+
+    temperature=0 요청만 캐시하며, always=True면 temperature와 무관하게 캐시한다.
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        model: str,
+        cache: GenerationCache,
+        always: bool = False,
+    ):
+        self.client = client
+        self.model = model
+        self.cache = cache
+        self.always = always
+        self.stats = GenerationCacheStats()
+        self._prepared: dict[tuple[str, str, float], str] = {}
+
+    def key_for(
+        self, system_instruction: str, user_message: str, temperature: float
+    ) -> str:
+        prepared = self._prepared.get((system_instruction, user_message, temperature))
+        if prepared is not None:
+            return prepared
+        return generation_key(self.model, system_instruction, user_message, temperature)
+
+    def prepare(
+        self,
+        system_instruction: str,
+        user_messages: Iterable[str],
+        temperature: float,
+    ) -> list[str]:
+        """배치의 key를 한 번 계산해 반환하고, 다음 prepare() 전까지 generate에서 재사용."""
+        self._prepared = {
+            (system_instruction, message, temperature): generation_key(
+                self.model, system_instruction, message, temperature
+            )
+            for message in user_messages
+        }
+        return list(self._prepared.values())
+
+    async def generate(
+        self,
+        system_instruction: str,
+        user_message: str,
+        temperature: float = 1.0,
+    ) -> str:
+        if not (self.always or temperature == 0):
+            return await self.client.generate(
+                system_instruction=system_instruction,
+                user_message=user_message,
+                temperature=temperature,
+            )
+
+        key = self.key_for(system_instruction, user_message, temperature)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats.hits += 1
+            trace.increment("generation_cache_hits")
+            return cached
+
+        self.stats.misses += 1
+        output = await self.client.generate(
+            system_instruction=system_instruction,
+            user_message=user_message,
+            temperature=temperature,
+        )
+        self.cache.put(key, self.model, output)
+        return output
+
+    async def generate_stream(
+        self,
+        system_instruction: str,
+        user_message: str,
+        temperature: float = 1.0,
+    ) -> AsyncGenerator[str, None]:
+        """캐시 hit면 저장된 출력을 한 번에, miss면 스트림을 그대로 전달.
+
+        중간에 닫힌(중단된) 스트림은 불완전한 출력이므로 캐시하지 않는다.
+        """
+        if not (self.always or temperature == 0):
+            async with aclosing(
+                self.client.generate_stream(
+                    system_instruction=system_instruction,
+                    user_message=user_message,
+                    temperature=temperature,
+                )
+            ) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+            return
+
+        key = self.key_for(system_instruction, user_message, temperature)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats.hits += 1
+            trace.increment("generation_cache_hits")
+            yield cached
+            return
+
+        self.stats.misses += 1
+        parts: list[str] = []
+        async with aclosing(
+            self.client.generate_stream(
+                system_instruction=system_instruction,
+                user_message=user_message,
+                temperature=temperature,
+            )
+        ) as chunks:
+            async for chunk in chunks:
+                parts.append(chunk)
+                yield chunk
+        self.cache.put(key, self.model, "".join(parts))
+
+    async def aclose(self) -> None:
+        """감싼 클라이언트는 레지스트리가 공유·정리하므로 닫지 않음."""
+
+
+@lru_cache
+def get_generation_cache() -> GenerationCache:
+    """프로세스 전역 생성 캐시 반환 (GENERATION_CACHE_BACKEND 기준)."""
+    settings = get_settings()
+    if settings.GENERATION_CACHE_BACKEND == "memory":
+        return MemoryGenerationCache(max_size=settings.GENERATION_CACHE_SIZE)
+    return PostgresGenerationCache(max_size=settings.GENERATION_CACHE_SIZE)
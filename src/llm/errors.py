@@ -0,0 +1,19 @@
+"""LLM 호출 예외 - provider SDK 예외를 공통 타입으로 변환해 재시도 판단에 사용."""
+
+
+class LLMError(Exception):
+    """LLM 호출 실패."""
+
+
+class RetryableLLMError(LLMError):
+    """재시도하면 성공할 수 있는 일시적 오류 (5xx, 타임아웃)."""
+
+
+class RateLimitError(RetryableLLMError):
+    """provider 요청 한도 초과 (HTTP 429)."""
+
+    def __init__(
+        self, message: str = "요청 한도 초과", retry_after: float | None = None
+    ):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -1,10 +1,95 @@
-from src.llm.base import LLMClient
+"""프로세스 전역 LLM 클라이언트 레지스트리.
+
+클라이언트는 (provider, model)별로 한 번만 만들고, 같은 provider의 클라이언트는
+하나의 HTTP 연결 풀을 공유한다 (keep-alive 재사용, TLS 핸드셰이크 최소화).
+반환되는 클라이언트는 모델별 속도 제한·재시도 래퍼(RateLimitedLLMClient)로 감싸져 있다.
+앱/워커 종료 시 close_llm_clients()로 정리한다.
+"""
+
+import httpx
+
+from src.config import get_settings
+from src.llm.base import BatchLLMClient, LLMClient
 from src.llm.gemini import GeminiClient
+from src.llm.ratelimit import RateLimitedLLMClient, get_rate_limiter
 
+type ClientKey = tuple[str, str]
 
-def get_llm_client(model: str) -> LLMClient:
-    """모델명에 따라 적절한 LLM 클라이언트 반환."""
+_clients: dict[ClientKey, LLMClient] = {}
+# 속도 제한 래퍼 없이 provider 클라이언트 자체 (배치 API 등 provider 기능용)
+_base_clients: dict[ClientKey, LLMClient] = {}
+_http_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def get_provider(model: str) -> str:
+    """모델명에 해당하는 provider 반환."""
     if model.startswith("gemini"):
-        return GeminiClient(model=model)
-    else:
-        raise ValueError(f"지원하지 않는 모델: {model}")
+        return "gemini"
+    raise ValueError(f"지원하지 않는 모델: {model}")
+
+
+def _get_http_client(provider: str) -> httpx.AsyncClient:
+    """provider별 공유 HTTP 연결 풀 반환."""
+    http_client = _http_clients.get(provider)
+    if http_client is None:
+        settings = get_settings()
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(settings.LLM_TIMEOUT, connect=10.0),
+        )
+        _http_clients[provider] = http_client
+    return http_client
+
+
+def get_llm_client(model: str) -> LLMClient:
+    """모델명에 따라 프로세스 전역 LLM 클라이언트 반환 (연결 풀 재사용)."""
+    provider = get_provider(model)
+    key = (provider, model)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    settings = get_settings()
+    base_client = GeminiClient(model=model, http_client=_get_http_client(provider))
+    _base_clients[key] = base_client
+    client = RateLimitedLLMClient(
+        base_client,
+        get_rate_limiter(model),
+        max_retries=settings.LLM_MAX_RETRIES,
+        base_delay=settings.LLM_RETRY_BASE_DELAY,
+        max_delay=settings.LLM_RETRY_MAX_DELAY,
+        output_tokens=settings.LLM_ESTIMATED_OUTPUT_TOKENS,
+        model=model,
+    )
+    _clients[key] = client
+    return client
+
+
+def get_batch_llm_client(model: str) -> BatchLLMClient:
+    """모델의 배치 API 클라이언트 반환 (get_llm_client와 연결 풀 공유).
+
+    Raises:
+        ValueError: provider가 배치 API를 지원하지 않는 경우
+    """
+    get_llm_client(model)
+    client = _base_clients[(get_provider(model), model)]
+    if not isinstance(client, BatchLLMClient):
+        raise ValueError(f"배치 API를 지원하지 않는 모델: {model}")
+    return client
+
+
+async def close_llm_clients() -> None:
+    """생성된 모든 LLM 클라이언트와 연결 풀 정리 (앱/워커 종료 시)."""
+    clients = list(_clients.values())
+    http_clients = list(_http_clients.values())
+    _clients.clear()
+    _base_clients.clear()
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
+    for http_client in http_clients:
+        await http_client.aclose()
@@ -1,17 +1,128 @@
+import io
+import json
+from collections.abc import AsyncGenerator, Iterator, Sequence
+from contextlib import aclosing, contextmanager
+from typing import cast
+
+import httpx
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 
+from src.common import trace
 from src.config import get_settings
+from src.llm.base import BatchJobState, BatchRequest
+from src.llm.errors import RateLimitError, RetryableLLMError
+
+_BATCH_STATES = {
+    types.JobState.JOB_STATE_SUCCEEDED: BatchJobState.SUCCEEDED,
+    types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED: BatchJobState.SUCCEEDED,
+    types.JobState.JOB_STATE_FAILED: BatchJobState.FAILED,
+    types.JobState.JOB_STATE_CANCELLED: BatchJobState.FAILED,
+    types.JobState.JOB_STATE_EXPIRED: BatchJobState.FAILED,
+    types.JobState.JOB_STATE_RUNNING: BatchJobState.RUNNING,
+}
+
+
+def _retry_after(error: errors.APIError) -> float | None:
+    """429 응답의 Retry-After 헤더(초) 파싱."""
+    response = error.response
+    if not isinstance(response, httpx.Response):
+        return None
+    try:
+        return float(response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+
+@contextmanager
+def _translate_errors() -> Iterator[None]:
+    """SDK 예외를 재시도 판단용 LLMError로 변환."""
+    try:
+        yield
+    except errors.ClientError as e:
+        if e.code == 429:
+            raise RateLimitError(str(e), retry_after=_retry_after(e)) from e
+        raise
+    except (errors.ServerError, httpx.TimeoutException, httpx.NetworkError) as e:
+        raise RetryableLLMError(str(e)) from e
+
+
+def _batch_jsonl(requests: Sequence[BatchRequest]) -> bytes:
+    """배치 입력 파일 형식 (한 줄에 {"key", "request"} 하나)."""
+    lines = [
+        json.dumps(
+            {
+                "key": request.key,
+                "request": {
+                    "contents": [
+                        {"role": "user", "parts": [{"text": request.user_message}]}
+                    ],
+                    "systemInstruction": {
+                        "parts": [{"text": request.system_instruction}]
+                    },
+                    "generationConfig": {"temperature": request.temperature},
+                },
+            },
+            ensure_ascii=False,
+        )
+        for request in requests
+    ]
+    return "\n".join(lines).encode("utf-8")
+
+
+def _parse_batch_jsonl(content: bytes) -> dict[str, str]:
+    """배치 결과 파일에서 key → 응답 텍스트 (오류 응답은 제외)."""
+    results: dict[str, str] = {}
+    for line in content.decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        key = item.get("key")
+        response = item.get("response")
+        if key is None or response is None:
+            continue
+        text = types.GenerateContentResponse.model_validate(response).text
+        if text is not None:
+            results[key] = text
+    return results
+
+
+def _record_usage(usage: types.GenerateContentResponseUsageMetadata | None) -> None:
+    """응답의 토큰 사용량을 현재 row trace에 기록."""
+    if usage is None:
+        return
+    trace.record_tokens(
+        prompt=usage.prompt_token_count,
+        output=usage.candidates_token_count,
+        thoughts=usage.thoughts_token_count,
+        cached=usage.cached_content_token_count,
+        total=usage.total_token_count,
+    )
 
 
 class GeminiClient:
     """Google Gemini LLM 클라이언트."""
 
-    def __init__(self, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        model: str = "gemini-2.5-flash",
+        http_client: httpx.AsyncClient | None = None,
+    ):
+        """
+        Args:
+            http_client: 공유할 HTTP 연결 풀 (없으면 SDK 기본 클라이언트 사용)
+        """
         settings = get_settings()
         if not settings.GOOGLE_API_KEY:
             raise ValueError("GOOGLE_API_KEY가 설정되지 않았습니다")
-        self.client: genai.Client = genai.Client(api_key=settings.GOOGLE_API_KEY)
+        http_options = (
+            types.HttpOptions(httpx_async_client=http_client)
+            if http_client is not None
+            else None
+        )
+        self.client: genai.Client = genai.Client(
+            api_key=settings.GOOGLE_API_KEY, http_options=http_options
+        )
         self.model_name: str = model
 
     async def generate(
@@ -20,14 +131,98 @@ class GeminiClient:
         user_message: str,
         temperature: float = 1.0,
     ) -> str:
-        response = await self.client.aio.models.generate_content(
-            model=self.model_name,
-            contents=user_message,
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                temperature=temperature,
-            ),
-        )
+        with _translate_errors():
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=user_message,
+                config=types.GenerateContentConfig(
+                    system_instruction=system_instruction,
+                    temperature=temperature,
+                ),
+            )
+        _record_usage(response.usage_metadata)
         if response.text is None:
             raise ValueError("Gemini 응답이 비어 있습니다")
         return response.text
+
+    async def generate_stream(
+        self,
+        system_instruction: str,
+        user_message: str,
+        temperature: float = 1.0,
+    ) -> AsyncGenerator[str, None]:
+        with _translate_errors():
+            stream = await self.client.aio.models.generate_content_stream(
+                model=self.model_name,
+                contents=user_message,
+                config=types.GenerateContentConfig(
+                    system_instruction=system_instruction,
+                    temperature=temperature,
+                ),
+            )
+            # 소비자가 중단하면 SDK 스트림(HTTP 응답)도 바로 닫음
+            async with aclosing(
+                cast(AsyncGenerator[types.GenerateContentResponse, None], stream)
+            ) as chunks:
+                async for chunk in chunks:
+                    # 사용량은 누적값이라 마지막 조각의 값이 최종 사용량
+                    _record_usage(chunk.usage_metadata)
+                    if chunk.text:
+                        yield chunk.text
+
+    async def submit_batch(self, requests: Sequence[BatchRequest]) -> str:
+        """요청 전체를 배치 작업으로 제출.
+
+        inline 요청은 전체 크기 한도가 있으므로, 입력이 LLM_BATCH_INLINE_MAX_BYTES를
+        넘으면 JSONL 파일로 업로드해 파일 입력으로 제출한다.
+        """
+        payload = _batch_jsonl(requests)
+        src: list[types.InlinedRequest] | str
+        if len(payload) <= get_settings().LLM_BATCH_INLINE_MAX_BYTES:
+            src = [
+                types.InlinedRequest(
+                    contents=request.user_message,
+                    metadata={"key": request.key},
+                    config=types.GenerateContentConfig(
+                        system_instruction=request.system_instruction,
+                        temperature=request.temperature,
+                    ),
+                )
+                for request in requests
+            ]
+        else:
+            uploaded = await self.client.aio.files.upload(
+                file=io.BytesIO(payload),
+                config=types.UploadFileConfig(mime_type="jsonl"),
+            )
+            if uploaded.name is None:
+                raise ValueError("Gemini 배치 입력 파일 이름이 비어 있습니다")
+            src = uploaded.name
+        job = await self.client.aio.batches.create(model=self.model_name, src=src)
+        if job.name is None:
+            raise ValueError("Gemini 배치 작업 ID가 비어 있습니다")
+        return job.name
+
+    async def get_batch_state(self, job_id: str) -> BatchJobState:
+        job = await self.client.aio.batches.get(name=job_id)
+        if job.state is None:
+            return BatchJobState.PENDING
+        return _BATCH_STATES.get(job.state, BatchJobState.PENDING)
+
+    async def get_batch_results(self, job_id: str) -> dict[str, str]:
+        job = await self.client.aio.batches.get(name=job_id)
+        if job.dest is not None and job.dest.file_name:
+            # 파일로 제출한 작업은 결과도 JSONL 파일로 받음
+            content = await self.client.aio.files.download(file=job.dest.file_name)
+            return _parse_batch_jsonl(content)
+        responses = (job.dest.inlined_responses if job.dest else None) or []
+        results: dict[str, str] = {}
+        for item in responses:
+            key = (item.metadata or {}).get("key")
+            text = item.response.text if item.response else None
+            if key is not None and text is not None:
+                results[key] = text
+        return results
+
+    async def aclose(self) -> None:
+        await self.client.aio.aclose()
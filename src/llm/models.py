@@ -0,0 +1,19 @@
+from datetime import UTC, datetime
+from typing import ClassVar
+
+from sqlalchemy import Column, DateTime, Text
+from sqlmodel import Field, SQLModel
+
+
+class GenerationCacheEntry(SQLModel, table=True):
+    """LLM 생성 결과 영구 캐시 - 입력 해시(generation_key) 기준 저장소."""
+
+    __tablename__: ClassVar[str] = "generation_cache"
+
+    key: str = Field(primary_key=True, max_length=64)
+    model: str = Field(index=True)
+    output: str = Field(sa_column=Column(Text, nullable=False))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(DateTime(timezone=True)),
+    )
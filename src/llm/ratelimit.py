@@ -0,0 +1,316 @@
+"""모델별 요청 속도 제한 + 적응형 동시성 + 재시도.
+
+모델마다 하나의 ModelRateLimiter를 프로세스 내 모든 Run이 공유한다.
+- RPM/TPM 토큰 버킷: 분당 요청 수/토큰 수 예산 안에서만 요청 시작
+- AIMD 동시성: 성공 시 한도를 천천히 늘리고(+1/limit), 429나 지연 목표 초과 시 절반으로 줄임
+- 재시도: RetryableLLMError는 full jitter 지수 백오프로 재시도 (429는 retry_after 우선)
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import aclosing, asynccontextmanager
+
+from src.common import metrics, trace
+from src.config import get_settings
+from src.llm.base import LLMClient
+from src.llm.errors import RateLimitError, RetryableLLMError
+
+logger = logging.getLogger(__name__)
+
+# 토큰 수 추정용 (문자 4개 ≈ 토큰 1개)
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(*texts: str) -> int:
+    """텍스트 토큰 수 근사치."""
+    return sum(len(text) for text in texts) // _CHARS_PER_TOKEN + 1
+
+
+class TokenBucket:
+    """초당 refill_rate씩 채워지는 토큰 버킷 (최대 capacity)."""
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_rate: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.refill_rate
+        )
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """amount만큼 토큰이 찰 때까지 대기 후 소비 (capacity 초과 요청은 capacity로 제한)."""
+        amount = min(amount, self.capacity)
+        # 먼저 도착한 요청부터 순서대로 소비
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.refill_rate)
+
+
+class AdaptiveConcurrency:
+    """AIMD 방식 동시 요청 한도."""
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        latency_target: float,
+        backoff_ratio: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            latency_target: 이 시간(초)보다 오래 걸린 성공 응답은 과부하 신호로 처리
+            cooldown: 연속 감소 방지 간격 (동시에 도착한 429들로 한도가 연달아 줄지 않도록)
+        """
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self.cooldown = cooldown
+        self._clock = clock
+        self._last_decrease = float("-inf")
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """동시 요청 슬롯 점유."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    def on_success(self, latency: float) -> None:
+        if latency > self.latency_target:
+            self._decrease()
+        else:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+    def on_rate_limited(self) -> None:
+        self._decrease()
+
+    def _decrease(self) -> None:
+        now = self._clock()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(self.minimum, self.limit * self.backoff_ratio)
+        logger.info("LLM 동시성 한도 감소 | limit=%.1f", self.limit)
+
+
+class ModelRateLimiter:
+    """모델 하나의 RPM/TPM 버킷 + 적응형 동시성."""
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        concurrency: AdaptiveConcurrency,
+    ):
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60)
+        self.concurrency = concurrency
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int) -> AsyncIterator[None]:
+        """요청 예산과 동시성 슬롯을 확보한 뒤 요청 실행 (대기 시간은 trace의 llm_queue)."""
+        started = time.perf_counter()
+        async with self.concurrency.slot():
+            await self.requests.acquire(1)
+            await self.tokens.acquire(estimated_tokens)
+            trace.add_timing("llm_queue", time.perf_counter() - started)
+            yield
+
+
+_limiters: dict[str, ModelRateLimiter] = {}
+
+
+def get_rate_limiter(model: str) -> ModelRateLimiter:
+    """모델별 프로세스 전역 ModelRateLimiter 반환 (없으면 설정값으로 생성)."""
+    limiter = _limiters.get(model)
+    if limiter is None:
+        settings = get_settings()
+        limits = settings.LLM_MODEL_RATE_LIMITS.get(model, {})
+        limiter = ModelRateLimiter(
+            requests_per_minute=limits.get("rpm", settings.LLM_REQUESTS_PER_MINUTE),
+            tokens_per_minute=limits.get("tpm", settings.LLM_TOKENS_PER_MINUTE),
+            concurrency=AdaptiveConcurrency(
+                initial=settings.MODEL_CONCURRENCY,
+                minimum=1,
+                maximum=settings.MODEL_CONCURRENCY,
+                latency_target=settings.LLM_LATENCY_TARGET,
+            ),
+        )
+        _limiters[model] = limiter
+    return limiter
+
+
+class RateLimitedLLMClient:
+    """ModelRateLimiter와 재시도를 적용하는 LLMClient 래퍼."""
+
+    def __init__(
+        self,
+        client: LLMClient,
+        limiter: ModelRateLimiter,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        output_tokens: int = 512,
+        model: str = "unknown",
+    ):
+        """
+        Args:
+            output_tokens: TPM 예산 계산 시 응답 토큰 수 추정치
+            model: 지표 label (모델별 지연·재시도)
+        """
+        self.client = client
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.output_tokens = output_tokens
+        # 요청마다 label을 찾지 않도록 지표 child를 미리 보관
+        self._latency = metrics.LLM_REQUEST_SECONDS.labels(model)
+        self._in_flight = metrics.LLM_IN_FLIGHT.labels(model)
+        self._rate_limited = metrics.LLM_RATE_LIMITED.labels(model)
+        self._retries = {
+            reason: metrics.LLM_RETRIES.labels(model, reason)
+            for reason in ("rate_limited", "error")
+        }
+
+    def _record_retry(self, error: RetryableLLMError) -> None:
+        rate_limited = isinstance(error, RateLimitError)
+        self._retries["rate_limited" if rate_limited else "error"].inc()
+        trace.increment("llm_retries")
+        if rate_limited:
+            trace.increment("llm_rate_limited")
+
+    def _backoff(self, attempt: int, error: RetryableLLMError) -> float:
+        if isinstance(error, RateLimitError) and error.retry_after is not None:
+            return error.retry_after
+        # full jitter: [0, min(max_delay, base * 2^attempt))
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def generate(
+        self,
+        system_instruction: str,
+        user_message: str,
+        temperature: float = 1.0,
+    ) -> str:
+        estimated = (
+            estimate_tokens(system_instruction, user_message) + self.output_tokens
+        )
+        attempt = 0
+        while True:
+            try:
+                async with self.limiter.slot(estimated):
+                    started = time.monotonic()
+                    with self._in_flight.track_inprogress():
+                        output = await self.client.generate(
+                            system_instruction=system_instruction,
+                            user_message=user_message,
+                            temperature=temperature,
+                        )
+                    elapsed = time.monotonic() - started
+                    self.limiter.concurrency.on_success(elapsed)
+                    self._latency.observe(elapsed)
+                    return output
+            except RetryableLLMError as e:
+                if isinstance(e, RateLimitError):
+                    self.limiter.concurrency.on_rate_limited()
+                    self._rate_limited.inc()
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt, e)
+                attempt += 1
+                self._record_retry(e)
+                logger.warning(
+                    "LLM 호출 재시도 | attempt=%d/%d, delay=%.2fs, error=%s",
+                    attempt,
+                    self.max_retries,
+                    delay,
+                    type(e).__name__,
+                )
+                await asyncio.sleep(delay)
+
+    async def generate_stream(
+        self,
+        system_instruction: str,
+        user_message: str,
+        temperature: float = 1.0,
+    ) -> AsyncGenerator[str, None]:
+        """스트리밍 생성 - 첫 조각을 받기 전에 실패한 경우만 재시도.
+
+        슬롯은 스트림이 끝나거나 소비자가 닫을 때까지 점유한다.
+        """
+        estimated = (
+            estimate_tokens(system_instruction, user_message) + self.output_tokens
+        )
+        attempt = 0
+        while True:
+            received = False
+            try:
+                async with self.limiter.slot(estimated):
+                    started = time.monotonic()
+                    with self._in_flight.track_inprogress():
+                        async with aclosing(
+                            self.client.generate_stream(
+                                system_instruction=system_instruction,
+                                user_message=user_message,
+                                temperature=temperature,
+                            )
+                        ) as chunks:
+                            async for chunk in chunks:
+                                received = True
+                                yield chunk
+                    elapsed = time.monotonic() - started
+                    self.limiter.concurrency.on_success(elapsed)
+                    self._latency.observe(elapsed)
+                    return
+            except RetryableLLMError as e:
+                if isinstance(e, RateLimitError):
+                    self.limiter.concurrency.on_rate_limited()
+                    self._rate_limited.inc()
+                if received or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt, e)
+                attempt += 1
+                self._record_retry(e)
+                logger.warning(
+                    "LLM 스트리밍 재시도 | attempt=%d/%d, delay=%.2fs, error=%s",
+                    attempt,
+                    self.max_retries,
+                    delay,
+                    type(e).__name__,
+                )
+                await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
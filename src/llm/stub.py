@@ -0,0 +1,79 @@
+"""로컬 stub provider - API 키·네트워크 없이 LLMClient/BatchLLMClient 동작 재현 (테스트용)."""
+
+from collections.abc import AsyncGenerator, Callable, Sequence
+from itertools import count
+
+from src.llm.base import BatchJobState, BatchRequest
+
+
+def _echo(user_message: str) -> str:
+    return user_message
+
+
+class StubLLMClient:
+    """user_message를 respond로 변환해 돌려주는 LLM 클라이언트.
+
+    배치 작업은 get_batch_state가 polls_until_done번 호출되면 완료된다.
+    """
+
+    def __init__(
+        self,
+        respond: Callable[[str], str] = _echo,
+        polls_until_done: int = 1,
+        failed_keys: frozenset[str] = frozenset(),
+    ):
+        """
+        Args:
+            failed_keys: 배치 결과에서 누락시킬 요청 key (요청 단위 실패 재현)
+        """
+        self.respond = respond
+        self.polls_until_done = polls_until_done
+        self.failed_keys = failed_keys
+        self.generate_calls = 0
+        self.stream_chunks = 0
+        self.batches: dict[str, list[BatchRequest]] = {}
+        self._polls: dict[str, int] = {}
+        self._ids = count(1)
+
+    async def generate(
+        self,
+        system_instruction: str,  # noqa: ARG002
+        user_message: str,
+        temperature: float = 1.0,  # noqa: ARG002
+    ) -> str:
+        self.generate_calls += 1
+        return self.respond(user_message)
+
+    async def generate_stream(
+        self,
+        system_instruction: str,  # noqa: ARG002
+        user_message: str,
+        temperature: float = 1.0,  # noqa: ARG002
+    ) -> AsyncGenerator[str, None]:
+        """respond 결과를 한 글자씩 반환 (stream_chunks에 반환한 조각 수 기록)."""
+        self.generate_calls += 1
+        for char in self.respond(user_message):
+            self.stream_chunks += 1
+            yield char
+
+    async def submit_batch(self, requests: Sequence[BatchRequest]) -> str:
+        job_id = f"stub-batch-{next(self._ids)}"
+        self.batches[job_id] = list(requests)
+        self._polls[job_id] = 0
+        return job_id
+
+    async def get_batch_state(self, job_id: str) -> BatchJobState:
+        self._polls[job_id] += 1
+        if self._polls[job_id] >= self.polls_until_done:
+            return BatchJobState.SUCCEEDED
+        return BatchJobState.RUNNING
+
+    async def get_batch_results(self, job_id: str) -> dict[str, str]:
+        return {
+            request.key: self.respond(request.user_message)
+            for request in self.batches[job_id]
+            if request.key not in self.failed_keys
+        }
+
+    async def aclose(self) -> None:
+        pass
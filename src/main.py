@@ -3,15 +3,23 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.router import router as auth_router
+from src.common import metrics
 from src.common.types import HealthResponse
 from src.config import get_settings
+from src.database import get_session
 from src.datasets.router import router as datasets_router
+from src.embeddings.factory import close_embedding_clients
+from src.llm.factory import close_llm_clients
 from src.profiles.router import router as profiles_router
 from src.prompts.router import router as prompts_router
+from src.runs.events import close_run_event_broker
+from src.runs.queue import count_queued
 from src.runs.router import router as runs_router
 
 logging.basicConfig(
@@ -28,6 +36,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: ARG001
     # Startup
     yield
     # Shutdown
+    await close_llm_clients()
+    await close_embedding_clients()
+    await close_run_event_broker()
 
 
 app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
@@ -50,3 +61,12 @@ app.include_router(runs_router)
 @app.get("/health")
 async def health_check() -> HealthResponse:
     return {"status": "healthy", "timestamp": datetime.now(UTC).isoformat()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint(
+    session: AsyncSession = Depends(get_session),
+) -> PlainTextResponse:
+    """Prometheus 텍스트 형식 지표 (이 API 프로세스 + Run 작업 큐 깊이)."""
+    metrics.RUN_QUEUE_DEPTH.set(await count_queued(session))
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
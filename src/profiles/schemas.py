@@ -1,18 +1,32 @@
 from datetime import datetime
 
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, field_validator
 from pydantic.alias_generators import to_camel
 
+from src.common.constraints import validate_constraints
 from src.common.schemas import CamelCaseModel
 from src.common.types import LogicConstraint
 
 
+def _check_constraints(
+    constraints: list[LogicConstraint] | None,
+) -> list[LogicConstraint] | None:
+    """잘못된 정규식·범위 값·최대 길이는 저장 시점에 거부 (Run 중 row마다 실패하지 않도록)."""
+    if constraints:
+        errors = validate_constraints(constraints)
+        if errors:
+            raise ValueError("; ".join(errors))
+    return constraints
+
+
 class CreateProfileRequest(CamelCaseModel):
     name: str
     description: str | None = None
     semantic_threshold: float = Field(default=0.85, ge=0.0, le=1.0)
     global_constraints: list[LogicConstraint] | None = None
 
+    _validate_constraints = field_validator("global_constraints")(_check_constraints)
+
 
 class UpdateProfileRequest(CamelCaseModel):
     name: str | None = None
@@ -20,6 +34,8 @@ class UpdateProfileRequest(CamelCaseModel):
     semantic_threshold: float | None = Field(default=None, ge=0.0, le=1.0)
     global_constraints: list[LogicConstraint] | None = None
 
+    _validate_constraints = field_validator("global_constraints")(_check_constraints)
+
 
 class ProfileResponse(CamelCaseModel):
     id: int
@@ -0,0 +1,162 @@
+"""run_metrics 집계 테이블 갱신/조회.
+
+목록/상세 API가 run_results를 스캔하지 않도록 Run별 카운터를 유지한다.
+결과 배치를 INSERT하는 트랜잭션 안에서 accumulate()로 증분 갱신하고,
+Run이 끝나면 finalize()로 run_results 기준 값을 다시 계산해 확정한다.
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from src.runs.models import ResultStatus, Run, RunAggregate, RunResult
+from src.runs.schemas import RunMetrics, RunProgressResponse
+
+_NOT_SEMANTIC_PASSED = (ResultStatus.FORMAT, ResultStatus.SEMANTIC)
+
+
+def _counts(values: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "total_count": len(values),
+        "pass_count": sum(1 for v in values if v["status"] == ResultStatus.PASS),
+        "format_pass_count": sum(1 for v in values if v["is_format_passed"]),
+        "semantic_pass_count": sum(
+            1 for v in values if v["status"] not in _NOT_SEMANTIC_PASSED
+        ),
+        "semantic_score_sum": float(sum(v["semantic_score"] for v in values)),
+    }
+
+
+async def set_target(session: AsyncSession, run_id: int, remaining: int) -> None:
+    """처리할 전체 row 수 기록 - 이미 집계된 결과 수 + 남은 row 수 (commit은 호출자 책임)."""
+    stmt = insert(RunAggregate).values(
+        run_id=run_id, target_count=remaining, updated_at=datetime.now(UTC)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["run_id"],
+        set_={"target_count": RunAggregate.total_count + stmt.excluded.target_count},
+    )
+    await session.execute(stmt)
+
+
+async def accumulate(
+    session: AsyncSession,
+    run_id: int,
+    values: Sequence[dict[str, Any]],
+    generation_cache_hits: int = 0,
+    generation_cache_misses: int = 0,
+) -> None:
+    """저장할 결과 배치만큼 카운터 증가 (commit은 호출자 책임)."""
+    if not values:
+        return
+
+    counts = {
+        **_counts(values),
+        "generation_cache_hits": generation_cache_hits,
+        "generation_cache_misses": generation_cache_misses,
+    }
+    stmt = insert(RunAggregate).values(
+        run_id=run_id, updated_at=datetime.now(UTC), **counts
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["run_id"],
+        set_={
+            **{key: getattr(RunAggregate, key) + stmt.excluded[key] for key in counts},
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await session.execute(stmt)
+
+
+async def finalize(session: AsyncSession, run_id: int) -> None:
+    """run_results 기준으로 카운터를 다시 계산해 확정 (commit은 호출자 책임).
+
+    생성 캐시 hit/miss는 run_results에서 다시 계산할 수 없으므로 그대로 둔다.
+    """
+    totals = (
+        await session.execute(
+            select(
+                func.count().label("total_count"),
+                func.count()
+                .filter(col(RunResult.status) == ResultStatus.PASS)
+                .label("pass_count"),
+                func.count()
+                .filter(col(RunResult.is_format_passed))
+                .label("format_pass_count"),
+                func.count()
+                .filter(col(RunResult.status).not_in(_NOT_SEMANTIC_PASSED))
+                .label("semantic_pass_count"),
+                func.coalesce(func.sum(RunResult.semantic_score), 0.0).label(
+                    "semantic_score_sum"
+                ),
+            ).where(col(RunResult.run_id) == run_id)
+        )
+    ).one()
+
+    counts = dict(totals._mapping)
+    stmt = insert(RunAggregate).values(
+        run_id=run_id, updated_at=datetime.now(UTC), **counts
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["run_id"],
+        set_={key: stmt.excluded[key] for key in (*counts, "updated_at")},
+    )
+    await session.execute(stmt)
+
+
+def to_run_metrics(aggregate: RunAggregate | None) -> RunMetrics:
+    """집계 행을 API 응답용 RunMetrics로 변환 (결과가 없으면 0)."""
+    if aggregate is None or not aggregate.total_count:
+        return RunMetrics(
+            pass_rate=0.0,
+            avg_semantic=0.0,
+            format_pass_rate=0.0,
+            semantic_pass_rate=0.0,
+            logic_pass_rate=0.0,
+        )
+    total = aggregate.total_count
+    return RunMetrics(
+        pass_rate=aggregate.pass_count / total,
+        avg_semantic=aggregate.semantic_score_sum / total,
+        format_pass_rate=aggregate.format_pass_count / total,
+        semantic_pass_rate=aggregate.semantic_pass_count / total,
+        # Logic까지 통과한 row = PASS row
+        logic_pass_rate=aggregate.pass_count / total,
+        generation_cache_hits=aggregate.generation_cache_hits,
+        generation_cache_misses=aggregate.generation_cache_misses,
+    )
+
+
+async def load_progress(
+    session: AsyncSession, run_id: int
+) -> RunProgressResponse | None:
+    """Run 상태와 집계 카운터만 primary key로 조회 (결과 row 수와 무관, Run이 없으면 None)."""
+    row = (
+        await session.execute(
+            select(col(Run.status), RunAggregate)
+            .outerjoin(RunAggregate, col(RunAggregate.run_id) == col(Run.id))
+            .where(col(Run.id) == run_id)
+        )
+    ).one_or_none()
+    if row is None:
+        return None
+    status, aggregate = row
+    if aggregate is None:
+        return RunProgressResponse(run_id=run_id, status=status, processed=0)
+    total = aggregate.total_count
+    return RunProgressResponse(
+        run_id=run_id,
+        status=status,
+        target_count=aggregate.target_count,
+        processed=total,
+        pass_count=aggregate.pass_count,
+        format_pass_count=aggregate.format_pass_count,
+        semantic_pass_count=aggregate.semantic_pass_count,
+        avg_semantic=aggregate.semantic_score_sum / total if total else None,
+        updated_at=aggregate.updated_at,
+    )
@@ -6,7 +6,30 @@ Format → Semantic → Logic → Pass (fail-fast)
 
 from src.runs.evaluator.format_layer import check_format
 from src.runs.evaluator.logic_layer import check_logic
-from src.runs.evaluator.semantic_layer import check_semantic
-from src.runs.evaluator.waterfall import evaluate_waterfall
+from src.runs.evaluator.semantic_layer import (
+    check_semantic,
+    check_semantic_async,
+    check_semantic_batch,
+    check_semantic_batch_async,
+)
+from src.runs.evaluator.waterfall import (
+    WaterfallBatchResult,
+    evaluate_waterfall,
+    evaluate_waterfall_async,
+    evaluate_waterfall_batch,
+    evaluate_waterfall_batch_async,
+)
 
-__all__ = ["check_format", "check_logic", "check_semantic", "evaluate_waterfall"]
+__all__ = [
+    "WaterfallBatchResult",
+    "check_format",
+    "check_logic",
+    "check_semantic",
+    "check_semantic_async",
+    "check_semantic_batch",
+    "check_semantic_batch_async",
+    "evaluate_waterfall",
+    "evaluate_waterfall_async",
+    "evaluate_waterfall_batch",
+    "evaluate_waterfall_batch_async",
+]
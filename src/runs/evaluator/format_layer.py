@@ -87,3 +87,197 @@ def _check_label(raw_output: str, expected_output: str | None) -> FormatCheckRes
         passed=False,
         error_message=f"Label 불일치: '{cleaned}' != '{expected_output}'"
     )
+
+
+_JSON_WHITESPACE = " \t\n\r"
+# JSON 리터럴 (json.loads가 허용하는 NaN/Infinity 포함): 첫 글자 → 나머지 글자
+_JSON_LITERALS = {"t": "rue", "f": "alse", "n": "ull", "N": "aN", "I": "nfinity"}
+# 유효한 JSON 숫자의 모든 접두사
+_NUMBER_PREFIX = re.compile(
+    r"-?|-?(0|[1-9]\d*)(\.\d*)?|-?(0|[1-9]\d*)(\.\d+)?[eE][+-]?\d*"
+)
+_NUMBER = re.compile(r"-?(0|[1-9]\d*)(\.\d+)?([eE][+-]?\d+)?")
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class JsonStreamValidator:
+    """스트리밍 출력용 점진적 JSON 검증기.
+
+    조각을 feed할 때마다 지금까지의 출력이 요구 형태(JSON Object/Array)로
+    끝날 수 있는지 판단하고, 어떤 출력이 이어져도 실패가 확정되면 False를 반환한다.
+    check_format과 같은 규칙(앞뒤 공백, ```json 코드블록)을 따른다.
+
+    JSON이 아닌 문장으로 시작하면 뒤에 코드블록이 올 수 있으므로 중단하지 않는다.
+    """
+
+    def __init__(self, output_schema: OutputSchemaType):
+        if output_schema == OutputSchemaType.JSON_OBJECT:
+            self._root = "{"
+        elif output_schema == OutputSchemaType.JSON_ARRAY:
+            self._root = "["
+        else:
+            raise ValueError(f"JSON 스키마가 아닙니다: {output_schema.value}")
+        self.error_message: str | None = None
+        # 출력 단계: start → (fence → fence_lang →) json → done | prose
+        self._phase = "start"
+        self._fenced = False
+        self._buffer = ""
+        # JSON 파서 상태
+        self._stack: list[str] = []
+        self._expect = "value"
+        self._in_key = False
+        self._escape = 0  # -1: escape 문자 대기, n > 0: 남은 \u hex 자릿수
+        self._token = ""
+
+    def feed(self, chunk: str) -> bool:
+        """조각 추가. 유효한 출력이 될 수 없으면 False."""
+        for char in chunk:
+            if self.error_message is not None or self._phase in ("prose", "closed"):
+                break
+            self._feed_char(char)
+        return self.error_message is None
+
+    def _fail(self, message: str) -> None:
+        self.error_message = f"스트리밍 중 형식 위반: {message}"
+
+    def _feed_char(self, char: str) -> None:
+        phase = self._phase
+        if phase == "start":
+            if char.isspace():
+                return
+            if char == "`":
+                self._phase = "fence"
+                self._buffer = char
+            elif char in _CLOSERS:
+                self._phase = "json"
+                self._feed_json(char)
+            else:
+                self._phase = "prose"
+        elif phase == "fence":
+            if char != "`":
+                self._phase = "prose"
+                return
+            self._buffer += char
+            if self._buffer == "```":
+                self._phase = "fence_lang"
+                self._fenced = True
+                self._buffer = ""
+        elif phase == "fence_lang":
+            # 여는 ``` 뒤의 언어 표시 - check_format 정규식처럼 소문자 json만 건너뜀
+            if len(self._buffer) < 4 and "json".startswith(self._buffer + char):
+                self._buffer += char
+            elif self._buffer in ("", "json") and char.isspace():
+                return
+            else:
+                pending = self._buffer if self._buffer != "json" else ""
+                self._buffer = ""
+                self._phase = "json"
+                for c in pending + char:
+                    if self.error_message is None:
+                        self._feed_json(c)
+        elif phase == "json":
+            self._feed_json(char)
+        elif self._fenced and char == "`":
+            # 닫는 코드블록 이후는 검사하지 않음
+            self._phase = "closed"
+        elif not char.isspace():
+            self._fail("JSON 값 뒤에 다른 내용이 있습니다")
+
+    def _feed_json(self, char: str) -> None:
+        expect = self._expect
+        if expect == "string":
+            self._feed_string(char)
+        elif expect == "number":
+            if self._token == "-" and char == "I":
+                self._expect = "literal"
+                self._token = _JSON_LITERALS[char]
+            elif _NUMBER_PREFIX.fullmatch(self._token + char):
+                self._token += char
+            elif not _NUMBER.fullmatch(self._token):
+                self._fail(f"잘못된 숫자: {self._token}")
+            else:
+                self._end_value()
+                self._feed_json(char)
+        elif expect == "literal":
+            if not self._token.startswith(char):
+                self._fail("잘못된 리터럴")
+                return
+            self._token = self._token[1:]
+            if not self._token:
+                self._end_value()
+        elif char in _JSON_WHITESPACE:
+            return
+        elif expect in ("value", "value_or_end"):
+            if expect == "value_or_end" and char == "]":
+                self._close()
+            elif not self._stack and char != self._root:
+                self._fail(f"최상위 값이 {self._root}로 시작하지 않습니다")
+            else:
+                self._start_value(char)
+        elif expect in ("key", "key_or_end"):
+            if expect == "key_or_end" and char == "}":
+                self._close()
+            elif char == '"':
+                self._expect = "string"
+                self._in_key = True
+            else:
+                self._fail("객체 key는 문자열이어야 합니다")
+        elif expect == "colon":
+            if char != ":":
+                self._fail("key 뒤에 ':'가 없습니다")
+            self._expect = "value"
+        elif char == ",":
+            self._expect = "key" if self._stack[-1] == "{" else "value"
+        elif char == _CLOSERS[self._stack[-1]]:
+            self._close()
+        else:
+            self._fail(f"예상하지 못한 문자: {char!r}")
+
+    def _start_value(self, char: str) -> None:
+        if char in _CLOSERS:
+            self._stack.append(char)
+            self._expect = "key_or_end" if char == "{" else "value_or_end"
+        elif char == '"':
+            self._expect = "string"
+            self._in_key = False
+        elif char == "-" or char.isdigit():
+            self._expect = "number"
+            self._token = char
+        elif char in _JSON_LITERALS:
+            self._expect = "literal"
+            self._token = _JSON_LITERALS[char]
+        else:
+            self._fail(f"예상하지 못한 문자: {char!r}")
+
+    def _feed_string(self, char: str) -> None:
+        if self._escape == -1:
+            if char == "u":
+                self._escape = 4
+            elif char in '"\\/bfnrt':
+                self._escape = 0
+            else:
+                self._fail(f"잘못된 escape: \\{char}")
+        elif self._escape > 0:
+            if char not in "0123456789abcdefABCDEF":
+                self._fail("잘못된 유니코드 escape")
+            self._escape -= 1
+        elif char == "\\":
+            self._escape = -1
+        elif char == '"':
+            if self._in_key:
+                self._expect = "colon"
+            else:
+                self._end_value()
+        elif char < " ":
+            self._fail("문자열에 제어 문자가 있습니다")
+
+    def _close(self) -> None:
+        self._stack.pop()
+        self._end_value()
+
+    def _end_value(self) -> None:
+        self._token = ""
+        if self._stack:
+            self._expect = "comma_or_end"
+        else:
+            self._phase = "done"
@@ -1,6 +1,9 @@
 import logging
 import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 
+from src.common.constraints import parse_max_length, parse_range_bound
 from src.common.types import ConstraintType, LogicConstraint
 from src.runs.schemas import ConstraintResult, LogicLayerResult
 
@@ -8,176 +11,207 @@ logger = logging.getLogger(__name__)
 
 FieldValue = str | int | float | bool | None
 
+# 값 하나를 검사해 실패 메시지(통과면 None)를 반환
+ConstraintCheck = Callable[[FieldValue], str | None]
 
-def check_logic(
-    parsed_output: dict[str, FieldValue],
-    constraints: list[LogicConstraint],
-) -> LogicLayerResult:
-    """Logic Layer: constraint 기반 규칙 검증"""
-    logger.debug("Logic 검증 시작 | constraints=%d개", len(constraints))
 
-    if not constraints:
-        logger.debug("Logic 검증 생략 | 제약조건 없음")
-        return LogicLayerResult(passed=True)
+@dataclass(frozen=True)
+class CompiledConstraint:
+    """정규식·숫자 범위를 미리 해석해 둔 constraint 하나."""
+
+    constraint_type: str
+    target: str
+    check: ConstraintCheck
+    # 통과 결과는 row마다 같으므로 한 번만 만들어 공유
+    passed_result: ConstraintResult
 
-    results: list[ConstraintResult] = []
 
-    for constraint in constraints:
-        constraint_type = constraint.get("type", "")
-        target = constraint.get("target", "")
+class ConstraintPlan:
+    """Run(프로필)마다 한 번 컴파일해 모든 row에 재사용하는 constraint 검사 계획.
 
-        if target not in parsed_output:
-            logger.debug("Logic 실패 | 필드 '%s' 없음", target)
+    모든 constraint를 통과한 row는 미리 만든 같은 LogicLayerResult를 공유하므로
+    반환된 결과를 수정하면 안 된다.
+    """
+
+    def __init__(self, constraints: Sequence[LogicConstraint]):
+        self.constraints: list[CompiledConstraint] = [
+            _compile(constraint) for constraint in constraints
+        ]
+        self._checks = [(c.target, c.check) for c in self.constraints]
+        self._all_passed = LogicLayerResult.model_construct(
+            passed=True,
+            results=[c.passed_result for c in self.constraints],
+            error_message=None,
+        )
+
+    def __len__(self) -> int:
+        return len(self.constraints)
+
+    def evaluate(self, parsed_output: dict[str, FieldValue]) -> LogicLayerResult:
+        # 대부분의 row는 모두 통과하므로 메시지 없이 통과 여부만 먼저 확인
+        for target, check in self._checks:
+            if target not in parsed_output or check(parsed_output[target]) is not None:
+                return self._failed_result(parsed_output)
+        return self._all_passed
+
+    def _failed_result(self, parsed_output: dict[str, FieldValue]) -> LogicLayerResult:
+        results: list[ConstraintResult] = []
+        for constraint in self.constraints:
+            target = constraint.target
+            if target in parsed_output:
+                message = constraint.check(parsed_output[target])
+            else:
+                message = f"필드 '{target}'이(가) 출력에 존재하지 않습니다"
             results.append(
-                ConstraintResult(
-                    constraint_type=constraint_type,
+                constraint.passed_result
+                if message is None
+                else ConstraintResult.model_construct(
+                    constraint_type=constraint.constraint_type,
                     target=target,
                     passed=False,
-                    message=f"필드 '{target}'이(가) 출력에 존재하지 않습니다",
+                    message=message,
                 )
             )
-            continue
-
-        value = parsed_output[target]
-        result = _check_constraint(constraint_type, value, constraint)
-        result.target = target
-        results.append(result)
-        logger.debug(
-            "Logic 제약조건 | type=%s, target=%s, value=%s, passed=%s",
-            constraint_type,
-            target,
-            value,
-            result.passed,
+        return LogicLayerResult.model_construct(
+            passed=False, results=results, error_message=None
         )
 
-    all_passed = all(r.passed for r in results)
-    logger.debug("Logic 결과 | passed=%s, results=%d개", all_passed, len(results))
-    return LogicLayerResult(passed=all_passed, results=results)
+
+def compile_constraints(
+    constraints: Sequence[LogicConstraint] | ConstraintPlan,
+) -> ConstraintPlan:
+    """constraint 목록을 ConstraintPlan으로 컴파일 (이미 컴파일된 plan은 그대로)."""
+    if isinstance(constraints, ConstraintPlan):
+        return constraints
+    return ConstraintPlan(constraints)
+
+
+def check_logic(
+    parsed_output: dict[str, FieldValue],
+    constraints: Sequence[LogicConstraint] | ConstraintPlan,
+) -> LogicLayerResult:
+    """Logic Layer: constraint 기반 규칙 검증"""
+    plan = compile_constraints(constraints)
+    if not plan:
+        return LogicLayerResult(passed=True)
+
+    result = plan.evaluate(parsed_output)
+    logger.debug("Logic 결과 | passed=%s, results=%d개", result.passed, len(plan))
+    return result
+
+
+def _compile(constraint: LogicConstraint) -> CompiledConstraint:
+    constraint_type = constraint.get("type", "")
+    target = constraint.get("target", "")
+    return CompiledConstraint(
+        constraint_type=constraint_type,
+        target=target,
+        check=_compile_check(constraint_type, constraint),
+        passed_result=ConstraintResult.model_construct(
+            constraint_type=constraint_type, target=target, passed=True, message=None
+        ),
+    )
 
 
-def _check_constraint(
-    constraint_type: str,
-    value: FieldValue,
-    constraint: LogicConstraint,
-) -> ConstraintResult:
-    """개별 constraint 타입별 검사"""
+def _compile_check(
+    constraint_type: str, constraint: LogicConstraint
+) -> ConstraintCheck:
+    """constraint 타입별 검사 함수 생성"""
     if constraint_type == ConstraintType.CONTAINS:
-        return _check_contains(value, constraint.get("value", ""))
+        return _contains(str(constraint.get("value", "")))
 
     if constraint_type == ConstraintType.NOT_CONTAINS:
-        return _check_not_contains(value, constraint.get("value", ""))
+        return _not_contains(str(constraint.get("value", "")))
 
     if constraint_type == ConstraintType.RANGE:
-        return _check_range(value, constraint.get("min"), constraint.get("max"))
+        min_val, max_val = constraint.get("min"), constraint.get("max")
+        try:
+            lower, upper = parse_range_bound(min_val), parse_range_bound(max_val)
+        except ValueError as e:
+            return _always_fail(f"잘못된 범위 값: {e}")
+        return _range(lower, upper, min_val, max_val)
 
     if constraint_type == ConstraintType.REGEX:
-        pattern = constraint.get("pattern")
-        if pattern is None:
-            pattern = ""
-        return _check_regex(value, pattern)
+        return _regex(constraint.get("pattern") or "")
 
     if constraint_type == ConstraintType.MAX_LENGTH:
-        max_len = constraint.get("value", 0)
-        return _check_max_length(value, int(max_len) if max_len else 0)
+        # 검증 전에 저장된 잘못된 값은 Run 전체를 중단하지 않고 해당 constraint만 실패
+        try:
+            return _max_length(parse_max_length(constraint.get("value")))
+        except ValueError as e:
+            return _always_fail(f"잘못된 최대 길이: {e}")
 
-    return ConstraintResult(
-        constraint_type=constraint_type,
-        target="",
-        passed=False,
-        message=f"알 수 없는 constraint 타입: {constraint_type}",
-    )
+    return _always_fail(f"알 수 없는 constraint 타입: {constraint_type}")
 
 
-def _check_contains(value: FieldValue, expected: str | int | float) -> ConstraintResult:
-    str_value = str(value)
-    str_expected = str(expected)
-    passed = str_expected in str_value
-    return ConstraintResult(
-        constraint_type=ConstraintType.CONTAINS,
-        target="",
-        passed=passed,
-        message=None if passed else f"'{str_expected}'이(가) 포함되지 않음",
-    )
+def _always_fail(message: str) -> ConstraintCheck:
+    def check(_value: FieldValue) -> str | None:
+        return message
 
+    return check
 
-def _check_not_contains(value: FieldValue, expected: str | int | float) -> ConstraintResult:
-    str_value = str(value)
-    str_expected = str(expected)
-    passed = str_expected not in str_value
-    return ConstraintResult(
-        constraint_type=ConstraintType.NOT_CONTAINS,
-        target="",
-        passed=passed,
-        message=None if passed else f"'{str_expected}'이(가) 포함됨",
-    )
 
+def _contains(expected: str) -> ConstraintCheck:
+    failure = f"'{expected}'이(가) 포함되지 않음"
 
-def _check_range(
-    value: FieldValue, min_val: float | None, max_val: float | None
-) -> ConstraintResult:
-    if value is None:
-        return ConstraintResult(
-            constraint_type=ConstraintType.RANGE,
-            target="",
-            passed=False,
-            message="숫자가 아닌 값: None",
-        )
-    try:
-        num_value = float(value)
-    except (TypeError, ValueError):
-        return ConstraintResult(
-            constraint_type=ConstraintType.RANGE,
-            target="",
-            passed=False,
-            message=f"숫자가 아닌 값: {value}",
-        )
+    def check(value: FieldValue) -> str | None:
+        return None if expected in str(value) else failure
 
-    if min_val is not None and num_value < min_val:
-        return ConstraintResult(
-            constraint_type=ConstraintType.RANGE,
-            target="",
-            passed=False,
-            message=f"{num_value} < {min_val} (최소값 미달)",
-        )
+    return check
 
-    if max_val is not None and num_value > max_val:
-        return ConstraintResult(
-            constraint_type=ConstraintType.RANGE,
-            target="",
-            passed=False,
-            message=f"{num_value} > {max_val} (최대값 초과)",
-        )
 
-    return ConstraintResult(constraint_type=ConstraintType.RANGE, target="", passed=True)
+def _not_contains(expected: str) -> ConstraintCheck:
+    failure = f"'{expected}'이(가) 포함됨"
+
+    def check(value: FieldValue) -> str | None:
+        return failure if expected in str(value) else None
 
+    return check
 
-def _check_regex(value: FieldValue, pattern: str) -> ConstraintResult:
-    str_value = str(value)
+
+def _range(
+    lower_bound: float | None,
+    upper_bound: float | None,
+    min_val: float | None,
+    max_val: float | None,
+) -> ConstraintCheck:
+    # 범위 값은 컴파일 시 한 번만 숫자로 변환 (메시지에는 저장된 값 그대로 표시)
+    lower = lower_bound if lower_bound is not None else float("-inf")
+    upper = upper_bound if upper_bound is not None else float("inf")
+
+    def check(value: FieldValue) -> str | None:
+        if value is None:
+            return "숫자가 아닌 값: None"
+        try:
+            num_value = float(value)
+        except (TypeError, ValueError):
+            return f"숫자가 아닌 값: {value}"
+        if num_value < lower:
+            return f"{num_value} < {min_val} (최소값 미달)"
+        if num_value > upper:
+            return f"{num_value} > {max_val} (최대값 초과)"
+        return None
+
+    return check
+
+
+def _regex(pattern: str) -> ConstraintCheck:
     try:
-        passed = bool(re.match(pattern, str_value))
+        match = re.compile(pattern).match
     except re.error as e:
-        return ConstraintResult(
-            constraint_type=ConstraintType.REGEX,
-            target="",
-            passed=False,
-            message=f"잘못된 정규식 패턴: {e}",
-        )
+        # 프로필 저장 시 걸러지지만, 이전에 저장된 프로필은 row마다 실패로 기록
+        return _always_fail(f"잘못된 정규식 패턴: {e}")
+    failure = f"패턴 '{pattern}'과 불일치"
 
-    return ConstraintResult(
-        constraint_type=ConstraintType.REGEX,
-        target="",
-        passed=passed,
-        message=None if passed else f"패턴 '{pattern}'과 불일치",
-    )
+    def check(value: FieldValue) -> str | None:
+        return None if match(str(value)) else failure
 
+    return check
 
-def _check_max_length(value: FieldValue, max_len: int) -> ConstraintResult:
-    str_value = str(value)
-    actual_len = len(str_value)
-    passed = actual_len <= max_len
-    return ConstraintResult(
-        constraint_type=ConstraintType.MAX_LENGTH,
-        target="",
-        passed=passed,
-        message=None if passed else f"길이 {actual_len} > {max_len}",
-    )
+
+def _max_length(max_len: int) -> ConstraintCheck:
+    def check(value: FieldValue) -> str | None:
+        actual_len = len(str(value))
+        return None if actual_len <= max_len else f"길이 {actual_len} > {max_len}"
+
+    return check
@@ -1,13 +1,27 @@
 import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import chain
 
 import numpy as np
-from openai import OpenAI
+from openai import APIStatusError, OpenAI
 
+from src.common import metrics
+from src.config import get_settings
+from src.embeddings.cache import get_embedding_cache
+from src.embeddings.factory import get_embedding_client
 from src.prompts.models import OutputSchemaType
+from src.runs.executor import execute_rows
 from src.runs.schemas import SemanticCheckResult
 
 logger = logging.getLogger(__name__)
 
+_cache_hits = metrics.CACHE_REQUESTS.labels("embedding", "hit")
+_cache_misses = metrics.CACHE_REQUESTS.labels("embedding", "miss")
+
+type Pair = tuple[str, str]
+type ChunkEmbeddings = Sequence[list[float]] | Exception
+
 _client: OpenAI | None = None
 
 
@@ -19,13 +33,81 @@ def _get_client() -> OpenAI:
 
 
 def get_embedding(text: str) -> list[float]:
-    """OpenAI API로 텍스트를 벡터로 변환"""
+    """OpenAI API로 텍스트를 벡터로 변환 (캐시 우선 조회)"""
+    model = get_settings().EMBEDDING_MODEL
+    cache = get_embedding_cache()
+
+    cached = cache.get(model, text)
+    if cached is not None:
+        _cache_hits.inc()
+        return cached
+    _cache_misses.inc()
+
     client = _get_client()
-    response = client.embeddings.create(
-        model="text-embedding-3-small",
-        input=text,
-    )
-    return response.data[0].embedding
+    with metrics.EMBEDDING_REQUEST_SECONDS.labels(model).time():
+        response = client.embeddings.create(
+            model=model,
+            input=text,
+        )
+    embedding = response.data[0].embedding
+    cache.put(model, text, embedding)
+    return embedding
+
+
+def _lookup_cached(
+    texts: Sequence[str], model: str
+) -> tuple[dict[str, list[float]], list[str]]:
+    """캐시에서 찾은 embedding과 새로 요청해야 할 텍스트(중복 제거) 분리"""
+    cache = get_embedding_cache()
+    found: dict[str, list[float]] = {}
+    missing: list[str] = []
+    for text in dict.fromkeys(texts):
+        cached = cache.get(model, text)
+        if cached is None:
+            missing.append(text)
+        else:
+            found[text] = cached
+    _cache_hits.inc(len(found))
+    _cache_misses.inc(len(missing))
+    return found, missing
+
+
+def get_embeddings(texts: Sequence[str]) -> list[list[float]]:
+    """여러 텍스트를 한 번의 API 요청으로 벡터 변환 (캐시 우선 조회, 중복 제거)"""
+    model = get_settings().EMBEDDING_MODEL
+    cache = get_embedding_cache()
+    found, missing = _lookup_cached(texts, model)
+
+    if missing:
+        client = _get_client()
+        with metrics.EMBEDDING_REQUEST_SECONDS.labels(model).time():
+            response = client.embeddings.create(
+                model=model,
+                input=missing,
+            )
+        for item in response.data:
+            text = missing[item.index]
+            found[text] = item.embedding
+            cache.put(model, text, item.embedding)
+
+    return [found[text] for text in texts]
+
+
+async def get_embeddings_async(texts: Sequence[str]) -> list[list[float]]:
+    """get_embeddings의 비동기 버전 - 이벤트 루프를 막지 않음"""
+    model = get_settings().EMBEDDING_MODEL
+    cache = get_embedding_cache()
+    found, missing = _lookup_cached(texts, model)
+
+    if missing:
+        client = get_embedding_client(model)
+        with metrics.EMBEDDING_REQUEST_SECONDS.labels(model).time():
+            embeddings = await client.embed(missing)
+        for text, embedding in zip(missing, embeddings, strict=True):
+            found[text] = embedding
+            cache.put(model, text, embedding)
+
+    return [found[text] for text in texts]
 
 
 def cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
@@ -42,6 +124,44 @@ def cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
     return float(np.dot(a, b) / (norm_a * norm_b))
 
 
+def cosine_similarities(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """두 행렬의 행별 코사인 유사도 - 행별 내적을 노름 곱으로 나눔 (영벡터 행은 0.0)"""
+    dots = np.einsum("ij,ij->i", a, b)
+    norms = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+    similarities: np.ndarray = np.divide(
+        dots, norms, out=np.zeros_like(dots), where=norms != 0
+    )
+    return similarities
+
+
+@dataclass
+class SemanticScores:
+    """Semantic 배치 결과 (columnar) - 쌍 i의 점수는 scores[i], 통과 여부는 passed[i].
+
+    errors에는 embedding 요청이 실패한 쌍의 인덱스와 오류 메시지가 들어가며,
+    해당 쌍은 점수 0.0, 실패로 기록된다. embeddings에는 점수를 계산한 쌍의
+    (raw_output, expected_output) embedding이 들어간다.
+    """
+
+    scores: np.ndarray
+    passed: np.ndarray
+    errors: dict[int, str]
+    embeddings: dict[int, tuple[list[float], list[float]]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def result(self, index: int) -> SemanticCheckResult:
+        return SemanticCheckResult(
+            passed=bool(self.passed[index]),
+            semantic_score=float(self.scores[index]),
+            error_message=self.errors.get(index),
+        )
+
+    def results(self) -> list[SemanticCheckResult]:
+        return [self.result(i) for i in range(len(self))]
+
+
 def check_semantic(
     raw_output: str,
     expected_output: str,
@@ -73,3 +193,200 @@ def check_semantic(
 
     logger.debug("Semantic 결과 | score=%.4f, threshold=%.2f, passed=%s", score, threshold, passed)
     return SemanticCheckResult(passed=passed, semantic_score=score)
+
+
+def check_semantic_batch(
+    pairs: Sequence[tuple[str, str]],
+    output_schema: OutputSchemaType,
+    threshold: float,
+    batch_size: int | None = None,
+) -> list[SemanticCheckResult]:
+    """Semantic Layer 배치 버전: (raw_output, expected_output) 쌍들을 묶어서 embedding 요청
+
+    요청당 최대 batch_size개 텍스트(= batch_size // 2 쌍)를 보내며,
+    요청이 실패하면 해당 묶음의 쌍만 오류 결과가 되고, 4xx로 거부되면 묶음을 나눠 문제 쌍만 남긴다.
+    """
+    return score_semantic_batch(pairs, output_schema, threshold, batch_size).results()
+
+
+def score_semantic_batch(
+    pairs: Sequence[tuple[str, str]],
+    output_schema: OutputSchemaType,
+    threshold: float,
+    batch_size: int | None = None,
+) -> SemanticScores:
+    """check_semantic_batch의 columnar 버전 - 모든 쌍의 점수를 행렬 연산 한 번으로 계산"""
+    if output_schema == OutputSchemaType.LABEL:
+        return _label_scores(len(pairs))
+
+    def _embed_chunk(
+        chunk: Sequence[Pair],
+    ) -> list[tuple[Sequence[Pair], ChunkEmbeddings]]:
+        texts = [text for pair in chunk for text in pair]
+        try:
+            return [(chunk, get_embeddings(texts))]
+        except Exception as e:
+            if not _should_bisect(chunk, e):
+                return [(chunk, e)]
+            middle = len(chunk) // 2
+            return [*_embed_chunk(chunk[:middle]), *_embed_chunk(chunk[middle:])]
+
+    results = [
+        piece
+        for chunk in _chunk_pairs(pairs, batch_size)
+        for piece in _embed_chunk(chunk)
+    ]
+    return _score_chunks(
+        [chunk for chunk, _ in results],
+        [embeddings for _, embeddings in results],
+        threshold,
+    )
+
+
+async def check_semantic_async(
+    raw_output: str,
+    expected_output: str,
+    output_schema: OutputSchemaType,
+    threshold: float,
+) -> SemanticCheckResult:
+    """check_semantic의 비동기 버전"""
+    results = await check_semantic_batch_async(
+        [(raw_output, expected_output)], output_schema, threshold
+    )
+    return results[0]
+
+
+async def check_semantic_batch_async(
+    pairs: Sequence[tuple[str, str]],
+    output_schema: OutputSchemaType,
+    threshold: float,
+    batch_size: int | None = None,
+) -> list[SemanticCheckResult]:
+    """check_semantic_batch의 비동기 버전 - 묶음 요청들을 EMBEDDING_CONCURRENCY개씩 동시 전송"""
+    scores = await score_semantic_batch_async(pairs, output_schema, threshold, batch_size)
+    return scores.results()
+
+
+async def score_semantic_batch_async(
+    pairs: Sequence[tuple[str, str]],
+    output_schema: OutputSchemaType,
+    threshold: float,
+    batch_size: int | None = None,
+) -> SemanticScores:
+    """score_semantic_batch의 비동기 버전"""
+    if output_schema == OutputSchemaType.LABEL:
+        return _label_scores(len(pairs))
+
+    async def _embed_chunk(
+        chunk: Sequence[Pair],
+    ) -> list[tuple[Sequence[Pair], ChunkEmbeddings]]:
+        texts = [text for pair in chunk for text in pair]
+        try:
+            return [(chunk, await get_embeddings_async(texts))]
+        except Exception as e:
+            if not _should_bisect(chunk, e):
+                return [(chunk, e)]
+            middle = len(chunk) // 2
+            return [
+                *await _embed_chunk(chunk[:middle]),
+                *await _embed_chunk(chunk[middle:]),
+            ]
+
+    chunk_results = await execute_rows(
+        _chunk_pairs(pairs, batch_size),
+        _embed_chunk,
+        concurrency=get_settings().EMBEDDING_CONCURRENCY,
+    )
+    results = [piece for pieces in chunk_results for piece in pieces]
+    return _score_chunks(
+        [chunk for chunk, _ in results],
+        [embeddings for _, embeddings in results],
+        threshold,
+    )
+
+
+def _should_bisect(chunk: Sequence[Pair], error: Exception) -> bool:
+    """요청 자체가 거부된 4xx(429 제외)면 묶음을 반으로 나눠 문제 쌍만 실패로 남김.
+
+    너무 길거나 빈 출력 하나 때문에 묶음 전체가 실패하지 않도록 한다. 일시적 오류
+    (429, 5xx, 연결 오류)는 특정 텍스트 때문이 아니므로 나누지 않고 묶음 전체를 실패로 기록한다.
+    """
+    return (
+        len(chunk) > 1
+        and isinstance(error, APIStatusError)
+        and 400 <= error.status_code < 500
+        and error.status_code != 429
+    )
+
+
+def _chunk_pairs(
+    pairs: Sequence[tuple[str, str]], batch_size: int | None
+) -> list[Sequence[tuple[str, str]]]:
+    """요청당 텍스트 수가 batch_size를 넘지 않도록 쌍 목록 분할"""
+    size = batch_size or get_settings().EMBEDDING_BATCH_SIZE
+    pairs_per_request = max(1, size // 2)
+    logger.debug("Semantic 배치 검증 | pairs=%d, batch_size=%d", len(pairs), size)
+    return [
+        pairs[start : start + pairs_per_request]
+        for start in range(0, len(pairs), pairs_per_request)
+    ]
+
+
+def _label_scores(count: int) -> SemanticScores:
+    return SemanticScores(
+        scores=np.ones(count), passed=np.ones(count, dtype=bool), errors={}
+    )
+
+
+def _score_chunks(
+    chunks: Sequence[Sequence[tuple[str, str]]],
+    embeddings: Sequence[Sequence[list[float]] | Exception],
+    threshold: float,
+) -> SemanticScores:
+    """묶음별 [raw0, expected0, raw1, expected1, ...] embedding을 모아 한 번에 점수 계산
+
+    요청이 실패한 묶음의 쌍은 오류로 기록하고 점수 0.0으로 남긴다.
+    """
+    count = sum(len(chunk) for chunk in chunks)
+    scores = np.zeros(count)
+    errors: dict[int, str] = {}
+    pair_embeddings: dict[int, tuple[list[float], list[float]]] = {}
+    scored: list[int] = []
+    vectors: list[list[float]] = []
+
+    start = 0
+    for chunk, chunk_embeddings in zip(chunks, embeddings, strict=True):
+        indices = range(start, start + len(chunk))
+        start += len(chunk)
+        if isinstance(chunk_embeddings, Exception):
+            logger.warning(
+                "Embedding API 오류 | pairs=%d, error=%s",
+                len(chunk),
+                str(chunk_embeddings),
+            )
+            errors.update(
+                dict.fromkeys(indices, f"Embedding API 오류: {chunk_embeddings}")
+            )
+            continue
+        scored.extend(indices)
+        vectors.extend(chunk_embeddings)
+        for offset, index in enumerate(indices):
+            pair_embeddings[index] = (
+                chunk_embeddings[2 * offset],
+                chunk_embeddings[2 * offset + 1],
+            )
+
+    if scored:
+        # list[float] → ndarray 변환이 대부분의 비용이라 중간 리스트 없이 바로 채움
+        dim = len(vectors[0])
+        matrix = np.fromiter(
+            chain.from_iterable(vectors), dtype=np.float64, count=len(vectors) * dim
+        ).reshape(len(vectors), dim)
+        scores[scored] = cosine_similarities(matrix[0::2], matrix[1::2])
+
+    passed = scores >= threshold
+    if errors:
+        passed[list(errors)] = False
+    return SemanticScores(
+        scores=scores, passed=passed, errors=errors, embeddings=pair_embeddings
+    )
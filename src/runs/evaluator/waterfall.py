@@ -1,13 +1,31 @@
 import logging
+import time
+from collections import Counter
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
 
 from src.common.types import LogicConstraint
 from src.prompts.models import OutputSchemaType
 from src.runs.evaluator.format_layer import check_format
-from src.runs.evaluator.logic_layer import FieldValue, check_logic
-from src.runs.evaluator.semantic_layer import check_semantic
+from src.runs.evaluator.logic_layer import (
+    ConstraintPlan,
+    FieldValue,
+    check_logic,
+    compile_constraints,
+)
+from src.runs.evaluator.semantic_layer import (
+    SemanticScores,
+    check_semantic,
+    score_semantic_batch,
+    score_semantic_batch_async,
+)
 from src.runs.models import ResultStatus
 from src.runs.schemas import (
     FormatCheckResult,
+    LogicLayerResult,
+    SemanticCheckResult,
     WaterfallResult,
 )
 
@@ -19,7 +37,7 @@ def evaluate_waterfall(
     output_schema: OutputSchemaType,
     expected_output: str,
     threshold: float,
-    constraints: list[LogicConstraint],
+    constraints: Sequence[LogicConstraint] | ConstraintPlan,
 ) -> WaterfallResult:
     """3-Layer Waterfall 평가 (fail-fast)"""
     logger.info(
@@ -49,6 +67,297 @@ def evaluate_waterfall(
     semantic_result = check_semantic(
         raw_output, expected_output, output_schema, threshold
     )
+    return _finish_waterfall(format_result, semantic_result, threshold, constraints)
+
+
+@dataclass
+class WaterfallBatchResult:
+    """Waterfall 배치 평가 결과 (columnar) - row마다 WaterfallResult를 만들지 않음.
+
+    semantic_scores는 Format 실패 row에서 0.0이고, logic_results에는 Semantic까지
+    통과해 Logic을 실행한 row만 들어간다. 모든 constraint를 통과한 row들은 같은
+    LogicLayerResult를 공유하므로 수정하면 안 된다.
+    output_embeddings/expected_embeddings에는 이번 평가에서 embedding을 계산한
+    row만 들어간다 (known_scores로 점수를 받은 row는 제외).
+    layer_seconds는 레이어별 row 소요 시간(초, 실행하지 않은 row는 0)이며, Semantic은
+    배치 전체 시간을 embedding을 요청한 row 수로 나눈 값이다.
+    """
+
+    statuses: list[ResultStatus]
+    format_results: list[FormatCheckResult]
+    semantic_scores: np.ndarray
+    semantic_errors: dict[int, str]
+    logic_results: dict[int, LogicLayerResult]
+    output_embeddings: dict[int, list[float]] = field(default_factory=dict)
+    expected_embeddings: dict[int, list[float]] = field(default_factory=dict)
+    layer_seconds: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.statuses)
+
+    def __getitem__(self, index: int) -> WaterfallResult:
+        """index번째 row를 WaterfallResult로 변환"""
+        status = self.statuses[index]
+        format_result = self.format_results[index]
+        if status == ResultStatus.FORMAT:
+            return WaterfallResult(status=status, format_result=format_result)
+        return WaterfallResult(
+            status=status,
+            format_result=format_result,
+            semantic_result=SemanticCheckResult(
+                passed=status != ResultStatus.SEMANTIC,
+                semantic_score=float(self.semantic_scores[index]),
+                error_message=self.semantic_errors.get(index),
+            ),
+            logic_result=self.logic_results.get(index),
+        )
+
+    def __iter__(self) -> Iterator[WaterfallResult]:
+        return (self[i] for i in range(len(self)))
+
+    def status_counts(self) -> Counter[ResultStatus]:
+        return Counter(self.statuses)
+
+
+def evaluate_waterfall_batch(
+    raw_outputs: Sequence[str],
+    expected_outputs: Sequence[str],
+    output_schema: OutputSchemaType,
+    threshold: float,
+    constraints: Sequence[LogicConstraint] | ConstraintPlan,
+    format_errors: Mapping[int, str] | None = None,
+    known_scores: Mapping[int, float] | None = None,
+) -> WaterfallBatchResult:
+    """3-Layer Waterfall 배치 평가
+
+    모든 row의 Format을 검사한 뒤, 통과 row들의 embedding을 묶어서 요청해
+    Semantic 점수를 행렬 연산 한 번으로 계산하고, Semantic 통과 row만 Logic을 실행한다.
+
+    Args:
+        format_errors: 이미 Format 실패로 판정된 row (인덱스 → 오류 메시지) -
+            스트리밍 검증으로 생성을 중단한 row 등, 다시 검사하지 않음
+        known_scores: 이미 계산된 Semantic 점수 (인덱스 → 점수) - 저장된 embedding으로
+            SQL에서 계산한 점수 등, embedding을 다시 요청하지 않음 (Label 스키마는 무시)
+    """
+    format_results, survivors, format_seconds = _check_format_batch(
+        raw_outputs,
+        expected_outputs,
+        output_schema,
+        threshold,
+        constraints,
+        format_errors,
+    )
+    known, pending = _split_known_scores(survivors, output_schema, known_scores)
+
+    # Layer 2: Semantic Check (Format 통과 row 중 점수가 없는 row만 배치 요청)
+    started = time.perf_counter()
+    semantic_scores = score_semantic_batch(
+        [(raw_outputs[i], expected_outputs[i]) for i in pending],
+        output_schema,
+        threshold,
+    )
+    semantic_seconds = time.perf_counter() - started
+    return _merge_batch(
+        format_results,
+        survivors,
+        pending,
+        semantic_scores,
+        known,
+        threshold,
+        compile_constraints(constraints),
+        format_seconds,
+        semantic_seconds,
+    )
+
+
+async def evaluate_waterfall_async(
+    raw_output: str,
+    output_schema: OutputSchemaType,
+    expected_output: str,
+    threshold: float,
+    constraints: Sequence[LogicConstraint] | ConstraintPlan,
+) -> WaterfallResult:
+    """evaluate_waterfall의 비동기 버전 - Semantic embedding 요청이 이벤트 루프를 막지 않음"""
+    results = await evaluate_waterfall_batch_async(
+        [raw_output], [expected_output], output_schema, threshold, constraints
+    )
+    return results[0]
+
+
+async def evaluate_waterfall_batch_async(
+    raw_outputs: Sequence[str],
+    expected_outputs: Sequence[str],
+    output_schema: OutputSchemaType,
+    threshold: float,
+    constraints: Sequence[LogicConstraint] | ConstraintPlan,
+    format_errors: Mapping[int, str] | None = None,
+    known_scores: Mapping[int, float] | None = None,
+) -> WaterfallBatchResult:
+    """evaluate_waterfall_batch의 비동기 버전"""
+    format_results, survivors, format_seconds = _check_format_batch(
+        raw_outputs,
+        expected_outputs,
+        output_schema,
+        threshold,
+        constraints,
+        format_errors,
+    )
+    known, pending = _split_known_scores(survivors, output_schema, known_scores)
+
+    # Layer 2: Semantic Check (Format 통과 row 중 점수가 없는 row만 배치 요청)
+    started = time.perf_counter()
+    semantic_scores = await score_semantic_batch_async(
+        [(raw_outputs[i], expected_outputs[i]) for i in pending],
+        output_schema,
+        threshold,
+    )
+    semantic_seconds = time.perf_counter() - started
+    return _merge_batch(
+        format_results,
+        survivors,
+        pending,
+        semantic_scores,
+        known,
+        threshold,
+        compile_constraints(constraints),
+        format_seconds,
+        semantic_seconds,
+    )
+
+
+def _check_format_batch(
+    raw_outputs: Sequence[str],
+    expected_outputs: Sequence[str],
+    output_schema: OutputSchemaType,
+    threshold: float,
+    constraints: Sequence[LogicConstraint] | ConstraintPlan,
+    format_errors: Mapping[int, str] | None,
+) -> tuple[list[FormatCheckResult], list[int], list[float]]:
+    """배치 Layer 1: 모든 row의 Format 검사 후 (결과, 통과 row 인덱스, row별 소요 시간) 반환"""
+    if len(raw_outputs) != len(expected_outputs):
+        raise ValueError("raw_outputs와 expected_outputs 길이가 다릅니다")
+
+    logger.info(
+        "Waterfall 배치 평가 시작 | rows=%d, schema=%s, threshold=%.2f, constraints=%d개",
+        len(raw_outputs),
+        output_schema.value,
+        threshold,
+        len(constraints),
+    )
+
+    format_errors = format_errors or {}
+    format_results: list[FormatCheckResult] = []
+    format_seconds: list[float] = []
+    for i, (raw, expected) in enumerate(
+        zip(raw_outputs, expected_outputs, strict=True)
+    ):
+        if i in format_errors:
+            format_results.append(
+                FormatCheckResult(passed=False, error_message=format_errors[i])
+            )
+            format_seconds.append(0.0)
+            continue
+        started = time.perf_counter()
+        format_results.append(check_format(raw, output_schema, expected))
+        format_seconds.append(time.perf_counter() - started)
+    survivors = [i for i, r in enumerate(format_results) if r.passed]
+    return format_results, survivors, format_seconds
+
+
+def _split_known_scores(
+    survivors: list[int],
+    output_schema: OutputSchemaType,
+    known_scores: Mapping[int, float] | None,
+) -> tuple[dict[int, float], list[int]]:
+    """Format 통과 row를 (점수를 이미 아는 row, embedding 요청이 필요한 row)로 분리"""
+    if not known_scores or output_schema == OutputSchemaType.LABEL:
+        return {}, survivors
+    known = {i: known_scores[i] for i in survivors if i in known_scores}
+    return known, [i for i in survivors if i not in known]
+
+
+def _merge_batch(
+    format_results: list[FormatCheckResult],
+    survivors: list[int],
+    pending: list[int],
+    semantic_scores: SemanticScores,
+    known_scores: dict[int, float],
+    threshold: float,
+    plan: ConstraintPlan,
+    format_seconds: list[float],
+    semantic_seconds: float,
+) -> WaterfallBatchResult:
+    """배치 Semantic 점수를 각 row에 되돌려 주고 Semantic 통과 row만 Logic 실행"""
+    statuses = [ResultStatus.FORMAT] * len(format_results)
+    scores = np.zeros(len(format_results))
+    passed = np.zeros(len(format_results), dtype=bool)
+    scores[pending] = semantic_scores.scores
+    passed[pending] = semantic_scores.passed
+    if known_scores:
+        known_rows = list(known_scores)
+        scores[known_rows] = list(known_scores.values())
+        passed[known_rows] = scores[known_rows] >= threshold
+    semantic_errors = {
+        pending[i]: message for i, message in semantic_scores.errors.items()
+    }
+
+    semantic_per_row = np.zeros(len(format_results))
+    if pending:
+        semantic_per_row[pending] = semantic_seconds / len(pending)
+    logic_seconds = np.zeros(len(format_results))
+
+    logic_results: dict[int, LogicLayerResult] = {}
+    for index in survivors:
+        if not passed[index]:
+            statuses[index] = ResultStatus.SEMANTIC
+            continue
+        # Layer 3: Logic Check
+        started = time.perf_counter()
+        logic_result = plan.evaluate(_get_parsed_output(format_results[index]))
+        logic_seconds[index] = time.perf_counter() - started
+        logic_results[index] = logic_result
+        statuses[index] = (
+            ResultStatus.PASS if logic_result.passed else ResultStatus.LOGIC
+        )
+
+    result = WaterfallBatchResult(
+        statuses=statuses,
+        format_results=format_results,
+        semantic_scores=scores,
+        semantic_errors=semantic_errors,
+        logic_results=logic_results,
+        output_embeddings={
+            pending[i]: raw for i, (raw, _) in semantic_scores.embeddings.items()
+        },
+        expected_embeddings={
+            pending[i]: expected
+            for i, (_, expected) in semantic_scores.embeddings.items()
+        },
+        layer_seconds={
+            "format": np.array(format_seconds),
+            "semantic": semantic_per_row,
+            "logic": logic_seconds,
+        },
+    )
+    counts = result.status_counts()
+    logger.info(
+        "Waterfall 배치 평가 완료 | rows=%d, pass=%d, format=%d, semantic=%d, logic=%d",
+        len(result),
+        counts[ResultStatus.PASS],
+        counts[ResultStatus.FORMAT],
+        counts[ResultStatus.SEMANTIC],
+        counts[ResultStatus.LOGIC],
+    )
+    return result
+
+
+def _finish_waterfall(
+    format_result: FormatCheckResult,
+    semantic_result: SemanticCheckResult,
+    threshold: float,
+    constraints: Sequence[LogicConstraint] | ConstraintPlan,
+) -> WaterfallResult:
+    """Format 통과 이후 단계: Semantic 결과 판정 → Logic Check"""
     logger.info(
         "Layer2 Semantic | passed=%s, score=%.4f, threshold=%.2f",
         semantic_result.passed,
@@ -68,9 +377,10 @@ def evaluate_waterfall(
     parsed_output = _get_parsed_output(format_result)
     logic_result = check_logic(parsed_output, constraints)
     logger.info(
-        "Layer3 Logic | passed=%s, results=%s",
+        "Layer3 Logic | passed=%s, failed=%d/%d",
         logic_result.passed,
-        [r.model_dump() for r in (logic_result.results or [])],
+        sum(not r.passed for r in logic_result.results),
+        len(logic_result.results),
     )
 
     if not logic_result.passed:
@@ -0,0 +1,207 @@
+"""Run 진행 이벤트 - Postgres LISTEN/NOTIFY로 워커에서 API 프로세스로 전달.
+
+워커는 결과 배치를 저장하는 트랜잭션 안에서 publish()로 NOTIFY를 보내므로 이벤트는
+commit된 결과와 항상 일치한다. API 프로세스는 RunEventBroker 하나가 전용 연결 하나로
+LISTEN하고 받은 이벤트를 구독자(SSE 연결)별 큐로 나눠 주므로, 구독자 수가 늘어도
+DB 부하는 늘지 않는다.
+
+이벤트 종류:
+- rows: 저장된 row 목록 ({"rows": [{"datasetRowId", "status"}, ...]})
+- progress: 집계 카운터 (RunProgressResponse)
+- status: Run 종료 ({"status": "completed" | "failed"}) - 스트림의 마지막 이벤트
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import asyncpg
+from sqlalchemy import Text, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_settings
+from src.runs.schemas import RunProgressResponse
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "run_events"
+
+# NOTIFY payload 상한(8000바이트)보다 여유 있게 rows 이벤트를 나눔
+MAX_PAYLOAD_BYTES = 7000
+
+# 느린 구독자 큐 상한 - 넘치면 오래된 이벤트부터 버림 (progress는 누적값이라 최신만 있으면 됨)
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class RunEvent:
+    run_id: int
+    event: str
+    data: dict[str, Any]
+
+    def to_sse(self) -> str:
+        return f"event: {self.event}\ndata: {json.dumps(self.data, ensure_ascii=False)}\n\n"
+
+
+def progress_event(progress: RunProgressResponse) -> RunEvent:
+    return RunEvent(
+        progress.run_id, "progress", progress.model_dump(mode="json", by_alias=True)
+    )
+
+
+def row_events(run_id: int, rows: Sequence[tuple[int, str]]) -> list[RunEvent]:
+    """(dataset_row_id, status) 목록을 NOTIFY payload 상한 안의 rows 이벤트들로 분할."""
+    events: list[RunEvent] = []
+    chunk: list[dict[str, Any]] = []
+    size = 0
+    for dataset_row_id, status in rows:
+        row = {"datasetRowId": dataset_row_id, "status": status}
+        # 구분자 ", " 포함
+        row_size = len(json.dumps(row)) + 2
+        if chunk and size + row_size > MAX_PAYLOAD_BYTES:
+            events.append(RunEvent(run_id, "rows", {"rows": chunk}))
+            chunk, size = [], 0
+        chunk.append(row)
+        size += row_size
+    if chunk:
+        events.append(RunEvent(run_id, "rows", {"rows": chunk}))
+    return events
+
+
+async def publish(session: AsyncSession, events: Sequence[RunEvent]) -> None:
+    """이벤트를 NOTIFY (현재 트랜잭션이 commit될 때 전달, commit은 호출자 책임)."""
+    if not events:
+        return
+    payloads = [
+        json.dumps(
+            {"runId": e.run_id, "event": e.event, "data": e.data}, ensure_ascii=False
+        )
+        for e in events
+    ]
+    # 이벤트 수와 무관하게 한 번의 왕복으로 전송
+    payload = (
+        func.unnest(literal(payloads, ARRAY(Text)))
+        .table_valued("payload")
+        .render_derived(name="payloads")
+    )
+    await session.execute(
+        select(func.pg_notify(CHANNEL, payload.c.payload)).select_from(payload)
+    )
+
+
+class RunEventBroker:
+    """프로세스당 LISTEN 연결 하나로 받은 이벤트를 Run별 구독자 큐로 분배.
+
+    연결은 첫 구독 때 만들고, 끊기면 구독 중인 스트림을 모두 끝낸다
+    (SSE 클라이언트는 다시 연결하며 새 LISTEN 연결을 만든다).
+    큐에 들어가는 None은 스트림 종료 신호다.
+    """
+
+    def __init__(self, database_url: str):
+        # SQLAlchemy URL(postgresql+asyncpg://)을 asyncpg DSN으로 변환
+        self._dsn = (
+            make_url(database_url)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        self._connection: asyncpg.Connection | None = None
+        self._connect_lock = asyncio.Lock()
+        self._subscribers: dict[int, set[asyncio.Queue[RunEvent | None]]] = {}
+
+    async def start(self) -> None:
+        if self._connection is not None:
+            return
+        async with self._connect_lock:
+            if self._connection is not None:
+                return
+            connection = await asyncpg.connect(self._dsn)
+            connection.add_termination_listener(self._on_terminated)
+            await connection.add_listener(CHANNEL, self._on_notify)
+            self._connection = connection
+            logger.info("Run 이벤트 LISTEN 시작 | channel=%s", CHANNEL)
+
+    async def close(self) -> None:
+        connection, self._connection = self._connection, None
+        self._end_streams()
+        if connection is not None and not connection.is_closed():
+            await connection.close()
+
+    @asynccontextmanager
+    async def subscribe(
+        self, run_id: int
+    ) -> AsyncIterator[asyncio.Queue[RunEvent | None]]:
+        """run_id 이벤트를 받을 큐 (블록을 벗어나면 구독 해제)."""
+        await self.start()
+        queue: asyncio.Queue[RunEvent | None] = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(run_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(run_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[run_id]
+
+    def subscriber_count(self, run_id: int) -> int:
+        return len(self._subscribers.get(run_id, ()))
+
+    def _on_notify(
+        self,
+        connection: asyncpg.Connection,  # noqa: ARG002
+        pid: int,  # noqa: ARG002
+        channel: str,  # noqa: ARG002
+        payload: str,
+    ) -> None:
+        try:
+            message = json.loads(payload)
+            event = RunEvent(message["runId"], message["event"], message["data"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning("잘못된 Run 이벤트 무시 | payload=%.200s", payload)
+            return
+        for queue in self._subscribers.get(event.run_id, ()):
+            _put_latest(queue, event)
+
+    def _on_terminated(self, connection: asyncpg.Connection) -> None:  # noqa: ARG002
+        logger.warning(
+            "Run 이벤트 LISTEN 연결 끊김 | subscribers=%d", len(self._subscribers)
+        )
+        self._connection = None
+        self._end_streams()
+
+    def _end_streams(self) -> None:
+        for queues in self._subscribers.values():
+            for queue in queues:
+                _put_latest(queue, None)
+
+
+def _put_latest(queue: asyncio.Queue[RunEvent | None], item: RunEvent | None) -> None:
+    """큐가 가득 차면 가장 오래된 항목을 버리고 추가."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+_broker: RunEventBroker | None = None
+
+
+def get_run_event_broker() -> RunEventBroker:
+    """프로세스 전역 RunEventBroker (API 종료 시 close_run_event_broker()로 정리)."""
+    global _broker
+    if _broker is None:
+        settings = get_settings()
+        _broker = RunEventBroker(settings.DATABASE_LISTEN_URL or settings.DATABASE_URL)
+    return _broker
+
+
+async def close_run_event_broker() -> None:
+    global _broker
+    broker, _broker = _broker, None
+    if broker is not None:
+        await broker.close()
@@ -0,0 +1,37 @@
+"""Run row 동시 실행 엔진.
+
+Run 단위 동시성(RUN_CONCURRENCY)을 제한한다. 모델 단위 동시성과 요청 속도는
+프로세스 내 모든 Run이 공유하는 src.llm.ratelimit에서 제한한다.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+
+
+async def execute_rows[T, R](
+    items: Sequence[T],
+    handler: Callable[[T], Awaitable[R]],
+    concurrency: int,
+) -> list[R]:
+    """items를 최대 concurrency개씩 동시에 처리하고 입력 순서대로 결과 반환.
+
+    하나라도 실패하면 나머지 작업은 취소되고 예외가 전파된다.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency는 1 이상이어야 합니다: {concurrency}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    results: list[R | None] = [None] * len(items)
+
+    async def _run(index: int, item: T) -> None:
+        async with semaphore:
+            results[index] = await handler(item)
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for index, item in enumerate(items):
+                tg.create_task(_run(index, item))
+    except* Exception as eg:
+        raise eg.exceptions[0] from None
+
+    return results  # type: ignore[return-value]
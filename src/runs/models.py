@@ -1,12 +1,16 @@
 from datetime import UTC, datetime
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Any, ClassVar
 from uuid import UUID
 
-from sqlalchemy import Column, DateTime
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
 from sqlmodel import Field, SQLModel
 
+from src.embeddings.models import cosine_index
+
 
 class RunStatus(str, Enum):
     """실행 상태."""
@@ -25,6 +29,15 @@ class ResultStatus(str, Enum):
     LOGIC = "logic"
 
 
+class JobStatus(StrEnum):
+    """Run 작업 큐 상태."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
 class Run(SQLModel, table=True):
     """실행 마스터 - 프롬프트 버전 + 데이터셋 + 프로필 조합."""
 
@@ -35,6 +48,13 @@ class Run(SQLModel, table=True):
     dataset_id: int = Field(foreign_key="datasets.id", index=True)
     profile_id: int = Field(foreign_key="evaluator_profiles.id", index=True)
     status: RunStatus = Field(default=RunStatus.RUNNING)
+    # temperature와 무관하게 LLM 생성 캐시 사용
+    use_generation_cache: bool = Field(default=False)
+    # provider 배치 API로 생성 (batch_job_id: 제출된 배치 작업 ID)
+    use_batch_api: bool = Field(default=False)
+    batch_job_id: str | None = Field(default=None)
+    # 재채점 Run이면 raw_output을 가져올 원본 Run
+    source_run_id: int | None = Field(default=None, foreign_key="runs.id", index=True)
     user_id: int | None = Field(default=None, foreign_key="users.id", index=True)
     guest_id: UUID | None = Field(default=None, foreign_key="guests.id", index=True)
     created_at: datetime = Field(
@@ -43,10 +63,21 @@ class Run(SQLModel, table=True):
     )
 
 
+_output_embedding = Column("output_embedding", Vector(), nullable=True)
+
+
 class RunResult(SQLModel, table=True):
     """실행 결과 상세 - Live Playground의 핵심 자산."""
 
     __tablename__: ClassVar[str] = "run_results"
+    __table_args__ = (
+        # Run 상세 결과 keyset 페이지네이션 (run_id, id)
+        Index("ix_run_results_run_id_id", "run_id", "id"),
+        # 전체 Run에 걸친 유사 출력 검색
+        cosine_index("ix_run_results_output_embedding_hnsw", _output_embedding),
+    )
+    # 벡터는 SQL(<=>)에서만 사용하므로 결과 조회 시 기본으로 읽지 않음
+    __mapper_args__ = {"properties": {"output_embedding": deferred(_output_embedding)}}
 
     id: int | None = Field(default=None, primary_key=True)
     run_id: int = Field(foreign_key="runs.id", index=True)
@@ -65,6 +96,11 @@ class RunResult(SQLModel, table=True):
 
     # Layer 2: Semantic Score
     semantic_score: float = Field(default=0.0)
+    # raw_output의 embedding (Format 통과 row만, output_embedding_model로 계산)
+    output_embedding: list[float] | None = Field(
+        default=None, sa_column=_output_embedding
+    )
+    output_embedding_model: str | None = None
 
     # Layer 3: Logic Results
     logic_results: dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
@@ -72,3 +108,44 @@ class RunResult(SQLModel, table=True):
     status: ResultStatus = Field(index=True)
 
     trace: dict[str, Any] | None = Field(default=None, sa_column=Column(JSONB))
+
+
+class RunJob(SQLModel, table=True):
+    """Run 작업 큐 - 워커 프로세스가 SELECT ... FOR UPDATE SKIP LOCKED로 가져감."""
+
+    __tablename__: ClassVar[str] = "run_jobs"
+
+    id: int | None = Field(default=None, primary_key=True)
+    run_id: int = Field(foreign_key="runs.id", unique=True)
+    status: JobStatus = Field(default=JobStatus.QUEUED, index=True)
+    attempts: int = Field(default=0)
+    locked_by: str | None = None
+    locked_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
+    last_error: str | None = None
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(DateTime(timezone=True)),
+    )
+
+
+class RunAggregate(SQLModel, table=True):
+    """Run별 집계 지표 - 결과 저장 시 증분 갱신, Run 완료 시 확정."""
+
+    __tablename__: ClassVar[str] = "run_metrics"
+
+    run_id: int = Field(foreign_key="runs.id", primary_key=True)
+    # Run이 처리할 전체 row 수 (처리 시작 시 기록, 진행률 계산용)
+    target_count: int | None = None
+    total_count: int = Field(default=0)
+    pass_count: int = Field(default=0)
+    format_pass_count: int = Field(default=0)
+    semantic_pass_count: int = Field(default=0)
+    semantic_score_sum: float = Field(default=0.0)
+    generation_cache_hits: int = Field(default=0)
+    generation_cache_misses: int = Field(default=0)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(DateTime(timezone=True)),
+    )
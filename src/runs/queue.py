@@ -0,0 +1,177 @@
+"""Postgres 기반 Run 작업 큐.
+
+API는 Run과 함께 RunJob을 같은 트랜잭션으로 저장하고, 워커 프로세스들이
+SELECT ... FOR UPDATE SKIP LOCKED로 서로 겹치지 않게 작업을 가져간다.
+워커는 주기적으로 locked_at을 갱신(heartbeat)하며, 갱신이 끊긴 작업은
+RUN_JOB_STALE_SECONDS 이후 다른 워커가 다시 가져간다. 이미 RUN_JOB_MAX_ATTEMPTS번
+시도한 작업은 다시 나눠 주지 않고 FAILED로 끝낸다 (워커를 죽이는 Run이 무한히 반복되지 않음).
+"""
+
+import logging
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col, func, select
+
+from src.config import get_settings
+from src.runs import events
+from src.runs.events import RunEvent
+from src.runs.models import JobStatus, Run, RunJob, RunStatus
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_run(session: AsyncSession, run_id: int) -> RunJob:
+    """Run 실행 작업 등록 (commit은 호출자 책임)."""
+    job = RunJob(run_id=run_id)
+    session.add(job)
+    return job
+
+
+async def claim_jobs(
+    session: AsyncSession,
+    worker_id: str,
+    limit: int,
+) -> list[RunJob]:
+    """대기 중이거나 heartbeat가 끊긴 작업을 최대 limit개 가져와 점유."""
+    if limit <= 0:
+        return []
+
+    settings = get_settings()
+    now = datetime.now(UTC)
+    stale_before = now - timedelta(seconds=settings.RUN_JOB_STALE_SECONDS)
+    await _fail_exhausted_jobs(session, stale_before, settings.RUN_JOB_MAX_ATTEMPTS)
+
+    stmt = (
+        select(RunJob)
+        .where(
+            or_(
+                col(RunJob.status) == JobStatus.QUEUED,
+                (col(RunJob.status) == JobStatus.RUNNING)
+                & (col(RunJob.locked_at) < stale_before)
+                & (col(RunJob.attempts) < settings.RUN_JOB_MAX_ATTEMPTS),
+            )
+        )
+        .order_by(col(RunJob.id))
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    jobs = list((await session.execute(stmt)).scalars().all())
+
+    for job in jobs:
+        job.status = JobStatus.RUNNING
+        job.locked_by = worker_id
+        job.locked_at = now
+        job.attempts += 1
+
+    await session.commit()
+    return jobs
+
+
+async def _fail_exhausted_jobs(
+    session: AsyncSession, stale_before: datetime, max_attempts: int
+) -> None:
+    """heartbeat가 끊긴 채 최대 시도 횟수를 채운 작업과 그 Run을 FAILED로 (commit은 호출자 책임)."""
+    error = f"워커가 응답 없이 중단됨 ({max_attempts}회 시도)"
+    run_ids = list(
+        (
+            await session.execute(
+                update(RunJob)
+                .where(
+                    col(RunJob.status) == JobStatus.RUNNING,
+                    col(RunJob.locked_at) < stale_before,
+                    col(RunJob.attempts) >= max_attempts,
+                )
+                .values(
+                    status=JobStatus.FAILED,
+                    last_error=error,
+                    locked_by=None,
+                    locked_at=None,
+                )
+                .returning(col(RunJob.run_id))
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if not run_ids:
+        return
+
+    await session.execute(
+        update(Run)
+        .where(col(Run.id).in_(run_ids), col(Run.status) == RunStatus.RUNNING)
+        .values(status=RunStatus.FAILED)
+    )
+    await events.publish(
+        session,
+        [
+            RunEvent(run_id, "status", {"status": RunStatus.FAILED.value})
+            for run_id in run_ids
+        ],
+    )
+    logger.warning("중단된 작업 실패 처리 | run_ids=%s", run_ids)
+
+
+async def heartbeat(session: AsyncSession, worker_id: str, job_ids: list[int]) -> None:
+    """실행 중인 작업의 locked_at 갱신."""
+    if not job_ids:
+        return
+    await session.execute(
+        update(RunJob)
+        .where(
+            col(RunJob.id).in_(job_ids),
+            col(RunJob.locked_by) == worker_id,
+            col(RunJob.status) == JobStatus.RUNNING,
+        )
+        .values(locked_at=datetime.now(UTC))
+    )
+    await session.commit()
+
+
+async def finish_job(
+    session: AsyncSession,
+    worker_id: str,
+    job_id: int,
+    error: str | None = None,
+) -> JobStatus | None:
+    """작업 종료 처리. 실패 시 최대 시도 횟수 전까지는 다시 대기열로 돌린다.
+
+    heartbeat가 끊긴 사이 다른 워커가 다시 가져간 작업이면 아무것도 바꾸지 않는다.
+
+    Returns:
+        바뀐 작업 상태 (이 워커가 점유한 작업이 아니면 None)
+    """
+    job = (
+        await session.execute(
+            select(RunJob)
+            .where(
+                col(RunJob.id) == job_id,
+                col(RunJob.locked_by) == worker_id,
+                col(RunJob.status) == JobStatus.RUNNING,
+            )
+            .with_for_update()
+        )
+    ).scalar_one_or_none()
+    if job is None:
+        await session.rollback()
+        return None
+
+    if error is None:
+        job.status = JobStatus.DONE
+    elif job.attempts < get_settings().RUN_JOB_MAX_ATTEMPTS:
+        job.status = JobStatus.QUEUED
+    else:
+        job.status = JobStatus.FAILED
+
+    job.last_error = error
+    job.locked_by = None
+    job.locked_at = None
+    await session.commit()
+    return job.status
+
+
+async def count_queued(session: AsyncSession) -> int:
+    """대기 중인 작업 수 (큐 깊이)."""
+    stmt = select(func.count()).where(col(RunJob.status) == JobStatus.QUEUED)
+    return (await session.execute(stmt)).scalar_one()
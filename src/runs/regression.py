@@ -1,25 +1,38 @@
 """회귀 분석용 통계 함수"""
 
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
 from scipy.stats import ttest_rel
 
 
-def calculate_p_value(base_scores: list[float], target_scores: list[float]) -> float:
+def calculate_p_value(
+    base_scores: Sequence[float] | NDArray[np.float64],
+    target_scores: Sequence[float] | NDArray[np.float64],
+) -> float:
     """
     Paired t-test로 두 Run의 semantic score 차이 유의성 계산.
 
+    Args:
+        base_scores, target_scores: 같은 row 순서로 정렬된 점수 (list 또는 NumPy 배열)
+
     Returns:
         p-value (0~1). 낮을수록 유의미한 차이.
         계산 불가 시 1.0 반환 (유의미하지 않음으로 처리).
     """
-    if len(base_scores) < 2 or len(target_scores) < 2:
+    base = np.asarray(base_scores, dtype=np.float64)
+    target = np.asarray(target_scores, dtype=np.float64)
+
+    if base.size < 2 or target.size < 2:
         return 1.0
 
-    if len(base_scores) != len(target_scores):
+    if base.size != target.size:
         return 1.0
 
     try:
-        _, p_value = ttest_rel(base_scores, target_scores)
-        if p_value != p_value:  # NaN check (모든 차이가 0인 경우)
+        _, p_value = ttest_rel(base, target)
+        if np.isnan(p_value):  # 모든 차이가 0인 경우
             return 1.0
         return float(p_value)
     except Exception:
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_current_identity
@@ -7,34 +8,50 @@ from src.database import get_session
 from src.datasets.dependencies import get_user_dataset
 from src.profiles.dependencies import get_user_profile
 from src.prompts.dependencies import get_user_prompt_version
-from src.runs.models import Run, RunStatus
+from src.runs.models import ResultStatus, Run, RunStatus
+from src.runs.queue import enqueue_run
 from src.runs.schemas import (
     CreateRunRequest,
+    ExportFormat,
     RegressionComparisonResponse,
     RelatedVersionsResponse,
+    RescoreRunRequest,
+    ResultFields,
     RunCreateResponse,
     RunDetailResponse,
+    RunProgressResponse,
     RunSummaryResponse,
+    RunTimingResponse,
+    SimilarResultResponse,
 )
 from src.runs.service import (
     compare_runs,
+    export_run_results,
+    find_similar_results,
     get_related_versions,
     get_run_detail,
+    get_run_progress,
+    get_run_timing,
     get_runs_summary,
-    process_run,
+    stream_run_events,
+    verify_run_owner,
 )
 
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
 router = APIRouter(prefix="/runs", tags=["runs"])
 
 
 @router.post("", response_model=RunCreateResponse, status_code=201)
 async def create_run(
     data: CreateRunRequest,
-    background_tasks: BackgroundTasks,
     identity: Guest | User = Depends(get_current_identity),
     session: AsyncSession = Depends(get_session),
 ) -> RunCreateResponse:
-    """Run 생성 및 백그라운드 실행."""
+    """Run 생성 및 작업 큐 등록 (워커 프로세스가 실행)."""
     await get_user_prompt_version(data.prompt_version_id, identity, session)
     await get_user_dataset(data.dataset_id, identity, session)
     await get_user_profile(data.profile_id, identity, session)
@@ -44,13 +61,54 @@ async def create_run(
         dataset_id=data.dataset_id,
         profile_id=data.profile_id,
         status=RunStatus.RUNNING,
+        use_generation_cache=data.use_generation_cache,
+        use_batch_api=data.use_batch_api,
     )
     session.add(run)
+    await session.flush()
+
+    assert run.id is not None
+    enqueue_run(session, run.id)
     await session.commit()
     await session.refresh(run)
 
+    return RunCreateResponse(
+        id=run.id,
+        status=run.status.value,
+        created_at=run.created_at,
+    )
+
+
+@router.post("/{run_id}/rescore", response_model=RunCreateResponse, status_code=201)
+async def rescore_run(
+    run_id: int,
+    data: RescoreRunRequest,
+    identity: Guest | User = Depends(get_current_identity),
+    session: AsyncSession = Depends(get_session),
+) -> RunCreateResponse:
+    """완료된 Run의 raw_output을 다른 프로필로 재채점하는 Run 생성 (LLM 호출 없음)."""
+    await verify_run_owner(run_id, identity, session)
+    await get_user_profile(data.profile_id, identity, session)
+
+    source = await session.get(Run, run_id)
+    assert source is not None
+    if source.status != RunStatus.COMPLETED:
+        raise HTTPException(status_code=400, detail="완료된 Run만 재채점할 수 있습니다")
+
+    run = Run(
+        prompt_version_id=source.prompt_version_id,
+        dataset_id=source.dataset_id,
+        profile_id=data.profile_id,
+        status=RunStatus.RUNNING,
+        source_run_id=run_id,
+    )
+    session.add(run)
+    await session.flush()
+
     assert run.id is not None
-    background_tasks.add_task(process_run, run.id)
+    enqueue_run(session, run.id)
+    await session.commit()
+    await session.refresh(run)
 
     return RunCreateResponse(
         id=run.id,
@@ -72,11 +130,98 @@ async def list_runs(
 @router.get("/{run_id}", response_model=RunDetailResponse)
 async def get_run(
     run_id: int,
+    cursor: int | None = Query(default=None, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+    status: ResultStatus | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    fields: ResultFields = ResultFields.FULL,
     identity: Guest | User = Depends(get_current_identity),
     session: AsyncSession = Depends(get_session),
 ) -> RunDetailResponse:
-    """Run 상세 조회."""
-    return await get_run_detail(run_id, identity, session)
+    """Run 상세 조회 (결과는 cursor 기반 페이지네이션)."""
+    return await get_run_detail(
+        run_id,
+        identity,
+        session,
+        cursor=cursor,
+        limit=limit,
+        status=status,
+        min_score=min_score,
+        max_score=max_score,
+        fields=fields,
+    )
+
+
+@router.get("/{run_id}/export")
+async def export_run(
+    run_id: int,
+    format: ExportFormat = ExportFormat.NDJSON,
+    identity: Guest | User = Depends(get_current_identity),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    """Run 결과 전체를 NDJSON/CSV로 스트리밍 다운로드."""
+    await verify_run_owner(run_id, identity, session)
+    # 요청 세션(인증 조회 포함)은 응답 스트리밍이 끝나야 정리되므로 미리 연결 반환
+    await session.close()
+    return StreamingResponse(
+        export_run_results(run_id, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="run-{run_id}.{format.value}"'
+        },
+    )
+
+
+@router.get(
+    "/{run_id}/results/{result_id}/similar", response_model=list[SimilarResultResponse]
+)
+async def get_similar_results(
+    run_id: int,
+    result_id: int,
+    limit: int = Query(default=10, ge=1, le=100),
+    identity: Guest | User = Depends(get_current_identity),
+    session: AsyncSession = Depends(get_session),
+) -> list[SimilarResultResponse]:
+    """출력이 가장 비슷한 결과를 내 모든 Run에서 검색 (예: 실패한 출력과 비슷한 출력)."""
+    return await find_similar_results(run_id, result_id, identity, session, limit=limit)
+
+
+@router.get("/{run_id}/progress", response_model=RunProgressResponse)
+async def get_run_progress_endpoint(
+    run_id: int,
+    identity: Guest | User = Depends(get_current_identity),
+    session: AsyncSession = Depends(get_session),
+) -> RunProgressResponse:
+    """진행 상황 (처리한 row 수와 통과 카운터) - 결과 row를 읽지 않음."""
+    return await get_run_progress(run_id, identity, session)
+
+
+@router.get("/{run_id}/events")
+async def stream_run_events_endpoint(
+    run_id: int,
+    identity: Guest | User = Depends(get_current_identity),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    """진행 이벤트 SSE 스트림 (progress, rows, 종료 시 status)."""
+    await verify_run_owner(run_id, identity, session)
+    # 스트림은 오래 열려 있으므로 요청 세션의 연결을 미리 반환 (구독자 수만큼 연결을 잡지 않음)
+    await session.close()
+    return StreamingResponse(
+        stream_run_events(run_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{run_id}/timing", response_model=RunTimingResponse)
+async def get_run_timing_endpoint(
+    run_id: int,
+    identity: Guest | User = Depends(get_current_identity),
+    session: AsyncSession = Depends(get_session),
+) -> RunTimingResponse:
+    """단계별(프롬프트 조립, LLM, waterfall 레이어, 저장) 소요 시간 p50/p95/p99."""
+    return await get_run_timing(run_id, identity, session)
 
 
 @router.get("/{run_id}/related-versions", response_model=RelatedVersionsResponse)
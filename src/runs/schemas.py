@@ -1,9 +1,10 @@
 from datetime import datetime
+from enum import StrEnum
 from typing import Any
 
 from src.common.schemas import CamelCaseModel
 from src.common.types import JsonValue, LogicConstraint
-from src.runs.models import ResultStatus
+from src.runs.models import ResultStatus, RunStatus
 
 
 class FormatCheckResult(CamelCaseModel):
@@ -46,10 +47,20 @@ class CreateRunRequest(CamelCaseModel):
     prompt_version_id: int
     dataset_id: int
     profile_id: int
+    # temperature > 0이어도 LLM 생성 캐시 사용
+    use_generation_cache: bool = False
+    # 개별 호출 대신 provider 배치 API로 생성 (대용량 Run용, 완료까지 수 시간 소요 가능)
+    use_batch_api: bool = False
+
+
+class RescoreRunRequest(CamelCaseModel):
+    """재채점 Run 생성 요청 - 기존 Run의 raw_output을 다른 프로필로 평가"""
+
+    profile_id: int
 
 
 class RunCreateResponse(CamelCaseModel):
-    """Run 생성 즉시 응답 (BackgroundTask 시작 후)"""
+    """Run 생성 즉시 응답 (작업 큐 등록 후)"""
 
     id: int
     status: str
@@ -95,6 +106,26 @@ class RunMetrics(CamelCaseModel):
     format_pass_rate: float
     semantic_pass_rate: float
     logic_pass_rate: float
+    generation_cache_hits: int = 0
+    generation_cache_misses: int = 0
+
+
+class RunProgressResponse(CamelCaseModel):
+    """Run 진행 상황 (GET /runs/{id}/progress, SSE progress 이벤트)
+
+    run_metrics 카운터만 읽으므로 결과 row 수와 무관하게 일정한 비용으로 조회한다.
+    """
+
+    run_id: int
+    status: RunStatus
+    # 처리할 전체 row 수 (처리 시작 전이면 None)
+    target_count: int | None = None
+    processed: int
+    pass_count: int = 0
+    format_pass_count: int = 0
+    semantic_pass_count: int = 0
+    avg_semantic: float | None = None
+    updated_at: datetime | None = None
 
 
 class AssembledPrompt(CamelCaseModel):
@@ -104,6 +135,31 @@ class AssembledPrompt(CamelCaseModel):
     user_message: str
 
 
+class ResultFields(StrEnum):
+    """Run 상세 결과 projection."""
+
+    SUMMARY = "summary"  # 상태/점수만
+    FULL = "full"  # 스냅샷·프롬프트·출력 포함
+
+
+class ExportFormat(StrEnum):
+    """Run 결과 export 형식."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class RunResultSummaryResponse(CamelCaseModel):
+    """개별 RunResult 요약 응답 (fields=summary)"""
+
+    id: int
+    row_index: int
+    dataset_row_id: int
+    status: ResultStatus
+    is_format_passed: bool
+    semantic_score: float
+
+
 class RunResultResponse(CamelCaseModel):
     """개별 RunResult 응답"""
 
@@ -135,8 +191,10 @@ class RunDetailResponse(CamelCaseModel):
     status: str
     created_at: datetime
     profile: ProfileInRun
+    source_run_id: int | None = None
     metrics: RunMetrics
-    results: list[RunResultResponse]
+    results: list[RunResultResponse] | list[RunResultSummaryResponse]
+    next_cursor: int | None = None
 
 
 class RelatedRunResponse(CamelCaseModel):
@@ -179,3 +237,45 @@ class RegressionComparisonResponse(CamelCaseModel):
 
     p_value: float
     row_comparisons: list[RowComparisonData]
+
+
+class SimilarResultResponse(CamelCaseModel):
+    """출력이 비슷한 결과 (GET /runs/{id}/results/{result_id}/similar)"""
+
+    id: int
+    run_id: int
+    dataset_row_id: int
+    status: ResultStatus
+    semantic_score: float
+    raw_output: str
+    # 기준 결과 출력과의 코사인 거리 (0에 가까울수록 유사)
+    distance: float
+
+
+class StageTiming(CamelCaseModel):
+    """단계 하나의 row별 소요 시간 분위수 (ms)"""
+
+    stage: str
+    # 이 단계를 실행한 row 수
+    count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+class RunTimingResponse(CamelCaseModel):
+    """Run 단계별 소요 시간 (GET /runs/{id}/timing)
+
+    llm은 속도 제한 대기(llm_queue)와 재시도를 포함하고, semantic은 배치 embedding
+    시간을 row 수로 나눈 값이다.
+    """
+
+    run_id: int
+    rows: int
+    # trace가 기록된 row 수 (trace 도입 전 결과는 제외)
+    traced_rows: int
+    stages: list[StageTiming]
+    # provider 토큰 사용량 합계 (prompt, output, thoughts, cached, total)
+    tokens: dict[str, int]
+    # 재시도·429·캐시 적중 등 횟수 합계
+    counts: dict[str, int]
@@ -1,35 +1,119 @@
+import asyncio
+import csv
+import io
+import json
 import logging
-
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Sequence
+from contextlib import aclosing
+from itertools import chain
+from typing import Any
+
+import numpy as np
 from fastapi import HTTPException
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Select,
+    and_,
+    case,
+    cast,
+    exists,
+    insert,
+    literal,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import JSONB, array
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from sqlmodel import col, func, select
 
 from src.auth.models import Guest, User
-from src.common.types import JsonValue, LogicConstraint
+from src.common import metrics
+from src.common.trace import Trace, start_trace, timed
+from src.common.types import JsonValue
+from src.config import get_settings
 from src.database import async_session
 from src.datasets.models import Dataset, DatasetRow
-from src.llm.factory import get_llm_client
+from src.embeddings.cache import get_embedding_cache
+from src.embeddings.models import cosine_distance
+from src.llm.base import BatchRequest, LLMClient
+from src.llm.batch import wait_for_batch
+from src.llm.cache import CachedLLMClient, get_generation_cache
+from src.llm.factory import get_batch_llm_client, get_llm_client
 from src.profiles.models import EvaluatorProfile
-from src.prompts.models import Prompt, PromptVersion
-from src.runs.evaluator.waterfall import evaluate_waterfall
-from src.runs.models import ResultStatus, Run, RunResult, RunStatus
+from src.prompts.models import OutputSchemaType, Prompt, PromptVersion
+from src.runs import aggregates, events
+from src.runs.evaluator.format_layer import JsonStreamValidator
+from src.runs.evaluator.logic_layer import ConstraintPlan, compile_constraints
+from src.runs.evaluator.waterfall import (
+    WaterfallBatchResult,
+    evaluate_waterfall_batch_async,
+)
+from src.runs.events import RunEvent, get_run_event_broker, progress_event, row_events
+from src.runs.executor import execute_rows
+from src.runs.models import ResultStatus, Run, RunAggregate, RunResult, RunStatus
 from src.runs.regression import calculate_p_value
 from src.runs.schemas import (
     AssembledPrompt,
+    ExportFormat,
     ProfileInRun,
     RegressionComparisonResponse,
     RelatedRunResponse,
     RelatedVersionsResponse,
+    ResultFields,
     RowComparisonData,
     RunDetailResponse,
-    RunMetrics,
+    RunProgressResponse,
     RunResultResponse,
+    RunResultSummaryResponse,
     RunSummaryResponse,
+    RunTimingResponse,
+    SimilarResultResponse,
+    StageTiming,
     UnexecutedVersionResponse,
 )
+from src.runs.templates import CompiledTemplate
 
 logger = logging.getLogger(__name__)
 
+_JSON_SCHEMAS = (OutputSchemaType.JSON_OBJECT, OutputSchemaType.JSON_ARRAY)
+
+# 이벤트가 없을 때 SSE 연결 유지용 주석을 보내는 간격 (프록시 idle timeout 방지)
+SSE_KEEPALIVE_SECONDS = 15.0
+
+# export 시 서버 사이드 커서에서 한 번에 가져와 직렬화하는 row 수
+EXPORT_CHUNK_SIZE = 1000
+
+# RunResult.trace의 단계 (GET /runs/{id}/timing 표시 순서, llm은 llm_queue를 포함)
+TRACE_STAGES = (
+    "prompt_assembly",
+    "llm_queue",
+    "llm",
+    "format",
+    "semantic",
+    "logic",
+    "persistence",
+)
+
+EXPORT_COLUMNS = (
+    "id",
+    "dataset_row_id",
+    "status",
+    "is_format_passed",
+    "semantic_score",
+    "input_snapshot",
+    "expected_snapshot",
+    "assembled_prompt",
+    "raw_output",
+    "parsed_output",
+    "logic_results",
+)
+
 
 def assemble_prompt(
     user_template: str,
@@ -40,25 +124,64 @@ def assemble_prompt(
 
     예: "검증할 문장: {{claim}}" + {"claim": "서울은 수도다"}
     → "검증할 문장: 서울은 수도다"
+
+    Run 처리에서는 PromptVersion마다 CompiledTemplate을 한 번 만들어 재사용한다.
     """
-    logger.debug("프롬프트 조립 시작 | template_len=%d, input_keys=%s", len(user_template), list(input_data.keys()))
+    return CompiledTemplate(user_template).render(input_data)
 
-    result = user_template
-    for key, value in input_data.items():
-        placeholder = f"{{{{{key}}}}}"
-        if placeholder in result:
-            result = result.replace(placeholder, str(value))
-            logger.debug("치환 성공 | key=%s", key)
-        else:
-            logger.warning("치환 실패 | key='%s'가 템플릿에 없음 (사용 가능: %s)", key, placeholder)
 
-    logger.debug("프롬프트 조립 완료 | result_len=%d", len(result))
-    return result
+async def _report_missing_placeholders(
+    session: AsyncSession,
+    dataset_id: int,
+    template: CompiledTemplate,
+) -> None:
+    """템플릿 placeholder 중 input_data에 없는 key를 row 수와 함께 경고 (Run 시작 시 1회)."""
+    if not template.placeholders:
+        return
+
+    keys = (
+        func.jsonb_object_keys(col(DatasetRow.input_data))
+        .table_valued("key")
+        .render_derived(name="input_keys")
+    )
+    key_counts = dict((await session.execute(
+        select(keys.c.key, func.count())
+        .select_from(DatasetRow)
+        .join(keys, true())
+        .where(DatasetRow.dataset_id == dataset_id)
+        .group_by(keys.c.key)
+    )).tuples().all())
+    total_rows = (await session.execute(
+        select(func.count()).where(DatasetRow.dataset_id == dataset_id)
+    )).scalar_one()
+
+    for name in sorted(template.placeholders):
+        missing_rows = total_rows - key_counts.get(name, 0)
+        if missing_rows:
+            logger.warning(
+                "치환 실패 | key='%s'가 input_data에 없음 (rows=%d/%d, placeholder 유지)",
+                name,
+                missing_rows,
+                total_rows,
+            )
 
 
-async def process_run(run_id: int) -> None:
-    """BackgroundTask에서 Run 처리."""
-    logger.info("Run 처리 시작 | run_id=%d", run_id)
+async def process_run(run_id: int, resume: bool = False, final_attempt: bool = True) -> None:
+    """워커에서 Run 처리.
+
+    row는 RUN_RESULT_BATCH_SIZE개 단위로 읽고 생성·평가한 뒤 bulk INSERT + commit한다.
+    메모리 사용량은 배치 크기에 비례하고, 중단되더라도 commit된 결과는 보존된다.
+    source_run_id가 있는 재채점 Run은 LLM 호출 없이 source Run의 raw_output만 다시 평가한다.
+
+    Args:
+        resume: True면 이미 RunResult가 있는 row를 건너뛰고 이어서 처리
+        final_attempt: 실패 시 Run을 FAILED로 표시할지 여부.
+            False면 작업이 다시 시도되므로 Run을 RUNNING으로 둔다.
+
+    Raises:
+        Exception: 처리 중 발생한 예외 (Run 상태를 기록한 뒤 다시 발생)
+    """
+    logger.info("Run 처리 시작 | run_id=%d, resume=%s", run_id, resume)
 
     async with async_session() as session:
         run = (await session.execute(
@@ -76,156 +199,687 @@ async def process_run(run_id: int) -> None:
                 select(PromptVersion).where(PromptVersion.id == run.prompt_version_id)
             )).scalar_one()
 
-            rows = (await session.execute(
-                select(DatasetRow)
-                .where(DatasetRow.dataset_id == run.dataset_id)
-                .order_by(col(DatasetRow.row_index))
-            )).scalars().all()
-
             profile = (await session.execute(
                 select(EvaluatorProfile).where(EvaluatorProfile.id == run.profile_id)
             )).scalar_one()
 
-            logger.info(
-                "Run 설정 로드 완료 | version_id=%d, model=%s, rows=%d, profile=%s, threshold=%.2f",
-                version.id,
-                version.model,
-                len(rows),
-                profile.name,
-                profile.semantic_threshold,
+            if run.source_run_id is not None:
+                await _rescore_results(session, run, version, profile, resume)
+            else:
+                await _generate_results(session, run, version, profile, resume)
+
+            await aggregates.finalize(session, run.id)
+            run.status = RunStatus.COMPLETED
+            await _publish_progress(session, run.id, status=run.status)
+            logger.info("Run 완료 | run_id=%d, status=COMPLETED", run_id)
+            await session.commit()
+
+        except Exception as e:
+            logger.exception(
+                "Run 처리 실패 | run_id=%d, final_attempt=%s, error=%s",
+                run_id,
+                final_attempt,
+                str(e),
+            )
+            await session.rollback()
+            # 재시도할 작업이면 Run은 RUNNING으로 두고 다음 시도가 resume으로 이어서 처리
+            status = RunStatus.FAILED if final_attempt else RunStatus.RUNNING
+            await session.execute(
+                update(Run).where(col(Run.id) == run_id).values(status=status)
             )
+            if final_attempt:
+                await _publish_progress(session, run_id, status=status)
+            await session.commit()
+            raise
 
-            llm = get_llm_client(version.model)
 
-            for idx, row in enumerate(rows, 1):
-                assert row.id is not None
-                logger.info("Row 처리 시작 | row=%d/%d, row_id=%d", idx, len(rows), row.id)
+async def _generate_results(
+    session: AsyncSession,
+    run: Run,
+    version: PromptVersion,
+    profile: EvaluatorProfile,
+    resume: bool,
+) -> None:
+    """데이터셋 row를 LLM으로 생성·평가해 배치 단위로 저장."""
+    assert run.id is not None
 
-                user_message = assemble_prompt(version.user_template, row.input_data)
+    rows_stmt = select(DatasetRow).where(DatasetRow.dataset_id == run.dataset_id)
+    if resume:
+        rows_stmt = rows_stmt.where(
+            ~exists().where(
+                col(RunResult.run_id) == run.id,
+                col(RunResult.dataset_row_id) == col(DatasetRow.id),
+            )
+        )
+    total_rows = (await session.execute(
+        select(func.count()).select_from(rows_stmt.subquery())
+    )).scalar_one()
+
+    await _start_progress(session, run.id, total_rows)
+
+    settings = get_settings()
+    batch_size = settings.RUN_RESULT_BATCH_SIZE
+    logger.info(
+        "Run 설정 로드 완료 | version_id=%d, model=%s, rows=%d, profile=%s, threshold=%.2f, concurrency=%d, batch_size=%d",
+        version.id,
+        version.model,
+        total_rows,
+        profile.name,
+        profile.semantic_threshold,
+        settings.RUN_CONCURRENCY,
+        batch_size,
+    )
 
-                logger.debug("LLM 호출 시작 | model=%s, temperature=%.1f", version.model, version.temperature)
-                raw_output = await llm.generate(
-                    system_instruction=version.system_instruction,
-                    user_message=user_message,
-                    temperature=version.temperature,
-                )
-                logger.debug("LLM 응답 수신 | output_len=%d", len(raw_output))
+    # 템플릿과 constraint는 Run마다 한 번만 컴파일해 모든 row에 재사용
+    template = CompiledTemplate(version.user_template)
+    await _report_missing_placeholders(session, run.dataset_id, template)
+    constraints = compile_constraints(profile.global_constraints or [])
 
-                constraints: list[LogicConstraint] = profile.global_constraints or []
+    llm: LLMClient = get_llm_client(version.model)
+    embedding_cache = get_embedding_cache()
 
-                eval_result = evaluate_waterfall(
-                    raw_output=raw_output,
-                    output_schema=version.output_schema,
-                    expected_output=row.expected_output,
-                    threshold=profile.semantic_threshold,
-                    constraints=constraints,
-                )
+    # 결정적 출력(temperature=0)이거나 명시적으로 요청한 경우에만 생성 캐시 사용
+    cached_llm: CachedLLMClient | None = None
+    if version.temperature == 0 or run.use_generation_cache:
+        cached_llm = CachedLLMClient(
+            llm, version.model, get_generation_cache(), always=run.use_generation_cache
+        )
+        llm = cached_llm
+
+    # 배치 API 모드: 모든 prompt를 provider 배치 작업 하나로 처리한 결과를 사용
+    batch_outputs: dict[str, str] | None = None
+    if run.use_batch_api:
+        batch_outputs = await _run_batch_job(session, run, version, template, rows_stmt)
+
+    processed = 0
+    async for rows in _iter_row_pages(session, rows_stmt, batch_size):
+        # 기대 출력은 같은 데이터셋의 모든 Run에서 동일하므로 영구 캐시에서 미리 적재
+        await embedding_cache.warm(
+            session, settings.EMBEDDING_MODEL, {row.expected_output for row in rows}
+        )
 
-                parsed = eval_result.format_result.parsed_output
-                parsed_dict = parsed if isinstance(parsed, dict) else None
-
-                result = RunResult(
-                    run_id=run.id,
-                    dataset_row_id=row.id,
-                    input_snapshot=row.input_data,
-                    expected_snapshot=row.expected_output,
-                    assembled_prompt={
-                        "system_instruction": version.system_instruction,
-                        "user_message": user_message,
-                    },
-                    raw_output=raw_output,
-                    is_format_passed=eval_result.format_result.passed,
-                    parsed_output=parsed_dict,
-                    semantic_score=(
-                        eval_result.semantic_result.semantic_score
-                        if eval_result.semantic_result
-                        else 0.0
-                    ),
-                    logic_results=(
-                        eval_result.logic_result.model_dump()
-                        if eval_result.logic_result
-                        else {}
-                    ),
-                    status=eval_result.status,
-                )
-                session.add(result)
-                logger.info("Row 처리 완료 | row=%d/%d, status=%s", idx, len(rows), eval_result.status.value)
+        # prompt와 캐시 key는 배치마다 한 번만 계산해 캐시 적재·생성·저장에 함께 사용
+        prompts = _render_prompts(template, rows)
+        cache_keys: list[str] = []
+        if cached_llm is not None:
+            cache_keys = cached_llm.prepare(
+                version.system_instruction,
+                (user_message for user_message, _ in prompts.values()),
+                version.temperature,
+            )
+            await cached_llm.cache.warm(session, cache_keys)
 
-            run.status = RunStatus.COMPLETED
-            logger.info("Run 완료 | run_id=%d, status=COMPLETED", run_id)
-            await session.commit()
+        values, expected_embeddings = await _evaluate_rows(
+            run.id, rows, version, prompts, profile, constraints, llm, batch_outputs
+        )
+        persist_started = time.perf_counter()
+        await session.execute(insert(RunResult), values)
+        # 기대 출력 embedding은 DatasetRow에 저장해 재채점·유사 출력 검색에서 SQL로 사용
+        await _store_expected_embeddings(
+            session, settings.EMBEDDING_MODEL, expected_embeddings
+        )
+        cache_hits, cache_misses = cached_llm.stats.take() if cached_llm else (0, 0)
+        metrics.CACHE_REQUESTS.labels("generation", "hit").inc(cache_hits)
+        metrics.CACHE_REQUESTS.labels("generation", "miss").inc(cache_misses)
+        # 결과와 같은 트랜잭션에서 집계를 갱신해 run_metrics가 항상 결과와 일치
+        await aggregates.accumulate(
+            session,
+            run.id,
+            values,
+            generation_cache_hits=cache_hits,
+            generation_cache_misses=cache_misses,
+        )
+        # 이 배치의 텍스트만 기록 - 다른 Run의 embedding은 그 Run의 트랜잭션이 기록
+        await embedding_cache.persist(
+            session,
+            settings.EMBEDDING_MODEL,
+            chain(
+                (value["raw_output"] for value in values),
+                (row.expected_output for row in rows),
+            ),
+        )
+        if cached_llm is not None:
+            # 이 배치의 key만 기록 - 다른 Run의 결과는 그 Run의 트랜잭션이 기록
+            await cached_llm.cache.persist(session, cache_keys)
+        await _publish_batch(session, run.id, values)
+        await _record_persistence(
+            session,
+            run.id,
+            [row.id for row in rows if row.id is not None],
+            time.perf_counter() - persist_started,
+        )
+        await session.commit()
+        _record_rows_processed("generate", values)
 
-        except Exception as e:
-            logger.exception("Run 처리 실패 | run_id=%d, error=%s", run_id, str(e))
-            run.status = RunStatus.FAILED
-            await session.commit()
+        processed += len(rows)
+        logger.info("Run 배치 저장 | run_id=%d, progress=%d/%d", run.id, processed, total_rows)
 
 
-async def get_runs_summary(
-    identity: Guest | User,
+async def _start_progress(session: AsyncSession, run_id: int, remaining: int) -> None:
+    """처리할 전체 row 수를 기록하고 progress 이벤트와 함께 바로 commit."""
+    await aggregates.set_target(session, run_id, remaining)
+    await _publish_progress(session, run_id)
+    await session.commit()
+
+
+async def _publish_batch(
+    session: AsyncSession, run_id: int, values: list[dict[str, Any]]
+) -> None:
+    """저장한 배치의 rows 이벤트와 갱신된 progress 이벤트 NOTIFY (배치 commit 시 전달)."""
+    rows = [(value["dataset_row_id"], value["status"].value) for value in values]
+    await _publish_progress(session, run_id, rows=row_events(run_id, rows))
+
+
+async def _publish_progress(
     session: AsyncSession,
-    grouped: bool = True,
-) -> list[RunSummaryResponse]:
-    """사용자의 Run 목록 조회 (집계 포함).
+    run_id: int,
+    rows: Sequence[RunEvent] = (),
+    status: RunStatus | None = None,
+) -> None:
+    """rows 이벤트 → 현재 트랜잭션 기준 progress → (종료 시) status 순서로 NOTIFY."""
+    pending = list(rows)
+    progress = await aggregates.load_progress(session, run_id)
+    if progress is not None:
+        pending.append(progress_event(progress))
+    if status is not None:
+        # status는 SSE 스트림의 마지막 이벤트
+        pending.append(RunEvent(run_id, "status", {"status": status.value}))
+    await events.publish(session, pending)
+
+
+async def _iter_row_pages(
+    session: AsyncSession,
+    rows_stmt: Select[tuple[DatasetRow]],
+    batch_size: int,
+) -> AsyncIterator[Sequence[DatasetRow]]:
+    """rows_stmt 결과를 (row_index, id) keyset 페이지네이션으로 batch_size개씩 반환.
 
-    Args:
-        grouped: True면 같은 조합(prompt_id + dataset_id + profile_id)에서 최신 Run만 반환
+    페이지 사이에 commit해도 안전하게 이어서 읽고, 처리한 페이지는 세션에서 분리한다.
     """
-    pass_count_subq = (
-        select(func.count())
-        .where(
-            col(RunResult.run_id) == col(Run.id),
-            col(RunResult.status) == ResultStatus.PASS,
-        )
-        .correlate(Run)
-        .scalar_subquery()
+    last_key: tuple[int, int] | None = None
+    while True:
+        page_stmt = rows_stmt.order_by(
+            col(DatasetRow.row_index), col(DatasetRow.id)
+        ).limit(batch_size)
+        if last_key is not None:
+            page_stmt = page_stmt.where(
+                tuple_(col(DatasetRow.row_index), col(DatasetRow.id)) > last_key
+            )
+        rows = (await session.execute(page_stmt)).scalars().all()
+        if not rows:
+            return
+
+        yield rows
+
+        last_row = rows[-1]
+        assert last_row.id is not None
+        last_key = (last_row.row_index, last_row.id)
+        for row in rows:
+            session.expunge(row)
+
+
+async def _run_batch_job(
+    session: AsyncSession,
+    run: Run,
+    version: PromptVersion,
+    template: CompiledTemplate,
+    rows_stmt: Select[tuple[DatasetRow]],
+) -> dict[str, str]:
+    """처리할 row 전체를 provider 배치 작업으로 제출하고 완료될 때까지 대기.
+
+    작업 ID는 Run에 저장하므로 워커가 재시작돼도 같은 작업을 이어서 기다린다.
+
+    Returns:
+        str(dataset_row_id) → 생성 결과 (배치에서 실패한 row는 없음)
+    """
+    settings = get_settings()
+    client = get_batch_llm_client(version.model)
+
+    if run.batch_job_id is None:
+        requests: list[BatchRequest] = []
+        async for rows in _iter_row_pages(session, rows_stmt, settings.RUN_RESULT_BATCH_SIZE):
+            requests.extend(
+                BatchRequest(
+                    key=str(row.id),
+                    system_instruction=version.system_instruction,
+                    user_message=template.render(row.input_data),
+                    temperature=version.temperature,
+                )
+                for row in rows
+            )
+        run.batch_job_id = await client.submit_batch(requests)
+        await session.commit()
+        logger.info("배치 작업 제출 | run_id=%d, job_id=%s, requests=%d", run.id, run.batch_job_id, len(requests))
+
+    return await wait_for_batch(
+        client,
+        run.batch_job_id,
+        poll_interval=settings.LLM_BATCH_POLL_INTERVAL,
+        timeout=settings.LLM_BATCH_TIMEOUT,
     )
 
-    total_count_subq = (
-        select(func.count())
-        .where(col(RunResult.run_id) == col(Run.id))
-        .correlate(Run)
-        .scalar_subquery()
+
+async def _rescore_results(
+    session: AsyncSession,
+    run: Run,
+    version: PromptVersion,
+    profile: EvaluatorProfile,
+    resume: bool,
+) -> None:
+    """source Run에 저장된 raw_output만 새 프로필로 다시 평가해 배치 단위로 저장.
+
+    LLM을 호출하지 않는다. 출력·기대 출력 embedding이 모두 저장된 row는 Semantic 점수를
+    SQL(<=>)에서 계산하고, 나머지만 embedding 캐시/API로 계산한다.
+    """
+    assert run.id is not None
+
+    source_stmt = select(RunResult).where(col(RunResult.run_id) == run.source_run_id)
+    if resume:
+        rescored = aliased(RunResult)
+        source_stmt = source_stmt.where(
+            ~exists().where(
+                col(rescored.run_id) == run.id,
+                col(rescored.dataset_row_id) == col(RunResult.dataset_row_id),
+            )
+        )
+    total_rows = (await session.execute(
+        select(func.count()).select_from(source_stmt.subquery())
+    )).scalar_one()
+
+    await _start_progress(session, run.id, total_rows)
+
+    settings = get_settings()
+    batch_size = settings.RUN_RESULT_BATCH_SIZE
+    logger.info(
+        "재채점 설정 로드 완료 | source_run_id=%d, rows=%d, profile=%s, threshold=%.2f, batch_size=%d",
+        run.source_run_id,
+        total_rows,
+        profile.name,
+        profile.semantic_threshold,
+        batch_size,
     )
 
-    avg_semantic_subq = (
-        select(func.avg(RunResult.semantic_score))
-        .where(col(RunResult.run_id) == col(Run.id))
-        .correlate(Run)
-        .scalar_subquery()
+    embedding_cache = get_embedding_cache()
+    # constraint는 Run마다 한 번 컴파일해 모든 row에 재사용
+    constraints = compile_constraints(profile.global_constraints or [])
+    stored_score = _stored_semantic_score(settings.EMBEDDING_MODEL)
+
+    processed = 0
+    last_id: int | None = None
+    while True:
+        page_stmt = source_stmt.order_by(col(RunResult.id)).limit(batch_size)
+        if last_id is not None:
+            page_stmt = page_stmt.where(col(RunResult.id) > last_id)
+        page = (
+            await session.execute(
+                page_stmt.outerjoin(
+                    DatasetRow, col(DatasetRow.id) == col(RunResult.dataset_row_id)
+                ).add_columns(stored_score)
+            )
+        ).all()
+        if not page:
+            break
+        sources = [source for source, _ in page]
+        known_scores = {
+            i: score for i, (_, score) in enumerate(page) if score is not None
+        }
+
+        await embedding_cache.warm(
+            session,
+            settings.EMBEDDING_MODEL,
+            {r.expected_snapshot for i, r in enumerate(sources) if i not in known_scores},
+        )
+
+        evaluation = await evaluate_waterfall_batch_async(
+            raw_outputs=[r.raw_output for r in sources],
+            expected_outputs=[r.expected_snapshot for r in sources],
+            output_schema=version.output_schema,
+            threshold=profile.semantic_threshold,
+            constraints=constraints,
+            known_scores=known_scores,
+        )
+        values = [
+            _result_values(
+                run.id,
+                source.dataset_row_id,
+                source.input_snapshot,
+                source.expected_snapshot,
+                source.assembled_prompt,
+                source.raw_output,
+                evaluation,
+                index,
+            )
+            for index, source in enumerate(sources)
+        ]
+        dataset_row_ids = [r.dataset_row_id for r in sources]
+        persist_started = time.perf_counter()
+        await session.execute(insert(RunResult), values)
+        await _copy_output_embeddings(session, run.id, run.source_run_id, dataset_row_ids)
+        await aggregates.accumulate(session, run.id, values)
+        await embedding_cache.persist(
+            session,
+            settings.EMBEDDING_MODEL,
+            chain(
+                (r.raw_output for r in sources), (r.expected_snapshot for r in sources)
+            ),
+        )
+        await _publish_batch(session, run.id, values)
+        await _record_persistence(
+            session, run.id, dataset_row_ids, time.perf_counter() - persist_started
+        )
+        await session.commit()
+        _record_rows_processed("rescore", values)
+
+        processed += len(sources)
+        last_id = sources[-1].id
+        for source in sources:
+            session.expunge(source)
+        logger.info("재채점 배치 저장 | run_id=%d, progress=%d/%d", run.id, processed, total_rows)
+
+
+def _record_rows_processed(kind: str, values: list[dict[str, Any]]) -> None:
+    """commit된 배치의 row 수를 상태별로 지표에 반영 (배치당 상태 수만큼만 기록)."""
+    for status, count in Counter(value["status"] for value in values).items():
+        metrics.ROWS_PROCESSED.labels(kind, status.value).inc(count)
+
+
+def _stored_semantic_score(model: str) -> ColumnElement[float | None]:
+    """저장된 embedding으로 계산한 Semantic 점수 (1 - 코사인 거리).
+
+    두 embedding이 모두 model로 계산됐고 기대 출력이 Run 당시와 같을 때만 값이 있고,
+    RunResult와 DatasetRow를 함께 조회하는 쿼리에서 사용한다.
+    """
+    return case(
+        (
+            and_(
+                col(RunResult.output_embedding_model) == model,
+                col(DatasetRow.expected_embedding_model) == model,
+                col(DatasetRow.expected_output) == col(RunResult.expected_snapshot),
+            ),
+            1 - cosine_distance(RunResult.output_embedding, DatasetRow.expected_embedding),
+        ),
+        else_=None,
     )
 
-    format_pass_subq = (
-        select(func.count())
+
+async def _copy_output_embeddings(
+    session: AsyncSession,
+    run_id: int,
+    source_run_id: int | None,
+    dataset_row_ids: list[int],
+) -> None:
+    """재채점 결과에 source 결과의 출력 embedding을 복사 (raw_output이 같으므로 재사용)."""
+    source = aliased(RunResult)
+    await session.execute(
+        update(RunResult)
         .where(
-            col(RunResult.run_id) == col(Run.id),
-            col(RunResult.is_format_passed) == True,  # noqa: E712
+            col(RunResult.run_id) == run_id,
+            col(RunResult.dataset_row_id).in_(dataset_row_ids),
+            col(RunResult.output_embedding).is_(None),
+            col(source.run_id) == source_run_id,
+            col(source.dataset_row_id) == col(RunResult.dataset_row_id),
+            col(source.output_embedding).is_not(None),
         )
-        .correlate(Run)
-        .scalar_subquery()
+        .values(
+            output_embedding=source.output_embedding,
+            output_embedding_model=source.output_embedding_model,
+        )
+        .execution_options(synchronize_session=False)
     )
 
-    semantic_pass_subq = (
-        select(func.count())
+
+async def _record_persistence(
+    session: AsyncSession,
+    run_id: int,
+    dataset_row_ids: list[int],
+    seconds: float,
+) -> None:
+    """배치 저장 시간을 row 수로 나눠 결과 trace의 timings_ms.persistence에 기록."""
+    if not dataset_row_ids:
+        return
+    per_row_ms = round(seconds * 1000 / len(dataset_row_ids), 3)
+    await session.execute(
+        update(RunResult)
         .where(
-            col(RunResult.run_id) == col(Run.id),
-            col(RunResult.status) != ResultStatus.FORMAT,
-            col(RunResult.status) != ResultStatus.SEMANTIC,
+            col(RunResult.run_id) == run_id,
+            col(RunResult.dataset_row_id).in_(dataset_row_ids),
+            col(RunResult.trace)["timings_ms"].is_not(None),
         )
-        .correlate(Run)
-        .scalar_subquery()
+        .values(
+            trace=func.jsonb_set(
+                RunResult.trace,
+                array(["timings_ms", "persistence"]),
+                literal(per_row_ms, JSONB),
+            )
+        )
+        .execution_options(synchronize_session=False)
     )
 
-    logic_pass_subq = (
-        select(func.count())
-        .where(
-            col(RunResult.run_id) == col(Run.id),
-            col(RunResult.status) == ResultStatus.PASS,
+
+def _result_values(
+    run_id: int,
+    dataset_row_id: int,
+    input_snapshot: dict[str, Any],
+    expected_snapshot: str,
+    assembled_prompt: dict[str, Any],
+    raw_output: str,
+    evaluation: WaterfallBatchResult,
+    index: int,
+    row_trace: Trace | None = None,
+) -> dict[str, Any]:
+    """배치 평가 결과의 index번째 row를 run_results INSERT용 값으로 변환.
+
+    row_trace(생성 단계 trace)에 이 row를 실행한 waterfall 레이어의 시간을 더해 저장한다.
+    """
+    row_trace = row_trace or Trace()
+    for stage, seconds in evaluation.layer_seconds.items():
+        if seconds[index]:
+            row_trace.add_timing(stage, float(seconds[index]))
+    format_result = evaluation.format_results[index]
+    parsed = format_result.parsed_output
+    logic_result = evaluation.logic_results.get(index)
+    output_embedding = evaluation.output_embeddings.get(index)
+    return {
+        "run_id": run_id,
+        "dataset_row_id": dataset_row_id,
+        "input_snapshot": input_snapshot,
+        "expected_snapshot": expected_snapshot,
+        "assembled_prompt": assembled_prompt,
+        "raw_output": raw_output,
+        "is_format_passed": format_result.passed,
+        "parsed_output": parsed if isinstance(parsed, dict) else None,
+        "semantic_score": float(evaluation.semantic_scores[index]),
+        "output_embedding": output_embedding,
+        "output_embedding_model": (
+            get_settings().EMBEDDING_MODEL if output_embedding is not None else None
+        ),
+        "logic_results": logic_result.model_dump() if logic_result else {},
+        "status": evaluation.statuses[index],
+        "trace": row_trace.to_dict(),
+    }
+
+
+def _render_prompts(
+    template: CompiledTemplate, rows: Sequence[DatasetRow]
+) -> dict[int, tuple[str, float]]:
+    """row마다 user message를 렌더링 (dataset_row_id → (user message, 소요 시간 초))."""
+    prompts: dict[int, tuple[str, float]] = {}
+    for row in rows:
+        assert row.id is not None
+        started = time.perf_counter()
+        user_message = template.render(row.input_data)
+        prompts[row.id] = (user_message, time.perf_counter() - started)
+    return prompts
+
+
+async def _evaluate_rows(
+    run_id: int,
+    rows: Sequence[DatasetRow],
+    version: PromptVersion,
+    prompts: dict[int, tuple[str, float]],
+    profile: EvaluatorProfile,
+    constraints: ConstraintPlan,
+    llm: LLMClient,
+    batch_outputs: dict[str, str] | None = None,
+) -> tuple[list[dict[str, Any]], dict[int, list[float]]]:
+    """row 배치를 동시에 생성·평가하고 run_results INSERT용 값 목록 반환 (row_index 순서).
+
+    Args:
+        prompts: _render_prompts() 결과 - row마다 렌더링된 user message
+        batch_outputs: 배치 API 결과 - 있는 row는 LLM을 다시 호출하지 않음
+
+    Returns:
+        (INSERT용 값 목록, 새로 저장할 기대 출력 embedding - dataset_row_id → embedding)
+    """
+    # JSON 스키마는 스트리밍하며 검증해 형식이 확정적으로 깨지면 생성을 중단
+    stream_format_check = (
+        get_settings().LLM_STREAM_FORMAT_CHECK and version.output_schema in _JSON_SCHEMAS
+    )
+    aborted: dict[int, str] = {}
+
+    async def _generate(row: DatasetRow) -> tuple[str, str, Trace]:
+        assert row.id is not None
+        logger.info("Row 처리 시작 | row_index=%d, row_id=%d", row.row_index, row.id)
+
+        # row마다 별도 task에서 실행되므로 LLM 클라이언트의 대기·재시도·토큰 기록이 이 trace로 모인다
+        with start_trace() as row_trace:
+            user_message, render_seconds = prompts[row.id]
+            row_trace.add_timing("prompt_assembly", render_seconds)
+
+            if batch_outputs is not None:
+                batch_output = batch_outputs.get(str(row.id))
+                if batch_output is not None:
+                    row_trace.increment("batch_api")
+                    return user_message, batch_output, row_trace
+                # 배치에서 실패한 요청만 개별 호출로 보충
+                logger.warning("배치 결과 없음, 개별 호출 | row_id=%d", row.id)
+
+            logger.debug("LLM 호출 시작 | model=%s, temperature=%.1f", version.model, version.temperature)
+            # 모델별 속도 제한·동시성·재시도는 LLM 클라이언트(RateLimitedLLMClient)가 담당
+            with timed("llm"):
+                if stream_format_check:
+                    raw_output, format_error = await _generate_validated(
+                        llm, version, user_message
+                    )
+                else:
+                    format_error = None
+                    raw_output = await llm.generate(
+                        system_instruction=version.system_instruction,
+                        user_message=user_message,
+                        temperature=version.temperature,
+                    )
+            if format_error is not None:
+                logger.info("Format 조기 실패, 생성 중단 | row_id=%d, error=%s", row.id, format_error)
+                aborted[row.id] = format_error
+            logger.debug("LLM 응답 수신 | row_id=%d, output_len=%d", row.id, len(raw_output))
+            return user_message, raw_output, row_trace
+
+    # 결과는 row_index 순서대로 반환되므로 저장 순서(=RunResult.id 순서)가 결정적이다
+    generations = await execute_rows(
+        rows, _generate, concurrency=get_settings().RUN_CONCURRENCY
+    )
+
+    # 생성을 중단한 row는 Format 검사 없이 바로 FORMAT
+    evaluation = await evaluate_waterfall_batch_async(
+        raw_outputs=[raw_output for _, raw_output, _ in generations],
+        expected_outputs=[row.expected_output for row in rows],
+        output_schema=version.output_schema,
+        threshold=profile.semantic_threshold,
+        constraints=constraints,
+        format_errors={
+            i: aborted[row.id] for i, row in enumerate(rows) if row.id in aborted
+        },
+    )
+
+    values: list[dict[str, Any]] = []
+    for index, (row, (user_message, raw_output, row_trace)) in enumerate(
+        zip(rows, generations, strict=True)
+    ):
+        assert row.id is not None
+        values.append(
+            _result_values(
+                run_id,
+                row.id,
+                row.input_data,
+                row.expected_output,
+                {
+                    "system_instruction": version.system_instruction,
+                    "user_message": user_message,
+                },
+                raw_output,
+                evaluation,
+                index,
+                row_trace,
+            )
         )
-        .correlate(Run)
-        .scalar_subquery()
+        logger.info(
+            "Row 처리 완료 | row_id=%d, status=%s", row.id, evaluation.statuses[index].value
+        )
+
+    # 현재 embedding 모델로 이미 저장된 row는 다시 쓰지 않음
+    model = get_settings().EMBEDDING_MODEL
+    expected_embeddings: dict[int, list[float]] = {}
+    for index, embedding in evaluation.expected_embeddings.items():
+        row = rows[index]
+        if row.id is not None and row.expected_embedding_model != model:
+            expected_embeddings[row.id] = embedding
+    return values, expected_embeddings
+
+
+async def _store_expected_embeddings(
+    session: AsyncSession, model: str, embeddings: dict[int, list[float]]
+) -> None:
+    """기대 출력 embedding을 DatasetRow에 저장 (commit은 호출자 책임)."""
+    if not embeddings:
+        return
+    # primary key 기준 ORM 일괄 UPDATE (executemany)
+    await session.execute(
+        update(DatasetRow),
+        [
+            {"id": row_id, "expected_embedding": embedding, "expected_embedding_model": model}
+            for row_id, embedding in embeddings.items()
+        ],
     )
 
+
+async def _generate_validated(
+    llm: LLMClient,
+    version: PromptVersion,
+    user_message: str,
+) -> tuple[str, str | None]:
+    """스트리밍 생성하며 JSON 형식을 점진적으로 검증.
+
+    Returns:
+        (지금까지 생성된 출력, 형식 위반으로 중단했으면 오류 메시지)
+    """
+    validator = JsonStreamValidator(version.output_schema)
+    parts: list[str] = []
+    async with aclosing(
+        llm.generate_stream(
+            system_instruction=version.system_instruction,
+            user_message=user_message,
+            temperature=version.temperature,
+        )
+    ) as chunks:
+        async for chunk in chunks:
+            parts.append(chunk)
+            if not validator.feed(chunk):
+                break
+    return "".join(parts), validator.error_message
+
+
+async def get_runs_summary(
+    identity: Guest | User,
+    session: AsyncSession,
+    grouped: bool = True,
+) -> list[RunSummaryResponse]:
+    """사용자의 Run 목록 조회 (집계 포함).
+
+    집계는 run_metrics에서 읽으므로 run_results를 스캔하지 않는다 (Run 수에 비례).
+
+    Args:
+        grouped: True면 같은 조합(prompt_id + dataset_id + profile_id)에서 최신 Run만 반환
+    """
     stmt = (
         select(
             Run,
@@ -234,17 +888,17 @@ async def get_runs_summary(
             col(Prompt.name).label("prompt_name"),
             col(Dataset.name).label("dataset_name"),
             col(EvaluatorProfile.name).label("profile_name"),
-            pass_count_subq.label("pass_count"),
-            total_count_subq.label("total_count"),
-            avg_semantic_subq.label("avg_semantic"),
-            format_pass_subq.label("format_pass_count"),
-            semantic_pass_subq.label("semantic_pass_count"),
-            logic_pass_subq.label("logic_pass_count"),
+            col(RunAggregate.pass_count),
+            col(RunAggregate.total_count),
+            col(RunAggregate.semantic_score_sum),
+            col(RunAggregate.format_pass_count),
+            col(RunAggregate.semantic_pass_count),
         )
         .join(PromptVersion, col(Run.prompt_version_id) == col(PromptVersion.id))
         .join(Prompt, col(PromptVersion.prompt_id) == col(Prompt.id))
         .join(Dataset, col(Run.dataset_id) == col(Dataset.id))
         .join(EvaluatorProfile, col(Run.profile_id) == col(EvaluatorProfile.id))
+        .outerjoin(RunAggregate, col(RunAggregate.run_id) == col(Run.id))
     )
 
     if isinstance(identity, Guest):
@@ -285,7 +939,11 @@ async def get_runs_summary(
             pass_rate=(
                 (row.pass_count / row.total_count) if row.total_count else None
             ),
-            avg_semantic=row.avg_semantic,
+            avg_semantic=(
+                (row.semantic_score_sum / row.total_count)
+                if row.total_count
+                else None
+            ),
             format_pass_rate=(
                 (row.format_pass_count / row.total_count)
                 if row.total_count
@@ -296,10 +954,9 @@ async def get_runs_summary(
                 if row.total_count
                 else None
             ),
+            # Logic까지 통과한 row = PASS row
             logic_pass_rate=(
-                (row.logic_pass_count / row.total_count)
-                if row.total_count
-                else None
+                (row.pass_count / row.total_count) if row.total_count else None
             ),
             total_rows=row.total_count or 0,
             created_at=row.Run.created_at,
@@ -312,8 +969,25 @@ async def get_run_detail(
     run_id: int,
     identity: Guest | User,
     session: AsyncSession,
+    cursor: int | None = None,
+    limit: int = 100,
+    status: ResultStatus | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    fields: ResultFields = ResultFields.FULL,
 ) -> RunDetailResponse:
-    """Run 상세 조회 (Live Playground용)."""
+    """Run 상세 조회 (Live Playground용).
+
+    결과는 RunResult.id 기준 keyset 페이지네이션으로 limit개씩 반환하고,
+    메트릭은 run_metrics에서 읽는다.
+
+    Args:
+        cursor: 이전 페이지의 next_cursor (이 id 이후부터 조회)
+        status: 해당 상태의 결과만 조회
+        min_score: semantic_score 하한 (포함)
+        max_score: semantic_score 상한 (포함)
+        fields: summary면 상태/점수 컬럼만 조회 (JSONB·출력 컬럼 제외)
+    """
     stmt = (
         select(
             Run,
@@ -351,49 +1025,87 @@ async def get_run_detail(
         )
     ).scalar_one()
 
-    results = (
-        await session.execute(
-            select(RunResult)
-            .where(col(RunResult.run_id) == run_id)
-            .order_by(col(RunResult.id))
-        )
-    ).scalars().all()
-
     assert run.id is not None
     assert profile.id is not None
 
-    total = len(results)
-    pass_count = sum(1 for r in results if r.status == ResultStatus.PASS)
-    avg_semantic = sum(r.semantic_score for r in results) / total if total else 0.0
-    format_pass_count = sum(1 for r in results if r.is_format_passed)
-    semantic_pass_count = sum(
-        1 for r in results
-        if r.status not in (ResultStatus.FORMAT, ResultStatus.SEMANTIC)
-    )
-    logic_pass_count = pass_count
-
-    result_responses: list[RunResultResponse] = []
-    for idx, r in enumerate(results, 1):
-        assert r.id is not None
-        result_responses.append(
-            RunResultResponse(
+    aggregate = await session.get(RunAggregate, run_id)
+
+    result_filters = [col(RunResult.run_id) == run_id]
+    if cursor is not None:
+        result_filters.append(col(RunResult.id) > cursor)
+    if status is not None:
+        result_filters.append(col(RunResult.status) == status)
+    if min_score is not None:
+        result_filters.append(col(RunResult.semantic_score) >= min_score)
+    if max_score is not None:
+        result_filters.append(col(RunResult.semantic_score) <= max_score)
+
+    # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+    page_size = limit + 1
+    result_responses: list[RunResultResponse] | list[RunResultSummaryResponse]
+    if fields == ResultFields.SUMMARY:
+        summary_rows = (
+            await session.execute(
+                sa_select(
+                    col(RunResult.id),
+                    col(DatasetRow.row_index),
+                    col(RunResult.dataset_row_id),
+                    col(RunResult.status),
+                    col(RunResult.is_format_passed),
+                    col(RunResult.semantic_score),
+                )
+                .join(DatasetRow, col(RunResult.dataset_row_id) == col(DatasetRow.id))
+                .where(*result_filters)
+                .order_by(col(RunResult.id))
+                .limit(page_size)
+            )
+        ).all()
+        result_responses = [
+            RunResultSummaryResponse(
                 id=r.id,
-                row_index=idx,
+                row_index=r.row_index,
                 dataset_row_id=r.dataset_row_id,
-                input_snapshot=r.input_snapshot,
-                expected_snapshot=r.expected_snapshot,
-                assembled_prompt=AssembledPrompt(
-                    system_instruction=r.assembled_prompt.get("system_instruction", ""),
-                    user_message=r.assembled_prompt.get("user_message", ""),
-                ),
                 status=r.status,
                 is_format_passed=r.is_format_passed,
                 semantic_score=r.semantic_score,
-                logic_results=r.logic_results,
-                raw_output=r.raw_output,
-                parsed_output=r.parsed_output,
             )
-        )
+            for r in summary_rows[:limit]
+        ]
+        has_more = len(summary_rows) > limit
+    else:
+        full_rows = (
+            await session.execute(
+                select(RunResult, col(DatasetRow.row_index))
+                .join(DatasetRow, col(RunResult.dataset_row_id) == col(DatasetRow.id))
+                .where(*result_filters)
+                .order_by(col(RunResult.id))
+                .limit(page_size)
+            )
+        ).all()
+        full_responses: list[RunResultResponse] = []
+        for r, row_index in full_rows[:limit]:
+            assert r.id is not None
+            full_responses.append(
+                RunResultResponse(
+                    id=r.id,
+                    row_index=row_index,
+                    dataset_row_id=r.dataset_row_id,
+                    input_snapshot=r.input_snapshot,
+                    expected_snapshot=r.expected_snapshot,
+                    assembled_prompt=AssembledPrompt(
+                        system_instruction=r.assembled_prompt.get("system_instruction", ""),
+                        user_message=r.assembled_prompt.get("user_message", ""),
+                    ),
+                    status=r.status,
+                    is_format_passed=r.is_format_passed,
+                    semantic_score=r.semantic_score,
+                    logic_results=r.logic_results,
+                    raw_output=r.raw_output,
+                    parsed_output=r.parsed_output,
+                )
+            )
+        result_responses = full_responses
+        has_more = len(full_rows) > limit
 
     return RunDetailResponse(
         id=run.id,
@@ -406,20 +1118,16 @@ async def get_run_detail(
         dataset_name=dataset_name,
         status=run.status.value,
         created_at=run.created_at,
+        source_run_id=run.source_run_id,
         profile=ProfileInRun(
             id=profile.id,
             name=profile.name,
             semantic_threshold=profile.semantic_threshold,
             global_constraints=profile.global_constraints or [],
         ),
-        metrics=RunMetrics(
-            pass_rate=(pass_count / total) if total else 0.0,
-            avg_semantic=avg_semantic,
-            format_pass_rate=(format_pass_count / total) if total else 0.0,
-            semantic_pass_rate=(semantic_pass_count / total) if total else 0.0,
-            logic_pass_rate=(logic_pass_count / total) if total else 0.0,
-        ),
+        metrics=aggregates.to_run_metrics(aggregate),
         results=result_responses,
+        next_cursor=result_responses[-1].id if has_more else None,
     )
 
 
@@ -455,31 +1163,15 @@ async def get_related_versions(
     dataset_id = current_run.dataset_id
     profile_id = current_run.profile_id
 
-    pass_count_subq = (
-        select(func.count())
-        .where(
-            col(RunResult.run_id) == col(Run.id),
-            col(RunResult.status) == ResultStatus.PASS,
-        )
-        .correlate(Run)
-        .scalar_subquery()
-    )
-
-    total_count_subq = (
-        select(func.count())
-        .where(col(RunResult.run_id) == col(Run.id))
-        .correlate(Run)
-        .scalar_subquery()
-    )
-
     related_runs_stmt = (
         select(
             Run,
             col(PromptVersion.version_number).label("version_number"),
-            pass_count_subq.label("pass_count"),
-            total_count_subq.label("total_count"),
+            col(RunAggregate.pass_count),
+            col(RunAggregate.total_count),
         )
         .join(PromptVersion, col(Run.prompt_version_id) == col(PromptVersion.id))
+        .outerjoin(RunAggregate, col(RunAggregate.run_id) == col(Run.id))
         .where(
             col(PromptVersion.prompt_id) == prompt_id,
             col(Run.dataset_id) == dataset_id,
@@ -529,14 +1221,14 @@ async def get_related_versions(
     )
 
 
-async def _get_run_results_with_auth(
+async def verify_run_owner(
     run_id: int,
     identity: Guest | User,
     session: AsyncSession,
-) -> list[RunResult]:
-    """Run 소유권 검증 후 결과 조회."""
+) -> None:
+    """Run 소유권 검증 (없거나 남의 Run이면 404)."""
     stmt = (
-        select(Run)
+        select(Run.id)
         .join(PromptVersion, col(Run.prompt_version_id) == col(PromptVersion.id))
         .join(Prompt, col(PromptVersion.prompt_id) == col(Prompt.id))
         .where(col(Run.id) == run_id)
@@ -547,21 +1239,208 @@ async def _get_run_results_with_auth(
     else:
         stmt = stmt.where(col(Prompt.user_id) == identity.id)
 
-    result = await session.execute(stmt)
-    run = result.scalar_one_or_none()
-
-    if not run:
+    if (await session.execute(stmt)).scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Run을 찾을 수 없습니다")
 
-    results = (
+
+async def find_similar_results(
+    run_id: int,
+    result_id: int,
+    identity: Guest | User,
+    session: AsyncSession,
+    limit: int = 10,
+) -> list[SimilarResultResponse]:
+    """결과 하나와 출력이 가장 비슷한 결과를 identity의 모든 Run에서 검색 (코사인 거리 순).
+
+    같은 embedding 모델·차원으로 저장된 출력끼리만 비교하며, 인덱스 차원의 벡터는
+    HNSW 인덱스로 근사 검색한다.
+    """
+    await verify_run_owner(run_id, identity, session)
+
+    target = (
         await session.execute(
-            select(RunResult)
-            .where(col(RunResult.run_id) == run_id)
-            .order_by(col(RunResult.dataset_row_id))
+            select(
+                col(RunResult.output_embedding_model),
+                func.vector_dims(col(RunResult.output_embedding)),
+            ).where(col(RunResult.id) == result_id, col(RunResult.run_id) == run_id)
+        )
+    ).one_or_none()
+    if target is None:
+        raise HTTPException(status_code=404, detail="결과를 찾을 수 없습니다")
+    model, dimensions = target
+    if model is None:
+        raise HTTPException(
+            status_code=400,
+            detail="출력 embedding이 없는 결과입니다 (Format 실패 또는 Label 스키마)",
+        )
+
+    target_embedding = (
+        select(col(RunResult.output_embedding))
+        .where(col(RunResult.id) == result_id)
+        .scalar_subquery()
+    )
+    distance = cosine_distance(
+        RunResult.output_embedding, target_embedding, dimensions
+    ).label("distance")
+    stmt = (
+        sa_select(
+            col(RunResult.id),
+            col(RunResult.run_id),
+            col(RunResult.dataset_row_id),
+            col(RunResult.status),
+            col(RunResult.semantic_score),
+            col(RunResult.raw_output),
+            distance,
+        )
+        .join(Run, col(Run.id) == col(RunResult.run_id))
+        .join(PromptVersion, col(Run.prompt_version_id) == col(PromptVersion.id))
+        .join(Prompt, col(PromptVersion.prompt_id) == col(Prompt.id))
+        .where(
+            col(RunResult.id) != result_id,
+            col(RunResult.output_embedding_model) == model,
+            # 부분 인덱스 조건과 일치하도록 차원은 리터럴로 렌더링
+            func.vector_dims(col(RunResult.output_embedding))
+            == literal(dimensions, literal_execute=True),
+        )
+        .order_by(distance)
+        .limit(limit)
+    )
+    if isinstance(identity, Guest):
+        stmt = stmt.where(col(Prompt.guest_id) == identity.id)
+    else:
+        stmt = stmt.where(col(Prompt.user_id) == identity.id)
+
+    rows = (await session.execute(stmt)).all()
+    return [
+        SimilarResultResponse(
+            id=row.id,
+            run_id=row.run_id,
+            dataset_row_id=row.dataset_row_id,
+            status=row.status,
+            semantic_score=row.semantic_score,
+            raw_output=row.raw_output,
+            distance=row.distance,
+        )
+        for row in rows
+    ]
+
+
+async def get_run_progress(
+    run_id: int,
+    identity: Guest | User,
+    session: AsyncSession,
+) -> RunProgressResponse:
+    """Run 진행 상황 - run_metrics 카운터만 조회 (폴링용)."""
+    await verify_run_owner(run_id, identity, session)
+    progress = await aggregates.load_progress(session, run_id)
+    assert progress is not None
+    return progress
+
+
+async def stream_run_events(run_id: int) -> AsyncIterator[str]:
+    """Run 진행 이벤트를 SSE 형식으로 스트리밍 (소유권 검증은 호출자 책임).
+
+    현재 progress 스냅샷을 먼저 보내고, 이후 워커가 NOTIFY한 rows/progress 이벤트를
+    전달하다가 status 이벤트(Run 종료)를 보내면 끝낸다. 이미 끝난 Run은 스냅샷과
+    status만 보낸다.
+    """
+    async with get_run_event_broker().subscribe(run_id) as queue:
+        # 구독한 뒤 스냅샷을 읽어야 그 사이에 저장된 배치의 이벤트를 놓치지 않음
+        async with async_session() as session:
+            progress = await aggregates.load_progress(session, run_id)
+        if progress is None:
+            return
+        yield progress_event(progress).to_sse()
+        if progress.status != RunStatus.RUNNING:
+            yield RunEvent(run_id, "status", {"status": progress.status.value}).to_sse()
+            return
+
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_SECONDS)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            # LISTEN 연결이 끊기면 스트림 종료 (클라이언트가 다시 연결)
+            if event is None:
+                return
+            yield event.to_sse()
+            if event.event == "status":
+                return
+
+
+async def get_run_timing(
+    run_id: int,
+    identity: Guest | User,
+    session: AsyncSession,
+) -> RunTimingResponse:
+    """RunResult.trace의 단계별 소요 시간 분위수와 토큰·횟수 합계."""
+    await verify_run_owner(run_id, identity, session)
+    in_run = col(RunResult.run_id) == run_id
+
+    rows, traced_rows = (await session.execute(
+        # trace 컬럼의 None은 JSON null로 저장되므로 timings_ms 유무로 판단
+        select(func.count(), func.count(col(RunResult.trace)["timings_ms"])).where(in_run)
+    )).one()
+
+    # 단계는 trace의 timings_ms key를 펼쳐 key별로 percentile_cont 계산
+    stages = (
+        func.jsonb_each_text(col(RunResult.trace)["timings_ms"])
+        .table_valued("key", "value")
+        .render_derived(name="stages")
+    )
+    ms = cast(stages.c.value, Float)
+    stage_rows = (await session.execute(
+        sa_select(
+            stages.c.key,
+            func.count(),
+            func.percentile_cont(0.5).within_group(ms),
+            func.percentile_cont(0.95).within_group(ms),
+            func.percentile_cont(0.99).within_group(ms),
         )
-    ).scalars().all()
+        .select_from(RunResult)
+        .join(stages, true())
+        .where(in_run)
+        .group_by(stages.c.key)
+    )).tuples().all()
+
+    def _stage_order(stage: str) -> tuple[int, str]:
+        order = TRACE_STAGES.index(stage) if stage in TRACE_STAGES else len(TRACE_STAGES)
+        return order, stage
+
+    return RunTimingResponse(
+        run_id=run_id,
+        rows=rows,
+        traced_rows=traced_rows,
+        stages=[
+            StageTiming(stage=stage, count=count, p50_ms=p50, p95_ms=p95, p99_ms=p99)
+            for stage, count, p50, p95, p99 in sorted(
+                stage_rows, key=lambda r: _stage_order(r[0])
+            )
+        ],
+        tokens=await _sum_trace_values(session, run_id, "tokens"),
+        counts=await _sum_trace_values(session, run_id, "counts"),
+    )
+
 
-    return list(results)
+async def _sum_trace_values(
+    session: AsyncSession, run_id: int, section: str
+) -> dict[str, int]:
+    """trace[section]의 key별 합계 (예: tokens → prompt/output 토큰 수)."""
+    values = (
+        func.jsonb_each_text(col(RunResult.trace)[section])
+        .table_valued("key", "value")
+        .render_derived(name="trace_values")
+    )
+    sums = (await session.execute(
+        select(values.c.key, func.sum(cast(values.c.value, Float)))
+        .select_from(RunResult)
+        .join(values, true())
+        .where(col(RunResult.run_id) == run_id)
+        .group_by(values.c.key)
+        .order_by(values.c.key)
+    )).tuples().all()
+    return {key: int(total) for key, total in sums}
 
 
 async def compare_runs(
@@ -570,40 +1449,108 @@ async def compare_runs(
     identity: Guest | User,
     session: AsyncSession,
 ) -> RegressionComparisonResponse:
-    """두 Run 간 회귀 분석용 raw 데이터 제공."""
-    base_results = await _get_run_results_with_auth(base_run_id, identity, session)
-    target_results = await _get_run_results_with_auth(target_run_id, identity, session)
-
-    base_by_row = {r.dataset_row_id: r for r in base_results}
-    target_by_row = {r.dataset_row_id: r for r in target_results}
-
-    common_row_ids = sorted(set(base_by_row.keys()) & set(target_by_row.keys()))
-
-    row_comparisons: list[RowComparisonData] = []
-    base_scores: list[float] = []
-    target_scores: list[float] = []
-
-    for idx, row_id in enumerate(common_row_ids, 1):
-        base = base_by_row[row_id]
-        target = target_by_row[row_id]
-
-        row_comparisons.append(
-            RowComparisonData(
-                row_index=idx,
-                dataset_row_id=row_id,
-                base_status=base.status,
-                target_status=target.status,
-                base_semantic_score=base.semantic_score,
-                target_semantic_score=target.semantic_score,
+    """두 Run 간 회귀 분석용 raw 데이터 제공.
+
+    base/target 결과는 SQL에서 dataset_row_id로 조인하고 비교에 필요한 컬럼만 조회한다.
+    """
+    await verify_run_owner(base_run_id, identity, session)
+    await verify_run_owner(target_run_id, identity, session)
+
+    base = aliased(RunResult, name="base")
+    target = aliased(RunResult, name="target")
+    rows = (
+        await session.execute(
+            sa_select(
+                col(base.dataset_row_id),
+                col(base.status),
+                col(target.status),
+                col(base.semantic_score),
+                col(target.semantic_score),
+            )
+            .join(target, col(target.dataset_row_id) == col(base.dataset_row_id))
+            .where(
+                col(base.run_id) == base_run_id,
+                col(target.run_id) == target_run_id,
             )
+            .order_by(col(base.dataset_row_id))
         )
+    ).tuples().all()
+
+    row_comparisons = [
+        RowComparisonData(
+            row_index=idx,
+            dataset_row_id=row_id,
+            base_status=base_status,
+            target_status=target_status,
+            base_semantic_score=base_score,
+            target_semantic_score=target_score,
+        )
+        for idx, (row_id, base_status, target_status, base_score, target_score)
+        in enumerate(rows, 1)
+    ]
 
-        base_scores.append(base.semantic_score)
-        target_scores.append(target.semantic_score)
-
+    base_scores = np.fromiter((r[3] for r in rows), dtype=np.float64, count=len(rows))
+    target_scores = np.fromiter((r[4] for r in rows), dtype=np.float64, count=len(rows))
     p_value = calculate_p_value(base_scores, target_scores)
 
     return RegressionComparisonResponse(
         p_value=p_value,
         row_comparisons=row_comparisons,
     )
+
+
+def _export_record(result: RunResult) -> dict[str, Any]:
+    record = {column: getattr(result, column) for column in EXPORT_COLUMNS}
+    record["status"] = result.status.value
+    return record
+
+
+def _format_csv_chunk(results: Sequence[RunResult], header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    for result in results:
+        record = _export_record(result)
+        writer.writerow(
+            json.dumps(value, ensure_ascii=False) if isinstance(value, dict | list) else value
+            for value in record.values()
+        )
+    return buffer.getvalue()
+
+
+async def export_run_results(
+    run_id: int,
+    export_format: ExportFormat,
+) -> AsyncIterator[str]:
+    """Run 결과를 NDJSON/CSV 청크로 스트리밍.
+
+    요청 세션과 별개의 세션에서 서버 사이드 커서(stream_scalars + yield_per)로 읽으므로
+    Run 크기와 무관하게 EXPORT_CHUNK_SIZE 만큼만 메모리에 올린다.
+    소유권 검증은 호출자 책임.
+    """
+    async with async_session() as session:
+        stmt = (
+            select(RunResult)
+            .where(col(RunResult.run_id) == run_id)
+            .order_by(col(RunResult.id))
+            .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        )
+        results = await session.stream_scalars(stmt)
+
+        exported = 0
+        async for partition in results.partitions():
+            if export_format == ExportFormat.CSV:
+                yield _format_csv_chunk(partition, header=exported == 0)
+            else:
+                yield "".join(
+                    json.dumps(_export_record(r), ensure_ascii=False) + "\n"
+                    for r in partition
+                )
+            # identity map은 약한 참조라 직렬화가 끝난 partition은 바로 해제됨
+            exported += len(partition)
+
+        if export_format == ExportFormat.CSV and exported == 0:
+            yield _format_csv_chunk([], header=True)
+
+        logger.info("Run 결과 export 완료 | run_id=%d, format=%s, rows=%d", run_id, export_format.value, exported)
@@ -0,0 +1,43 @@
+"""프롬프트 템플릿 컴파일 - user_template을 한 번 분할해 두고 row마다 join 한 번으로 조립."""
+
+import re
+from collections.abc import Collection, Mapping
+
+from src.common.types import JsonValue
+
+# {{key}} - key 안에는 중괄호가 올 수 없음 ({{{key}}}는 "{" + {{key}} + "}")
+_PLACEHOLDER = re.compile(r"\{\{([^{}]*)\}\}")
+
+
+class CompiledTemplate:
+    """literal/slot 구간으로 미리 분할한 user_template.
+
+    slot 자리에는 원래 placeholder 문자열을 넣어 두므로, input_data에 없는 key는
+    그대로 남는다.
+    """
+
+    def __init__(self, user_template: str):
+        self.source = user_template
+        self._parts: list[str] = []
+        self._slots: list[tuple[int, str]] = []
+
+        position = 0
+        for match in _PLACEHOLDER.finditer(user_template):
+            self._parts.append(user_template[position : match.start()])
+            self._slots.append((len(self._parts), match.group(1)))
+            self._parts.append(match.group(0))
+            position = match.end()
+        self._parts.append(user_template[position:])
+
+        self.placeholders: frozenset[str] = frozenset(name for _, name in self._slots)
+
+    def missing(self, keys: Collection[str]) -> list[str]:
+        """keys에 없는 placeholder 목록 (정렬)."""
+        return sorted(self.placeholders.difference(keys))
+
+    def render(self, input_data: Mapping[str, JsonValue]) -> str:
+        parts = self._parts.copy()
+        for index, name in self._slots:
+            if name in input_data:
+                parts[index] = str(input_data[name])
+        return "".join(parts)
@@ -0,0 +1,203 @@
+"""Run 워커 프로세스.
+
+실행: uv run python -m src.runs.worker [--concurrency N]
+
+여러 프로세스/호스트로 수평 확장할 수 있으며, 각 워커는 최대
+WORKER_CONCURRENCY개의 Run을 동시에 처리한다.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import socket
+from wsgiref.simple_server import WSGIServer
+
+from prometheus_client import start_http_server
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src import database
+from src.common import metrics
+from src.config import get_settings
+from src.database import async_session
+from src.embeddings.factory import close_embedding_clients
+from src.llm.factory import close_llm_clients
+from src.runs import queue
+from src.runs.models import RunJob
+from src.runs.service import process_run
+
+logger = logging.getLogger(__name__)
+
+
+class RunWorker:
+    """Run 작업 큐를 폴링하며 Run을 동시에 처리하는 워커."""
+
+    def __init__(
+        self,
+        worker_id: str | None = None,
+        concurrency: int | None = None,
+        poll_interval: float | None = None,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+    ):
+        settings = get_settings()
+        self.worker_id: str = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.concurrency: int = concurrency or settings.WORKER_CONCURRENCY
+        self.poll_interval: float = poll_interval or settings.WORKER_POLL_INTERVAL
+        self.heartbeat_interval: float = settings.RUN_JOB_HEARTBEAT_SECONDS
+        self.max_attempts: int = settings.RUN_JOB_MAX_ATTEMPTS
+        self.session_factory = session_factory
+        self._tasks: dict[int, asyncio.Task[None]] = {}
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """새 작업 가져오기를 중단 (실행 중인 Run은 끝까지 처리)."""
+        logger.info(
+            "워커 종료 요청 | worker_id=%s, in_flight=%d",
+            self.worker_id,
+            len(self._tasks),
+        )
+        self._stopping.set()
+
+    async def run_once(self) -> int:
+        """빈 슬롯만큼 작업을 가져와 시작. 시작한 작업 수 반환."""
+        free_slots = self.concurrency - len(self._tasks)
+        async with self.session_factory() as session:
+            jobs = await queue.claim_jobs(session, self.worker_id, free_slots)
+
+        for job in jobs:
+            assert job.id is not None
+            logger.info(
+                "작업 시작 | job_id=%d, run_id=%d, attempt=%d",
+                job.id,
+                job.run_id,
+                job.attempts,
+            )
+            self._tasks[job.id] = asyncio.create_task(self._execute(job))
+        metrics.WORKER_ACTIVE_RUNS.set(len(self._tasks))
+        return len(jobs)
+
+    async def drain(self) -> None:
+        """실행 중인 모든 작업이 끝날 때까지 대기."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def run_forever(self) -> None:
+        logger.info(
+            "워커 시작 | worker_id=%s, concurrency=%d, poll_interval=%.1fs",
+            self.worker_id,
+            self.concurrency,
+            self.poll_interval,
+        )
+        heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        try:
+            while not self._stopping.is_set():
+                try:
+                    claimed = await self.run_once()
+                except Exception:
+                    logger.exception(
+                        "작업 가져오기 실패 | worker_id=%s", self.worker_id
+                    )
+                    claimed = 0
+
+                # 방금 작업을 가져왔고 슬롯이 남아 있으면 바로 다시 확인
+                if claimed and len(self._tasks) < self.concurrency:
+                    continue
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+            await self.drain()
+        finally:
+            heartbeat_task.cancel()
+        logger.info("워커 종료 | worker_id=%s", self.worker_id)
+
+    async def _execute(self, job: RunJob) -> None:
+        assert job.id is not None
+        error: str | None = None
+        try:
+            # 재시도(이전 워커 중단 포함)면 이미 저장된 row는 건너뜀.
+            # 마지막 시도에서만 Run을 FAILED로 표시 (finish_job의 재시도 판단과 같은 기준)
+            await process_run(
+                job.run_id,
+                resume=job.attempts > 1,
+                final_attempt=job.attempts >= self.max_attempts,
+            )
+        except Exception as e:
+            logger.exception("작업 실패 | job_id=%d, run_id=%d", job.id, job.run_id)
+            error = str(e) or type(e).__name__
+
+        try:
+            async with self.session_factory() as session:
+                status = await queue.finish_job(session, self.worker_id, job.id, error)
+            if status is None:
+                logger.warning(
+                    "다른 워커가 가져간 작업, 종료 처리 생략 | job_id=%d, run_id=%d",
+                    job.id,
+                    job.run_id,
+                )
+            else:
+                logger.info(
+                    "작업 종료 | job_id=%d, run_id=%d, status=%s",
+                    job.id,
+                    job.run_id,
+                    status.value,
+                )
+        finally:
+            self._tasks.pop(job.id, None)
+            metrics.WORKER_ACTIVE_RUNS.set(len(self._tasks))
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                async with self.session_factory() as session:
+                    await queue.heartbeat(session, self.worker_id, list(self._tasks))
+            except Exception:
+                logger.exception("heartbeat 실패 | worker_id=%s", self.worker_id)
+
+
+async def _main(concurrency: int | None) -> None:
+    settings = get_settings()
+    # API와 별도로 크기를 정한 워커용 연결 풀 사용
+    await database.use_pool("worker")
+    worker = RunWorker(concurrency=concurrency)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    metrics_server: WSGIServer | None = None
+    if settings.WORKER_METRICS_PORT is not None:
+        metrics_server, _ = start_http_server(
+            settings.WORKER_METRICS_PORT, settings.WORKER_METRICS_HOST
+        )
+        logger.info(
+            "지표 서버 시작 | host=%s, port=%d",
+            settings.WORKER_METRICS_HOST,
+            settings.WORKER_METRICS_PORT,
+        )
+    try:
+        await worker.run_forever()
+    finally:
+        if metrics_server is not None:
+            metrics_server.shutdown()
+        await close_llm_clients()
+        await close_embedding_clients()
+        await database.engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PRS Run 워커")
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="동시에 처리할 Run 수"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    asyncio.run(_main(args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
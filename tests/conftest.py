@@ -1,5 +1,13 @@
+import asyncio
 import os
-from collections.abc import AsyncGenerator, Callable, Coroutine
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Sequence,
+)
 from typing import Any
 from uuid import UUID
 
@@ -10,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
 
+from src.auth.cache import clear_auth_caches
 from src.auth.models import Guest
 from src.common.types import LogicConstraint
 from src.database import get_session
@@ -40,11 +49,15 @@ def test_session_factory(test_engine):
 @pytest.fixture(autouse=True)
 async def setup_database(test_engine) -> AsyncGenerator[None, None]:
     """각 테스트 전 DB 테이블 생성, 후 삭제 (enum 포함)."""
+    # 테이블을 다시 만들면 id가 재사용되므로 이전 테스트의 인증 캐시를 비움
+    clear_auth_caches()
     async with test_engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
         await conn.run_sync(SQLModel.metadata.drop_all)
         await conn.execute(text("DROP TYPE IF EXISTS outputschematype CASCADE"))
         await conn.execute(text("DROP TYPE IF EXISTS runstatus CASCADE"))
         await conn.execute(text("DROP TYPE IF EXISTS resultstatus CASCADE"))
+        await conn.execute(text("DROP TYPE IF EXISTS jobstatus CASCADE"))
         await conn.run_sync(SQLModel.metadata.create_all)
     yield
     async with test_engine.begin() as conn:
@@ -215,6 +228,48 @@ class MockLLMClient:
             return result
         return self.responses[-1]
 
+    async def generate_stream(
+        self,
+        system_instruction: str,
+        user_message: str,
+        temperature: float = 1.0,
+    ) -> AsyncIterator[str]:
+        yield await self.generate(system_instruction, user_message, temperature)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def stream_from(
+    generate: Callable[..., Awaitable[str]],
+) -> Callable[..., AsyncIterator[str]]:
+    """generate mock의 응답을 한 조각으로 흘려보내는 generate_stream (호출은 generate에 기록)."""
+
+    async def generate_stream(**kwargs: object) -> AsyncIterator[str]:
+        yield await generate(**kwargs)
+
+    return generate_stream
+
+
+class FakeEmbeddingClient:
+    """테스트용 Embedding 클라이언트 - 모든 텍스트를 같은 벡터로 변환, 요청 기록."""
+
+    model = "text-embedding-3-small"
+
+    def __init__(self, vector: list[float] | None = None, latency: float = 0.0):
+        self.vector = vector or [1.0, 0.0]
+        self.latency = latency
+        self.calls: list[list[str]] = []
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return [list(self.vector) for _ in texts]
+
+    async def aclose(self) -> None:
+        pass
+
 
 @pytest.fixture
 def mock_llm_response() -> str:
@@ -0,0 +1,139 @@
+"""Run 진행 이벤트 (LISTEN/NOTIFY) 테스트."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.runs.events import (
+    MAX_PAYLOAD_BYTES,
+    RunEvent,
+    RunEventBroker,
+    publish,
+    row_events,
+)
+from tests.conftest import TEST_DATABASE_URL
+
+
+def test_row_events_split_under_payload_limit() -> None:
+    """rows 이벤트는 NOTIFY payload 상한을 넘지 않도록 나뉘고 순서를 유지."""
+    rows = [(i, "pass") for i in range(2000)]
+
+    events = row_events(1, rows)
+
+    assert len(events) > 1
+    assert all(len(json.dumps(e.data)) <= MAX_PAYLOAD_BYTES + 20 for e in events)
+    flattened = [row["datasetRowId"] for e in events for row in e.data["rows"]]
+    assert flattened == list(range(2000))
+
+
+@pytest.mark.asyncio
+async def test_events_delivered_on_commit_to_all_subscribers(
+    test_session_factory,
+) -> None:
+    """NOTIFY는 commit 후에만 전달되고, 같은 Run의 구독자 모두가 받음 (연결은 하나)."""
+    broker = RunEventBroker(TEST_DATABASE_URL)
+    try:
+        async with (
+            broker.subscribe(1) as first,
+            broker.subscribe(1) as second,
+            broker.subscribe(2) as other,
+        ):
+            async with test_session_factory() as session:
+                await publish(session, [RunEvent(1, "progress", {"processed": 3})])
+                await asyncio.sleep(0.05)
+                assert first.empty()
+                await session.commit()
+
+            received = [
+                await asyncio.wait_for(queue.get(), timeout=2)
+                for queue in (first, second)
+            ]
+
+            assert received == [RunEvent(1, "progress", {"processed": 3})] * 2
+            assert other.empty()
+            assert broker.subscriber_count(1) == 2
+
+        assert broker.subscriber_count(1) == 0
+    finally:
+        await broker.close()
+
+
+@pytest.mark.asyncio
+async def test_streams_end_when_broker_closes() -> None:
+    """LISTEN 연결이 끊기면 구독 큐에 종료 신호(None) 전달."""
+    broker = RunEventBroker(TEST_DATABASE_URL)
+    async with broker.subscribe(1) as queue:
+        await broker.close()
+        assert await asyncio.wait_for(queue.get(), timeout=1) is None
+
+
+@pytest.mark.asyncio
+async def test_process_run_publishes_rows_progress_and_status(
+    test_session_factory,
+    guest_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """process_run은 배치마다 rows/progress, 끝나면 status 이벤트를 보냄."""
+    from unittest.mock import AsyncMock, patch
+
+    from src.runs.models import Run, RunStatus
+    from src.runs.service import process_run
+    from tests.conftest import FakeEmbeddingClient
+
+    guest = await guest_factory()
+    _, version = await prompt_factory(guest.id)
+    dataset = await dataset_factory(
+        guest.id,
+        rows=[{"input": {"input": str(i)}, "expected": "기대"} for i in range(3)],
+    )
+    profile = await profile_factory(guest.id)
+    async with test_session_factory() as session:
+        run = Run(
+            prompt_version_id=version.id,
+            dataset_id=dataset.id,
+            profile_id=profile.id,
+            status=RunStatus.RUNNING,
+        )
+        session.add(run)
+        await session.commit()
+        run_id = run.id
+    assert run_id is not None
+
+    mock_llm = AsyncMock()
+    mock_llm.generate = AsyncMock(return_value="기대")
+    broker = RunEventBroker(TEST_DATABASE_URL)
+    try:
+        async with broker.subscribe(run_id) as queue:
+            with (
+                patch("src.runs.service.async_session", test_session_factory),
+                patch("src.runs.service.get_llm_client", return_value=mock_llm),
+                patch(
+                    "src.runs.evaluator.semantic_layer.get_embedding_client",
+                    return_value=FakeEmbeddingClient(),
+                ),
+            ):
+                await process_run(run_id)
+
+            received: list[RunEvent] = []
+            while not received or received[-1].event != "status":
+                event = await asyncio.wait_for(queue.get(), timeout=2)
+                assert event is not None
+                received.append(event)
+    finally:
+        await broker.close()
+
+    assert [e.event for e in received] == [
+        "progress",
+        "rows",
+        "progress",
+        "progress",
+        "status",
+    ]
+    assert received[0].data["targetCount"] == 3
+    assert received[0].data["processed"] == 0
+    assert len(received[1].data["rows"]) == 3
+    assert received[2].data["processed"] == 3
+    assert received[-1].data == {"status": "completed"}
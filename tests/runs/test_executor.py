@@ -0,0 +1,101 @@
+"""Row 동시 실행 엔진 테스트 - 순서 보장, 동시성 제한, 처리 속도."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.runs.executor import execute_rows
+
+
+class SlowLLMClient:
+    """고정 지연 후 응답하는 가짜 LLM 클라이언트 (동시 호출 수 기록)."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(
+        self,
+        system_instruction: str,  # noqa: ARG002
+        user_message: str,
+        temperature: float = 1.0,  # noqa: ARG002
+    ) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return f"echo:{user_message}"
+        finally:
+            self.in_flight -= 1
+
+
+class TestExecuteRows:
+    """execute_rows 단위 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self) -> None:
+        """완료 순서와 무관하게 입력 순서대로 결과 반환."""
+
+        async def handler(i: int) -> int:
+            await asyncio.sleep(0.001 * (10 - i))
+            return i * 10
+
+        results = await execute_rows(list(range(10)), handler, concurrency=10)
+
+        assert results == [i * 10 for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_respected(self) -> None:
+        """동시 실행 수가 concurrency를 넘지 않음."""
+        llm = SlowLLMClient(latency=0.01)
+
+        async def handler(i: int) -> str:
+            return await llm.generate("sys", str(i))
+
+        await execute_rows(list(range(20)), handler, concurrency=4)
+
+        assert llm.max_in_flight == 4
+
+    @pytest.mark.asyncio
+    async def test_first_error_propagates(self) -> None:
+        """하나라도 실패하면 예외 전파."""
+
+        async def handler(i: int) -> int:
+            if i == 3:
+                raise ValueError("boom")
+            await asyncio.sleep(0.01)
+            return i
+
+        with pytest.raises(ValueError, match="boom"):
+            await execute_rows(list(range(8)), handler, concurrency=8)
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency_raises(self) -> None:
+        """concurrency < 1 이면 ValueError."""
+
+        async def handler(i: int) -> int:
+            return i
+
+        with pytest.raises(ValueError):
+            await execute_rows([1], handler, concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_execution_is_faster(self) -> None:
+        """동시 실행 시 wall-clock이 동시성 배수만큼 감소."""
+        llm = SlowLLMClient(latency=0.02)
+        rows = list(range(40))
+
+        async def handler(i: int) -> str:
+            return await llm.generate("sys", str(i))
+
+        started = time.perf_counter()
+        await execute_rows(rows, handler, concurrency=1)
+        sequential = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await execute_rows(rows, handler, concurrency=10)
+        concurrent = time.perf_counter() - started
+
+        assert concurrent < sequential / 4
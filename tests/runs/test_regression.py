@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from httpx import AsyncClient
 
@@ -33,6 +34,14 @@ class TestCalculatePValue:
         """길이 불일치 = p-value 1.0"""
         assert calculate_p_value([0.8, 0.9], [0.5]) == 1.0
 
+    def test_numpy_arrays_match_list_result(self):
+        """NumPy 배열 입력 = list 입력과 동일한 p-value"""
+        base = [0.9, 0.88, 0.92, 0.87, 0.91]
+        target = [0.5, 0.48, 0.52, 0.47, 0.51]
+        assert calculate_p_value(np.array(base), np.array(target)) == pytest.approx(
+            calculate_p_value(base, target)
+        )
+
 
 @pytest.mark.asyncio
 async def test_compare_runs_not_found(
@@ -61,6 +70,7 @@ async def test_compare_runs_returns_row_comparisons(
 
     from src.runs.models import Run, RunStatus
     from src.runs.service import process_run
+    from tests.conftest import stream_from
 
     guest_id = guest_cookies["guest_id"]
     prompt, version1 = await prompt_factory(guest_id)
@@ -87,6 +97,7 @@ async def test_compare_runs_returns_row_comparisons(
 
     mock_llm1 = AsyncMock()
     mock_llm1.generate = AsyncMock(side_effect=["TRUE", "FALSE"])
+    mock_llm1.generate_stream = stream_from(mock_llm1.generate)
 
     with (
         patch("src.runs.service.async_session", test_session_factory),
@@ -118,6 +129,7 @@ async def test_compare_runs_returns_row_comparisons(
 
     mock_llm2 = AsyncMock()
     mock_llm2.generate = AsyncMock(side_effect=["FALSE", "FALSE"])
+    mock_llm2.generate_stream = stream_from(mock_llm2.generate)
 
     with (
         patch("src.runs.service.async_session", test_session_factory),
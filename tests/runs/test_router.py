@@ -1,5 +1,7 @@
 """runs router 테스트 - HTTP 계층만 검증."""
 
+from collections.abc import AsyncIterator
+
 import pytest
 from httpx import AsyncClient
 
@@ -259,3 +261,732 @@ async def test_get_run_detail_includes_layer_metrics(
     assert metrics["formatPassRate"] == 1.0
     assert metrics["semanticPassRate"] == 1.0
     assert metrics["logicPassRate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_list_runs_without_results_has_no_rates(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """결과가 아직 없는 Run(run_metrics 없음)은 통과율 None, total 0."""
+    from src.runs.models import Run, RunStatus
+
+    guest_id = guest_cookies["guest_id"]
+    _, version = await prompt_factory(guest_id)
+    dataset = await dataset_factory(guest_id)
+    profile = await profile_factory(guest_id)
+
+    async with test_session_factory() as session:
+        session.add(
+            Run(
+                prompt_version_id=version.id,
+                dataset_id=dataset.id,
+                profile_id=profile.id,
+                status=RunStatus.RUNNING,
+            )
+        )
+        await session.commit()
+
+    response = await client.get("/runs", cookies=guest_cookies)
+
+    assert response.status_code == 200
+    run_data = response.json()[0]
+    assert run_data["passRate"] is None
+    assert run_data["avgSemantic"] is None
+    assert run_data["totalRows"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_run_detail_paginates_filters_and_projects(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """상세 결과는 cursor로 페이지네이션되고 status/점수 필터, summary projection 지원."""
+    from unittest.mock import patch
+
+    from src.prompts.models import OutputSchemaType
+    from src.runs.models import Run, RunStatus
+    from src.runs.service import process_run
+    from tests.conftest import FakeEmbeddingClient
+
+    guest_id = guest_cookies["guest_id"]
+    _, version = await prompt_factory(
+        guest_id, output_schema=OutputSchemaType.JSON_OBJECT
+    )
+    dataset = await dataset_factory(
+        guest_id,
+        rows=[{"input": {"input": str(i)}, "expected": '{"a": 1}'} for i in range(5)],
+    )
+    profile = await profile_factory(guest_id, semantic_threshold=0.5)
+
+    async with test_session_factory() as session:
+        run = Run(
+            prompt_version_id=version.id,
+            dataset_id=dataset.id,
+            profile_id=profile.id,
+            status=RunStatus.RUNNING,
+        )
+        session.add(run)
+        await session.commit()
+        await session.refresh(run)
+        run_id = run.id
+
+    class _LLM:
+        """짝수 row는 JSON, 홀수 row는 Format 실패."""
+
+        async def generate(self, user_message: str, **_: object) -> str:
+            return '{"a": 1}' if int(user_message) % 2 == 0 else "not json"
+
+        async def generate_stream(
+            self, user_message: str, **_: object
+        ) -> AsyncIterator[str]:
+            yield await self.generate(user_message)
+
+    with (
+        patch("src.runs.service.async_session", test_session_factory),
+        patch("src.runs.service.get_llm_client", return_value=_LLM()),
+        patch(
+            "src.runs.evaluator.semantic_layer.get_embedding_client",
+            return_value=FakeEmbeddingClient(),
+        ),
+    ):
+        await process_run(run_id)
+
+    first = await client.get(
+        f"/runs/{run_id}", params={"limit": 2}, cookies=guest_cookies
+    )
+    assert first.status_code == 200
+    first_data = first.json()
+    assert len(first_data["results"]) == 2
+    assert first_data["nextCursor"] == first_data["results"][-1]["id"]
+    assert first_data["metrics"]["formatPassRate"] == pytest.approx(0.6)
+
+    rest = await client.get(
+        f"/runs/{run_id}",
+        params={"limit": 10, "cursor": first_data["nextCursor"]},
+        cookies=guest_cookies,
+    )
+    rest_data = rest.json()
+    assert len(rest_data["results"]) == 3
+    assert rest_data["nextCursor"] is None
+    all_ids = [r["id"] for r in first_data["results"] + rest_data["results"]]
+    assert all_ids == sorted(set(all_ids))
+
+    failed = await client.get(
+        f"/runs/{run_id}",
+        params={"status": "format", "fields": "summary"},
+        cookies=guest_cookies,
+    )
+    failed_results = failed.json()["results"]
+    assert len(failed_results) == 2
+    assert all(r["status"] == "format" for r in failed_results)
+    assert "rawOutput" not in failed_results[0]
+    assert "assembledPrompt" not in failed_results[0]
+
+    scored = await client.get(
+        f"/runs/{run_id}",
+        params={"min_score": 0.5},
+        cookies=guest_cookies,
+    )
+    scored_results = scored.json()["results"]
+    assert len(scored_results) == 3
+    assert all(r["semanticScore"] >= 0.5 for r in scored_results)
+    assert "rawOutput" in scored_results[0]
+
+
+@pytest.mark.asyncio
+async def test_similar_results_ordered_by_output_distance(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """저장된 출력 embedding의 코사인 거리 순으로 비슷한 결과 반환 (자기 자신 제외)."""
+    from collections.abc import Sequence
+    from unittest.mock import patch
+
+    from sqlmodel import select
+
+    from src.prompts.models import OutputSchemaType
+    from src.runs.models import Run, RunResult, RunStatus
+    from src.runs.service import process_run
+    from tests.conftest import FakeEmbeddingClient
+
+    vectors = {
+        "출력 0": [1.0, 0.0],
+        "출력 1": [0.0, 1.0],
+        "출력 2": [0.9, 0.1],
+        "출력 3": [-1.0, 0.0],
+    }
+
+    class _Embeddings(FakeEmbeddingClient):
+        async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+            return [vectors.get(text, [1.0, 0.0]) for text in texts]
+
+    class _LLM:
+        async def generate(self, user_message: str, **_: object) -> str:
+            return f"출력 {user_message}"
+
+    guest_id = guest_cookies["guest_id"]
+    _, version = await prompt_factory(guest_id, output_schema=OutputSchemaType.FREEFORM)
+    dataset = await dataset_factory(
+        guest_id,
+        rows=[{"input": {"input": str(i)}, "expected": "기대"} for i in range(4)],
+    )
+    profile = await profile_factory(guest_id, semantic_threshold=0.5)
+
+    async with test_session_factory() as session:
+        run = Run(
+            prompt_version_id=version.id,
+            dataset_id=dataset.id,
+            profile_id=profile.id,
+            status=RunStatus.RUNNING,
+        )
+        session.add(run)
+        await session.commit()
+        await session.refresh(run)
+        run_id = run.id
+
+    with (
+        patch("src.runs.service.async_session", test_session_factory),
+        patch("src.runs.service.get_llm_client", return_value=_LLM()),
+        patch(
+            "src.runs.evaluator.semantic_layer.get_embedding_client",
+            return_value=_Embeddings(),
+        ),
+    ):
+        await process_run(run_id)
+
+    async with test_session_factory() as session:
+        result_ids = {
+            r.raw_output: r.id
+            for r in (
+                await session.execute(
+                    select(RunResult).where(RunResult.run_id == run_id)
+                )
+            ).scalars()
+        }
+
+    response = await client.get(
+        f"/runs/{run_id}/results/{result_ids['출력 0']}/similar",
+        params={"limit": 2},
+        cookies=guest_cookies,
+    )
+    assert response.status_code == 200
+    similar = response.json()
+    assert [r["rawOutput"] for r in similar] == ["출력 2", "출력 1"]
+    assert similar[0]["distance"] == pytest.approx(1 - 0.9 / (0.82**0.5), abs=1e-4)
+    assert similar[1]["runId"] == run_id
+
+    missing = await client.get(
+        f"/runs/{run_id}/results/999999/similar", cookies=guest_cookies
+    )
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_export_run_streams_ndjson_and_csv(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    monkeypatch,
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """export는 모든 결과를 NDJSON/CSV로 스트리밍."""
+    import csv
+    import io
+    import json
+    from unittest.mock import AsyncMock, patch
+
+    from src.runs import service
+    from src.runs.models import Run, RunStatus
+    from src.runs.service import process_run
+    from tests.conftest import FakeEmbeddingClient
+
+    monkeypatch.setattr(service, "EXPORT_CHUNK_SIZE", 2)
+
+    guest_id = guest_cookies["guest_id"]
+    _, version = await prompt_factory(guest_id)
+    dataset = await dataset_factory(
+        guest_id,
+        rows=[{"input": {"input": f"질문{i}"}, "expected": "답"} for i in range(5)],
+    )
+    profile = await profile_factory(guest_id, semantic_threshold=0.5)
+
+    async with test_session_factory() as session:
+        run = Run(
+            prompt_version_id=version.id,
+            dataset_id=dataset.id,
+            profile_id=profile.id,
+            status=RunStatus.RUNNING,
+        )
+        session.add(run)
+        await session.commit()
+        await session.refresh(run)
+        run_id = run.id
+
+    mock_llm = AsyncMock()
+    mock_llm.generate = AsyncMock(return_value="답")
+
+    with (
+        patch("src.runs.service.async_session", test_session_factory),
+        patch("src.runs.service.get_llm_client", return_value=mock_llm),
+        patch(
+            "src.runs.evaluator.semantic_layer.get_embedding_client",
+            return_value=FakeEmbeddingClient(),
+        ),
+    ):
+        await process_run(run_id)
+
+        ndjson = await client.get(f"/runs/{run_id}/export", cookies=guest_cookies)
+        csv_response = await client.get(
+            f"/runs/{run_id}/export", params={"format": "csv"}, cookies=guest_cookies
+        )
+
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert len(records) == 5
+    assert [r["id"] for r in records] == sorted(r["id"] for r in records)
+    assert records[0]["status"] == "pass"
+    assert records[0]["input_snapshot"] == {"input": "질문0"}
+
+    assert csv_response.status_code == 200
+    assert csv_response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(csv_response.text)))
+    assert len(rows) == 5
+    assert json.loads(rows[0]["input_snapshot"]) == {"input": "질문0"}
+
+
+@pytest.mark.asyncio
+async def test_export_run_not_found(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+) -> None:
+    """존재하지 않는 Run export 시 404."""
+    response = await client.get("/runs/99999/export", cookies=guest_cookies)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_rescore_run_requires_completed_source(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """실행 중인 Run은 재채점 불가(400), 완료된 Run은 재채점 Run 생성(201)."""
+    from sqlmodel import select
+
+    from src.runs.models import Run, RunJob, RunStatus
+
+    guest_id = guest_cookies["guest_id"]
+    _, version = await prompt_factory(guest_id)
+    dataset = await dataset_factory(guest_id)
+    profile = await profile_factory(guest_id)
+    other_profile = await profile_factory(guest_id, name="Other")
+
+    async with test_session_factory() as session:
+        source = Run(
+            prompt_version_id=version.id,
+            dataset_id=dataset.id,
+            profile_id=profile.id,
+            status=RunStatus.RUNNING,
+        )
+        session.add(source)
+        await session.commit()
+        await session.refresh(source)
+        source_id = source.id
+
+    running = await client.post(
+        f"/runs/{source_id}/rescore",
+        json={"profileId": other_profile.id},
+        cookies=guest_cookies,
+    )
+    assert running.status_code == 400
+
+    async with test_session_factory() as session:
+        source = await session.get(Run, source_id)
+        assert source is not None
+        source.status = RunStatus.COMPLETED
+        await session.commit()
+
+    response = await client.post(
+        f"/runs/{source_id}/rescore",
+        json={"profileId": other_profile.id},
+        cookies=guest_cookies,
+    )
+    assert response.status_code == 201
+
+    async with test_session_factory() as session:
+        rescore = await session.get(Run, response.json()["id"])
+        job = (
+            await session.execute(
+                select(RunJob).where(RunJob.run_id == response.json()["id"])
+            )
+        ).scalar_one_or_none()
+    assert rescore is not None
+    assert rescore.source_run_id == source_id
+    assert rescore.profile_id == other_profile.id
+    assert job is not None
+
+
+@pytest.mark.asyncio
+async def test_run_timing_returns_stage_percentiles(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """trace의 단계별 p50/p95/p99와 토큰 합계 (trace 없는 결과는 집계 제외)."""
+    from sqlmodel import select
+
+    from src.datasets.models import DatasetRow
+    from src.runs.models import ResultStatus, Run, RunResult, RunStatus
+
+    guest_id = guest_cookies["guest_id"]
+    _, version = await prompt_factory(guest_id)
+    dataset = await dataset_factory(
+        guest_id,
+        rows=[{"input": {"input": str(i)}, "expected": "기대"} for i in range(5)],
+    )
+    profile = await profile_factory(guest_id)
+
+    async with test_session_factory() as session:
+        run = Run(
+            prompt_version_id=version.id,
+            dataset_id=dataset.id,
+            profile_id=profile.id,
+            status=RunStatus.COMPLETED,
+        )
+        session.add(run)
+        await session.flush()
+        rows = (
+            (
+                await session.execute(
+                    select(DatasetRow).where(DatasetRow.dataset_id == dataset.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        for i, row in enumerate(rows):
+            session.add(
+                RunResult(
+                    run_id=run.id,
+                    dataset_row_id=row.id,
+                    input_snapshot=row.input_data,
+                    expected_snapshot=row.expected_output,
+                    assembled_prompt={},
+                    raw_output="출력",
+                    status=ResultStatus.PASS,
+                    trace=None
+                    if i == 0
+                    else {
+                        "timings_ms": {"llm": 100.0 * i, "format": 1.0},
+                        "counts": {"llm_retries": 1} if i == 1 else {},
+                        "tokens": {"prompt": 10, "output": i},
+                    },
+                )
+            )
+        await session.commit()
+        run_id = run.id
+
+    response = await client.get(f"/runs/{run_id}/timing", cookies=guest_cookies)
+
+    assert response.status_code == 200
+    timing = response.json()
+    assert timing["rows"] == 5
+    assert timing["tracedRows"] == 4
+    assert [s["stage"] for s in timing["stages"]] == ["llm", "format"]
+    llm = timing["stages"][0]
+    assert llm["count"] == 4
+    assert llm["p50Ms"] == pytest.approx(250.0)
+    assert llm["p99Ms"] == pytest.approx(397.0)
+    assert timing["tokens"] == {"output": 10, "prompt": 40}
+    assert timing["counts"] == {"llm_retries": 1}
+
+
+@pytest.mark.asyncio
+async def test_run_timing_unknown_run_returns_404(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+) -> None:
+    """존재하지 않거나 남의 Run이면 404."""
+    response = await client.get("/runs/999999/timing", cookies=guest_cookies)
+    assert response.status_code == 404
+
+
+async def _create_run_with_metrics(
+    test_session_factory,
+    guest_id,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+    status,
+):
+    from src.runs.models import Run, RunAggregate
+
+    _, version = await prompt_factory(guest_id)
+    dataset = await dataset_factory(guest_id, rows=[{"input": {"input": "x"}}])
+    profile = await profile_factory(guest_id)
+    async with test_session_factory() as session:
+        run = Run(
+            prompt_version_id=version.id,
+            dataset_id=dataset.id,
+            profile_id=profile.id,
+            status=status,
+        )
+        session.add(run)
+        await session.flush()
+        session.add(
+            RunAggregate(
+                run_id=run.id,
+                target_count=10,
+                total_count=4,
+                pass_count=3,
+                format_pass_count=4,
+                semantic_pass_count=3,
+                semantic_score_sum=3.2,
+            )
+        )
+        await session.commit()
+        return run.id
+
+
+@pytest.mark.asyncio
+async def test_run_progress_reads_counters(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """진행 상황은 run_metrics 카운터로 응답."""
+    from src.runs.models import RunStatus
+
+    run_id = await _create_run_with_metrics(
+        test_session_factory,
+        guest_cookies["guest_id"],
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+        RunStatus.RUNNING,
+    )
+
+    response = await client.get(f"/runs/{run_id}/progress", cookies=guest_cookies)
+
+    assert response.status_code == 200
+    progress = response.json()
+    assert progress["status"] == "running"
+    assert progress["targetCount"] == 10
+    assert progress["processed"] == 4
+    assert progress["passCount"] == 3
+    assert progress["avgSemantic"] == pytest.approx(0.8)
+
+    missing = await client.get("/runs/999999/progress", cookies=guest_cookies)
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_run_events_for_finished_run_sends_snapshot_and_status(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """이미 끝난 Run은 progress 스냅샷과 status 이벤트만 보내고 종료."""
+    from unittest.mock import patch
+
+    from src.runs.events import RunEventBroker
+    from src.runs.models import RunStatus
+    from tests.conftest import TEST_DATABASE_URL
+
+    run_id = await _create_run_with_metrics(
+        test_session_factory,
+        guest_cookies["guest_id"],
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+        RunStatus.COMPLETED,
+    )
+    broker = RunEventBroker(TEST_DATABASE_URL)
+    try:
+        with (
+            patch("src.runs.service.async_session", test_session_factory),
+            patch("src.runs.service.get_run_event_broker", return_value=broker),
+        ):
+            response = await client.get(f"/runs/{run_id}/events", cookies=guest_cookies)
+    finally:
+        await broker.close()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block for block in response.text.split("\n\n") if block]
+    assert [block.splitlines()[0] for block in events] == [
+        "event: progress",
+        "event: status",
+    ]
+    assert '"processed": 4' in events[0]
+    assert events[1].endswith('data: {"status": "completed"}')
+
+
+@pytest.mark.asyncio
+async def test_run_events_streams_worker_notifications(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """실행 중인 Run은 워커가 NOTIFY한 이벤트를 status 이벤트까지 전달."""
+    import asyncio
+    from unittest.mock import patch
+
+    from src.runs.events import RunEvent, RunEventBroker, publish
+    from src.runs.models import RunStatus
+    from tests.conftest import TEST_DATABASE_URL
+
+    run_id = await _create_run_with_metrics(
+        test_session_factory,
+        guest_cookies["guest_id"],
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+        RunStatus.RUNNING,
+    )
+    broker = RunEventBroker(TEST_DATABASE_URL)
+    try:
+        with (
+            patch("src.runs.service.async_session", test_session_factory),
+            patch("src.runs.service.get_run_event_broker", return_value=broker),
+        ):
+            request = asyncio.create_task(
+                client.get(f"/runs/{run_id}/events", cookies=guest_cookies)
+            )
+            while broker.subscriber_count(run_id) == 0:
+                await asyncio.sleep(0.01)
+
+            async with test_session_factory() as session:
+                await publish(
+                    session,
+                    [
+                        RunEvent(
+                            run_id,
+                            "rows",
+                            {"rows": [{"datasetRowId": 1, "status": "pass"}]},
+                        ),
+                        RunEvent(run_id, "status", {"status": "completed"}),
+                    ],
+                )
+                await session.commit()
+            response = await asyncio.wait_for(request, timeout=5)
+    finally:
+        await broker.close()
+
+    events = [block.splitlines()[0] for block in response.text.split("\n\n") if block]
+    assert events == ["event: progress", "event: rows", "event: status"]
+    assert broker.subscriber_count(run_id) == 0
+
+
+async def _idle_in_transaction(test_session_factory) -> int:
+    """다른 연결이 트랜잭션을 연 채 쉬고 있는 수 (세션이 연결을 붙잡고 있는지 확인)."""
+    from sqlalchemy import text
+
+    async with test_session_factory() as session:
+        return (
+            await session.execute(
+                text(
+                    "SELECT count(*) FROM pg_stat_activity"
+                    " WHERE datname = current_database() AND state = 'idle in transaction'"
+                    " AND pid <> pg_backend_pid()"
+                )
+            )
+        ).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_run_events_stream_holds_no_request_connection(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """SSE 스트림 동안 소유권·인증 조회에 쓴 요청 세션의 연결은 반환된 상태."""
+    from unittest.mock import patch
+
+    from src.runs.models import RunStatus
+
+    run_id = await _create_run_with_metrics(
+        test_session_factory,
+        guest_cookies["guest_id"],
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+        RunStatus.RUNNING,
+    )
+
+    async def _stream(_: int) -> AsyncIterator[str]:
+        yield f"data: {await _idle_in_transaction(test_session_factory)}\n\n"
+
+    with patch("src.runs.router.stream_run_events", _stream):
+        response = await client.get(f"/runs/{run_id}/events", cookies=guest_cookies)
+
+    assert response.status_code == 200
+    assert response.text == "data: 0\n\n"
+
+
+@pytest.mark.asyncio
+async def test_export_holds_no_request_connection(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """export 다운로드 동안 요청 세션의 연결은 반환되고 export 전용 연결만 사용."""
+    from unittest.mock import patch
+
+    from src.runs.models import RunStatus
+    from src.runs.schemas import ExportFormat
+
+    run_id = await _create_run_with_metrics(
+        test_session_factory,
+        guest_cookies["guest_id"],
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+        RunStatus.COMPLETED,
+    )
+
+    async def _export(_: int, __: ExportFormat) -> AsyncIterator[str]:
+        yield f"{await _idle_in_transaction(test_session_factory)}\n"
+
+    with patch("src.runs.router.export_run_results", _export):
+        response = await client.get(f"/runs/{run_id}/export", cookies=guest_cookies)
+
+    assert response.status_code == 200
+    assert response.text == "0\n"
@@ -5,8 +5,9 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from src.prompts.models import OutputSchemaType
-from src.runs.models import ResultStatus, Run, RunResult, RunStatus
+from src.runs.models import ResultStatus, Run, RunAggregate, RunResult, RunStatus
 from src.runs.service import assemble_prompt, process_run
+from tests.conftest import FakeEmbeddingClient, stream_from
 
 
 class TestAssemblePrompt:
@@ -121,6 +122,76 @@ class TestProcessRun:
             assert results[0].raw_output == "TRUE"
             assert results[0].status == ResultStatus.PASS
 
+    @pytest.mark.asyncio
+    async def test_process_run_records_stage_trace(
+        self,
+        test_session_factory,
+        guest_factory,
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+    ) -> None:
+        """row trace에 단계별 소요 시간과 provider 토큰 사용량 저장."""
+        from sqlmodel import select
+
+        from src.common import trace
+
+        guest = await guest_factory()
+        _, version = await prompt_factory(guest.id, output_schema=OutputSchemaType.FREEFORM)
+        dataset = await dataset_factory(
+            guest.id, rows=[{"input": {"input": "테스트"}, "expected": "TRUE"}]
+        )
+        profile = await profile_factory(guest.id, semantic_threshold=0.7)
+
+        async with test_session_factory() as session:
+            assert version.id is not None
+            assert dataset.id is not None
+            assert profile.id is not None
+            run = Run(
+                prompt_version_id=version.id,
+                dataset_id=dataset.id,
+                profile_id=profile.id,
+                status=RunStatus.RUNNING,
+            )
+            session.add(run)
+            await session.commit()
+            await session.refresh(run)
+            run_id = run.id
+
+        async def _generate(**_: object) -> str:
+            trace.record_tokens(prompt=12, output=3, thoughts=None)
+            return "TRUE"
+
+        mock_llm = AsyncMock()
+        mock_llm.generate = AsyncMock(side_effect=_generate)
+
+        with (
+            patch("src.runs.service.async_session", test_session_factory),
+            patch("src.runs.service.get_llm_client", return_value=mock_llm),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                return_value=FakeEmbeddingClient(),
+            ),
+        ):
+            await process_run(run_id)
+
+        async with test_session_factory() as session:
+            result = (await session.execute(
+                select(RunResult).where(RunResult.run_id == run_id)
+            )).scalar_one()
+
+        assert result.status == ResultStatus.PASS
+        assert result.trace is not None
+        assert set(result.trace["timings_ms"]) == {
+            "prompt_assembly",
+            "llm",
+            "format",
+            "semantic",
+            "logic",
+            "persistence",
+        }
+        assert result.trace["tokens"] == {"prompt": 12, "output": 3}
+
     @pytest.mark.asyncio
     async def test_process_run_handles_semantic_fail(
         self,
@@ -224,6 +295,7 @@ class TestProcessRun:
 
         mock_llm = AsyncMock()
         mock_llm.generate = AsyncMock(return_value="이것은 JSON이 아닙니다")
+        mock_llm.generate_stream = stream_from(mock_llm.generate)
 
         with (
             patch("src.runs.service.async_session", test_session_factory),
@@ -242,6 +314,61 @@ class TestProcessRun:
             assert results[0].status == ResultStatus.FORMAT
             assert results[0].is_format_passed is False
 
+    @pytest.mark.asyncio
+    async def test_process_run_aborts_stream_on_invalid_json(
+        self,
+        test_session_factory,
+        guest_factory,
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+    ) -> None:
+        """JSON Object 스키마에 배열이 생성되기 시작하면 바로 중단하고 FORMAT."""
+        from sqlmodel import select
+
+        from src.llm.stub import StubLLMClient
+
+        guest = await guest_factory()
+        _, version = await prompt_factory(guest.id, output_schema=OutputSchemaType.JSON_OBJECT)
+        dataset = await dataset_factory(
+            guest.id,
+            rows=[{"input": {"input": "테스트"}, "expected": '{"result": "ok"}'}],
+        )
+        profile = await profile_factory(guest.id)
+
+        async with test_session_factory() as session:
+            assert version.id is not None
+            assert dataset.id is not None
+            assert profile.id is not None
+            run = Run(
+                prompt_version_id=version.id,
+                dataset_id=dataset.id,
+                profile_id=profile.id,
+                status=RunStatus.RUNNING,
+            )
+            session.add(run)
+            await session.commit()
+            await session.refresh(run)
+            run_id = run.id
+
+        stub = StubLLMClient(respond=lambda _: '["ok", "ok", "ok", "ok"]')
+
+        with (
+            patch("src.runs.service.async_session", test_session_factory),
+            patch("src.runs.service.get_llm_client", return_value=stub),
+        ):
+            await process_run(run_id)
+
+        async with test_session_factory() as session:
+            result = (await session.execute(
+                select(RunResult).where(RunResult.run_id == run_id)
+            )).scalar_one()
+
+        assert stub.stream_chunks == 1
+        assert result.raw_output == "["
+        assert result.status == ResultStatus.FORMAT
+        assert result.is_format_passed is False
+
     @pytest.mark.asyncio
     async def test_process_run_with_multiple_rows(
         self,
@@ -348,6 +475,7 @@ class TestProcessRun:
         with (
             patch("src.runs.service.async_session", test_session_factory),
             patch("src.runs.service.get_llm_client", return_value=mock_llm),
+            pytest.raises(Exception, match="API Error"),
         ):
             await process_run(run_id)
 
@@ -359,3 +487,526 @@ class TestProcessRun:
             )).scalar_one()
 
             assert run.status == RunStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_rerun_reuses_persisted_expected_embeddings(
+        self,
+        test_session_factory,
+        guest_factory,
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+    ) -> None:
+        """같은 데이터셋 재실행 시 expected_output은 embedding API를 호출하지 않음."""
+        from src.embeddings.cache import EmbeddingCache
+
+        guest = await guest_factory()
+        guest_id = guest.id
+
+        _, version = await prompt_factory(guest_id, output_schema=OutputSchemaType.FREEFORM)
+        dataset = await dataset_factory(
+            guest_id,
+            rows=[{"input": {"input": "테스트"}, "expected": "기대 응답"}],
+        )
+        profile = await profile_factory(guest_id, semantic_threshold=0.5)
+
+        run_ids: list[int] = []
+        async with test_session_factory() as session:
+            for _ in range(2):
+                assert version.id is not None
+                assert dataset.id is not None
+                assert profile.id is not None
+                run = Run(
+                    prompt_version_id=version.id,
+                    dataset_id=dataset.id,
+                    profile_id=profile.id,
+                    status=RunStatus.RUNNING,
+                )
+                session.add(run)
+                await session.commit()
+                await session.refresh(run)
+                assert run.id is not None
+                run_ids.append(run.id)
+
+        embedding_client = FakeEmbeddingClient()
+
+        for run_id, output in zip(run_ids, ["첫 응답", "두번째 응답"], strict=True):
+            # 새 프로세스처럼 빈 LRU로 시작
+            cache = EmbeddingCache(max_size=100)
+            mock_llm = AsyncMock()
+            mock_llm.generate = AsyncMock(return_value=output)
+            embedding_client.calls.clear()
+
+            with (
+                patch("src.runs.service.async_session", test_session_factory),
+                patch("src.runs.service.get_llm_client", return_value=mock_llm),
+                patch("src.runs.service.get_embedding_cache", return_value=cache),
+                patch("src.runs.evaluator.semantic_layer.get_embedding_cache", return_value=cache),
+                patch("src.runs.evaluator.semantic_layer.get_embedding_client", return_value=embedding_client),
+            ):
+                await process_run(run_id)
+
+        assert embedding_client.calls == [["두번째 응답"]]
+
+
+class TestProcessRunBatching:
+    """배치 단위 저장 + 이어서 처리(resume) 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_crash_keeps_committed_batches_and_resume_skips_them(
+        self,
+        monkeypatch,
+        test_session_factory,
+        guest_factory,
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+    ) -> None:
+        """중간 실패 시 이전 배치는 보존되고, resume은 남은 row만 처리."""
+        from sqlmodel import select
+
+        from src.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "RUN_RESULT_BATCH_SIZE", 2)
+        monkeypatch.setattr(get_settings(), "RUN_CONCURRENCY", 1)
+
+        guest = await guest_factory()
+        _, version = await prompt_factory(guest.id, output_schema=OutputSchemaType.FREEFORM)
+        dataset = await dataset_factory(
+            guest.id,
+            rows=[{"input": {"input": str(i)}, "expected": "답"} for i in range(5)],
+        )
+        profile = await profile_factory(guest.id, semantic_threshold=0.5)
+
+        async with test_session_factory() as session:
+            assert version.id is not None
+            assert dataset.id is not None
+            assert profile.id is not None
+            run = Run(
+                prompt_version_id=version.id,
+                dataset_id=dataset.id,
+                profile_id=profile.id,
+                status=RunStatus.RUNNING,
+            )
+            session.add(run)
+            await session.commit()
+            await session.refresh(run)
+            run_id = run.id
+            assert run_id is not None
+
+        failing_llm = AsyncMock()
+        failing_llm.generate = AsyncMock(
+            side_effect=["답", "답", "답", "답", Exception("API Error")]
+        )
+        resumed_llm = AsyncMock()
+        resumed_llm.generate = AsyncMock(return_value="답")
+
+        with (
+            patch("src.runs.service.async_session", test_session_factory),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                return_value=FakeEmbeddingClient(),
+            ),
+        ):
+            with (
+                patch("src.runs.service.get_llm_client", return_value=failing_llm),
+                pytest.raises(Exception, match="API Error"),
+            ):
+                await process_run(run_id)
+
+            async with test_session_factory() as session:
+                run = (await session.execute(select(Run).where(Run.id == run_id))).scalar_one()
+                saved = (await session.execute(
+                    select(RunResult).where(RunResult.run_id == run_id)
+                )).scalars().all()
+                aggregate = await session.get(RunAggregate, run_id)
+            assert run.status == RunStatus.FAILED
+            assert len(saved) == 4
+            # 집계는 commit된 배치만큼만 증가
+            assert aggregate is not None
+            assert aggregate.total_count == 4
+            assert aggregate.pass_count == 4
+
+            with patch("src.runs.service.get_llm_client", return_value=resumed_llm):
+                await process_run(run_id, resume=True)
+
+        assert resumed_llm.generate.await_count == 1
+        assert "4" in resumed_llm.generate.await_args.kwargs["user_message"]
+
+        async with test_session_factory() as session:
+            run = (await session.execute(select(Run).where(Run.id == run_id))).scalar_one()
+            results = (await session.execute(
+                select(RunResult)
+                .where(RunResult.run_id == run_id)
+                .order_by(RunResult.id)
+            )).scalars().all()
+            aggregate = await session.get(RunAggregate, run_id)
+
+        assert run.status == RunStatus.COMPLETED
+        assert len(results) == 5
+        assert aggregate is not None
+        assert aggregate.total_count == 5
+        assert aggregate.pass_count == 5
+        assert aggregate.format_pass_count == 5
+        assert aggregate.semantic_score_sum == pytest.approx(
+            sum(r.semantic_score for r in results)
+        )
+        assert len({r.dataset_row_id for r in results}) == 5
+        assert all(r.status == ResultStatus.PASS for r in results)
+
+
+class TestProcessRunGenerationCache:
+    """LLM 생성 캐시 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_rerun_with_temperature_zero_hits_cache(
+        self,
+        test_session_factory,
+        guest_factory,
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+    ) -> None:
+        """temperature=0 버전을 다시 실행하면 LLM 호출 없이 캐시된 출력을 사용."""
+        from src.llm.cache import PostgresGenerationCache
+
+        guest = await guest_factory()
+        _, version = await prompt_factory(
+            guest.id, output_schema=OutputSchemaType.FREEFORM, temperature=0.0
+        )
+        dataset = await dataset_factory(
+            guest.id,
+            rows=[{"input": {"input": str(i)}, "expected": "답"} for i in range(3)],
+        )
+        profile = await profile_factory(guest.id, semantic_threshold=0.5)
+
+        run_ids: list[int] = []
+        async with test_session_factory() as session:
+            for _ in range(2):
+                assert version.id is not None
+                assert dataset.id is not None
+                assert profile.id is not None
+                run = Run(
+                    prompt_version_id=version.id,
+                    dataset_id=dataset.id,
+                    profile_id=profile.id,
+                    status=RunStatus.RUNNING,
+                )
+                session.add(run)
+                await session.commit()
+                await session.refresh(run)
+                assert run.id is not None
+                run_ids.append(run.id)
+
+        mock_llm = AsyncMock()
+        mock_llm.generate = AsyncMock(return_value="답")
+
+        with (
+            patch("src.runs.service.async_session", test_session_factory),
+            patch("src.runs.service.get_llm_client", return_value=mock_llm),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                return_value=FakeEmbeddingClient(),
+            ),
+        ):
+            with patch(
+                "src.runs.service.get_generation_cache",
+                return_value=PostgresGenerationCache(max_size=100),
+            ):
+                await process_run(run_ids[0])
+            # 새 프로세스(빈 LRU) - DB에 저장된 결과를 사용
+            with patch(
+                "src.runs.service.get_generation_cache",
+                return_value=PostgresGenerationCache(max_size=100),
+            ):
+                await process_run(run_ids[1])
+
+        assert mock_llm.generate.await_count == 3
+
+        async with test_session_factory() as session:
+            first = await session.get(RunAggregate, run_ids[0])
+            second = await session.get(RunAggregate, run_ids[1])
+
+        assert first is not None
+        assert second is not None
+        assert (first.generation_cache_hits, first.generation_cache_misses) == (0, 3)
+        assert (second.generation_cache_hits, second.generation_cache_misses) == (3, 0)
+        assert second.pass_count == 3
+
+
+class TestProcessRunBatchApi:
+    """provider 배치 API 실행 모드 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_batch_run_uses_batch_results_and_falls_back_per_row(
+        self,
+        test_session_factory,
+        guest_factory,
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+        monkeypatch,
+    ) -> None:
+        """배치 결과로 평가하고, 배치에서 실패한 row만 개별 호출로 보충."""
+        from sqlmodel import select
+
+        from src.config import get_settings
+        from src.datasets.models import DatasetRow
+        from src.llm.stub import StubLLMClient
+
+        monkeypatch.setattr(get_settings(), "LLM_BATCH_POLL_INTERVAL", 0.0)
+        monkeypatch.setattr(get_settings(), "RUN_RESULT_BATCH_SIZE", 2)
+
+        guest = await guest_factory()
+        _, version = await prompt_factory(guest.id, output_schema=OutputSchemaType.FREEFORM)
+        dataset = await dataset_factory(
+            guest.id,
+            rows=[{"input": {"input": str(i)}, "expected": "답"} for i in range(5)],
+        )
+        profile = await profile_factory(guest.id, semantic_threshold=0.5)
+
+        async with test_session_factory() as session:
+            assert version.id is not None
+            assert dataset.id is not None
+            assert profile.id is not None
+            run = Run(
+                prompt_version_id=version.id,
+                dataset_id=dataset.id,
+                profile_id=profile.id,
+                status=RunStatus.RUNNING,
+                use_batch_api=True,
+            )
+            session.add(run)
+            await session.commit()
+            await session.refresh(run)
+            run_id = run.id
+            assert run_id is not None
+            row_ids = (await session.execute(
+                select(DatasetRow.id)
+                .where(DatasetRow.dataset_id == dataset.id)
+                .order_by(DatasetRow.row_index)
+            )).scalars().all()
+
+        stub = StubLLMClient(
+            respond=lambda _: "답",
+            polls_until_done=2,
+            failed_keys=frozenset({str(row_ids[3])}),
+        )
+
+        with (
+            patch("src.runs.service.async_session", test_session_factory),
+            patch("src.runs.service.get_llm_client", return_value=stub),
+            patch("src.runs.service.get_batch_llm_client", return_value=stub),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                return_value=FakeEmbeddingClient(),
+            ),
+        ):
+            await process_run(run_id)
+
+        async with test_session_factory() as session:
+            run = (await session.execute(select(Run).where(Run.id == run_id))).scalar_one()
+            results = (await session.execute(
+                select(RunResult).where(RunResult.run_id == run_id)
+            )).scalars().all()
+
+        assert run.status == RunStatus.COMPLETED
+        assert run.batch_job_id == "stub-batch-1"
+        assert len(stub.batches["stub-batch-1"]) == 5
+        assert stub.generate_calls == 1
+        assert len(results) == 5
+        assert all(r.status == ResultStatus.PASS for r in results)
+
+
+class TestProcessRunRescore:
+    """재채점 Run 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_rescore_reuses_raw_outputs_without_llm(
+        self,
+        test_session_factory,
+        guest_factory,
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+    ) -> None:
+        """재채점은 source Run의 raw_output을 새 프로필로 평가하고 LLM을 호출하지 않음."""
+        from sqlmodel import select
+
+        from src.common.types import LogicConstraint
+
+        guest = await guest_factory()
+        _, version = await prompt_factory(guest.id, output_schema=OutputSchemaType.JSON_OBJECT)
+        dataset = await dataset_factory(
+            guest.id,
+            rows=[{"input": {"input": str(i)}, "expected": '{"answer": "답"}'} for i in range(3)],
+        )
+        lenient = await profile_factory(guest.id, semantic_threshold=0.5)
+        strict = await profile_factory(
+            guest.id,
+            name="Strict",
+            semantic_threshold=0.5,
+            global_constraints=[LogicConstraint(type="max_length", target="answer", value=1)],
+        )
+
+        async with test_session_factory() as session:
+            assert version.id is not None
+            assert dataset.id is not None
+            assert lenient.id is not None
+            assert strict.id is not None
+            source = Run(
+                prompt_version_id=version.id,
+                dataset_id=dataset.id,
+                profile_id=lenient.id,
+                status=RunStatus.RUNNING,
+            )
+            session.add(source)
+            await session.commit()
+            await session.refresh(source)
+            assert source.id is not None
+            rescore = Run(
+                prompt_version_id=version.id,
+                dataset_id=dataset.id,
+                profile_id=strict.id,
+                status=RunStatus.RUNNING,
+                source_run_id=source.id,
+            )
+            session.add(rescore)
+            await session.commit()
+            await session.refresh(rescore)
+            source_id, rescore_id = source.id, rescore.id
+            assert rescore_id is not None
+
+        mock_llm = AsyncMock()
+        mock_llm.generate = AsyncMock(return_value='{"answer": "답변"}')
+        mock_llm.generate_stream = stream_from(mock_llm.generate)
+
+        with (
+            patch("src.runs.service.async_session", test_session_factory),
+            patch("src.runs.service.get_llm_client", return_value=mock_llm),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                return_value=FakeEmbeddingClient(),
+            ),
+        ):
+            await process_run(source_id)
+            await process_run(rescore_id)
+
+        assert mock_llm.generate.await_count == 3
+
+        async with test_session_factory() as session:
+            run = (await session.execute(select(Run).where(Run.id == rescore_id))).scalar_one()
+            results = (await session.execute(
+                select(RunResult)
+                .where(RunResult.run_id == rescore_id)
+                .order_by(RunResult.id)
+            )).scalars().all()
+            source_results = (await session.execute(
+                select(RunResult).where(RunResult.run_id == source_id)
+            )).scalars().all()
+
+        assert run.status == RunStatus.COMPLETED
+        assert all(r.status == ResultStatus.PASS for r in source_results)
+        assert len(results) == 3
+        assert all(r.raw_output == '{"answer": "답변"}' for r in results)
+        assert all(r.status == ResultStatus.LOGIC for r in results)
+
+    @pytest.mark.asyncio
+    async def test_rescore_scores_stored_embeddings_in_sql(
+        self,
+        test_session_factory,
+        guest_factory,
+        prompt_factory,
+        dataset_factory,
+        profile_factory,
+    ) -> None:
+        """source Run이 저장한 embedding으로 SQL에서 점수를 계산해 embedding을 요청하지 않음."""
+        from sqlmodel import select
+
+        from src.datasets.models import DatasetRow
+        from src.embeddings.cache import EmbeddingCache
+
+        guest = await guest_factory()
+        _, version = await prompt_factory(guest.id, output_schema=OutputSchemaType.FREEFORM)
+        dataset = await dataset_factory(
+            guest.id,
+            rows=[{"input": {"input": str(i)}, "expected": f"기대 {i}"} for i in range(2)],
+        )
+        lenient = await profile_factory(guest.id, semantic_threshold=0.5)
+        strict = await profile_factory(guest.id, name="Strict", semantic_threshold=0.99)
+
+        async with test_session_factory() as session:
+            source = Run(
+                prompt_version_id=version.id,
+                dataset_id=dataset.id,
+                profile_id=lenient.id,
+                status=RunStatus.RUNNING,
+            )
+            session.add(source)
+            await session.commit()
+            await session.refresh(source)
+            rescore = Run(
+                prompt_version_id=version.id,
+                dataset_id=dataset.id,
+                profile_id=strict.id,
+                status=RunStatus.RUNNING,
+                source_run_id=source.id,
+            )
+            session.add(rescore)
+            await session.commit()
+            await session.refresh(rescore)
+            source_id, rescore_id = source.id, rescore.id
+            assert source_id is not None
+            assert rescore_id is not None
+
+        mock_llm = AsyncMock()
+        mock_llm.generate = AsyncMock(return_value="응답")
+
+        with (
+            patch("src.runs.service.async_session", test_session_factory),
+            patch("src.runs.service.get_llm_client", return_value=mock_llm),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_cache",
+                return_value=EmbeddingCache(max_size=100),
+            ),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                return_value=FakeEmbeddingClient(vector=[0.6, 0.8]),
+            ),
+        ):
+            await process_run(source_id)
+
+        async with test_session_factory() as session:
+            stored_models = (await session.execute(
+                select(DatasetRow.expected_embedding_model)
+                .where(DatasetRow.dataset_id == dataset.id)
+            )).scalars().all()
+        assert stored_models == ["text-embedding-3-small"] * 2
+
+        # 빈 캐시 + 호출되면 안 되는 클라이언트로 재채점
+        embedding_client = FakeEmbeddingClient()
+        with (
+            patch("src.runs.service.async_session", test_session_factory),
+            patch("src.runs.service.get_embedding_cache", return_value=EmbeddingCache(max_size=100)),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_cache",
+                return_value=EmbeddingCache(max_size=100),
+            ),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                return_value=embedding_client,
+            ),
+        ):
+            await process_run(rescore_id)
+
+        assert embedding_client.calls == []
+        async with test_session_factory() as session:
+            results = (await session.execute(
+                select(RunResult).where(RunResult.run_id == rescore_id)
+            )).scalars().all()
+
+        assert len(results) == 2
+        assert all(r.semantic_score == pytest.approx(1.0) for r in results)
+        assert all(r.status == ResultStatus.PASS for r in results)
+        # 출력 embedding은 source 결과에서 복사
+        assert all(r.output_embedding_model == "text-embedding-3-small" for r in results)
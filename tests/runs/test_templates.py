@@ -0,0 +1,73 @@
+"""프롬프트 템플릿 컴파일 테스트."""
+
+import logging
+
+import pytest
+
+from src.runs.service import _report_missing_placeholders
+from src.runs.templates import CompiledTemplate
+
+
+class TestCompiledTemplate:
+    """CompiledTemplate 단위 테스트."""
+
+    def test_render_matches_sequential_replace(self) -> None:
+        """literal/slot 분할 후 join 결과가 key별 치환과 같음."""
+        template = CompiledTemplate("A {{x}} B {{y}} C {{x}}")
+
+        assert template.render({"x": 1, "y": "둘"}) == "A 1 B 둘 C 1"
+        assert template.placeholders == {"x", "y"}
+
+    def test_missing_key_keeps_placeholder(self) -> None:
+        """input_data에 없는 key는 placeholder 그대로."""
+        template = CompiledTemplate("{{a}}-{{b}}")
+
+        assert template.render({"a": "값"}) == "값-{{b}}"
+        assert template.missing({"a", "c"}) == ["b"]
+
+    def test_values_are_not_rescanned(self) -> None:
+        """치환된 값 안의 placeholder는 다시 치환하지 않음."""
+        template = CompiledTemplate("{{a}} {{b}}")
+
+        assert template.render({"a": "{{b}}", "b": "x"}) == "{{b}} x"
+
+    def test_triple_braces_keep_outer_brace(self) -> None:
+        """{{{key}}}는 바깥 중괄호를 literal로 유지."""
+        assert CompiledTemplate("{{{k}}}").render({"k": "v"}) == "{v}"
+
+    def test_template_without_placeholders(self) -> None:
+        """placeholder가 없으면 원문 그대로."""
+        template = CompiledTemplate("고정 문장 {단일 중괄호}")
+
+        assert template.render({"a": 1}) == "고정 문장 {단일 중괄호}"
+        assert template.placeholders == frozenset()
+
+
+@pytest.mark.asyncio
+async def test_missing_placeholders_reported_once_per_run(
+    test_session_factory,
+    guest_factory,
+    dataset_factory,
+    caplog,
+) -> None:
+    """input_data에 없는 placeholder는 Run 시작 시 row 수와 함께 한 번만 경고."""
+    guest = await guest_factory()
+    dataset = await dataset_factory(
+        guest.id,
+        rows=[
+            {"input": {"claim": "a", "topic": "t"}, "expected": "x"},
+            {"input": {"claim": "b"}, "expected": "x"},
+            {"input": {"claim": "c"}, "expected": "x"},
+        ],
+    )
+    template = CompiledTemplate("{{claim}} / {{topic}} / {{missing}}")
+
+    assert dataset.id is not None
+    with caplog.at_level(logging.WARNING, logger="src.runs.service"):
+        async with test_session_factory() as session:
+            await _report_missing_placeholders(session, dataset.id, template)
+
+    warnings = [r.getMessage() for r in caplog.records]
+    assert len(warnings) == 2
+    assert "key='missing'" in warnings[0] and "rows=3/3" in warnings[0]
+    assert "key='topic'" in warnings[1] and "rows=2/3" in warnings[1]
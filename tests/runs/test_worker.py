@@ -0,0 +1,274 @@
+"""Run 작업 큐/워커 테스트 - 로컬 PostgreSQL의 SKIP LOCKED 동작 검증."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlmodel import col, select
+
+from src.runs import queue
+from src.runs.models import JobStatus, Run, RunJob, RunStatus
+from src.runs.worker import RunWorker
+
+
+async def _create_runs(test_session_factory, factories, count: int) -> list[int]:
+    guest_factory, prompt_factory, dataset_factory, profile_factory = factories
+    guest = await guest_factory()
+    _, version = await prompt_factory(guest.id)
+    dataset = await dataset_factory(
+        guest.id, rows=[{"input": {"input": "x"}, "expected": "y"}]
+    )
+    profile = await profile_factory(guest.id)
+
+    run_ids: list[int] = []
+    async with test_session_factory() as session:
+        for _ in range(count):
+            run = Run(
+                prompt_version_id=version.id,
+                dataset_id=dataset.id,
+                profile_id=profile.id,
+                status=RunStatus.RUNNING,
+            )
+            session.add(run)
+            await session.flush()
+            assert run.id is not None
+            queue.enqueue_run(session, run.id)
+            run_ids.append(run.id)
+        await session.commit()
+    return run_ids
+
+
+@pytest.fixture
+def factories(guest_factory, prompt_factory, dataset_factory, profile_factory):
+    return guest_factory, prompt_factory, dataset_factory, profile_factory
+
+
+@pytest.mark.asyncio
+async def test_create_run_enqueues_job(
+    client: AsyncClient,
+    guest_cookies: dict[str, str],
+    test_session_factory,
+    prompt_factory,
+    dataset_factory,
+    profile_factory,
+) -> None:
+    """POST /runs는 API 프로세스에서 실행하지 않고 작업 큐에 등록."""
+    guest_id = guest_cookies["guest_id"]
+    _, version = await prompt_factory(guest_id)
+    dataset = await dataset_factory(guest_id, rows=[{"input": {"input": "x"}}])
+    profile = await profile_factory(guest_id)
+
+    response = await client.post(
+        "/runs",
+        json={
+            "promptVersionId": version.id,
+            "datasetId": dataset.id,
+            "profileId": profile.id,
+        },
+        cookies=guest_cookies,
+    )
+
+    assert response.status_code == 201
+    async with test_session_factory() as session:
+        job = (await session.execute(select(RunJob))).scalar_one()
+    assert job.run_id == response.json()["id"]
+    assert job.status == JobStatus.QUEUED
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_rows_locked_by_other_worker(
+    test_session_factory, factories
+) -> None:
+    """다른 워커가 잠근 작업은 건너뛰고 나머지를 가져감."""
+    await _create_runs(test_session_factory, factories, 3)
+
+    async with test_session_factory() as locker, test_session_factory() as session:
+        # 다른 워커가 첫 작업을 잠그고 아직 commit하지 않은 상태
+        locked = (
+            await locker.execute(
+                select(RunJob).order_by(col(RunJob.id)).limit(1).with_for_update()
+            )
+        ).scalar_one()
+
+        claimed = await queue.claim_jobs(session, "worker-b", limit=10)
+
+        assert locked.id not in {job.id for job in claimed}
+        assert len(claimed) == 2
+        assert all(job.locked_by == "worker-b" for job in claimed)
+        await locker.rollback()
+
+
+@pytest.mark.asyncio
+async def test_claimed_jobs_are_not_claimed_twice(
+    test_session_factory, factories
+) -> None:
+    """점유된 작업은 heartbeat가 살아 있는 동안 다시 가져가지 않음."""
+    await _create_runs(test_session_factory, factories, 2)
+
+    async with test_session_factory() as session:
+        first = await queue.claim_jobs(session, "worker-a", limit=1)
+        second = await queue.claim_jobs(session, "worker-b", limit=5)
+        third = await queue.claim_jobs(session, "worker-c", limit=5)
+
+    assert len(first) == 1
+    assert len(second) == 1
+    assert first[0].id != second[0].id
+    assert third == []
+
+
+@pytest.mark.asyncio
+async def test_stale_job_is_reclaimed(test_session_factory, factories) -> None:
+    """heartbeat가 끊긴 작업은 다른 워커가 다시 가져감."""
+    await _create_runs(test_session_factory, factories, 1)
+
+    async with test_session_factory() as session:
+        [job] = await queue.claim_jobs(session, "crashed-worker", limit=1)
+        job.locked_at = datetime.now(UTC) - timedelta(hours=1)
+        await session.commit()
+
+        [reclaimed] = await queue.claim_jobs(session, "worker-b", limit=1)
+
+    assert reclaimed.id == job.id
+    assert reclaimed.locked_by == "worker-b"
+    assert reclaimed.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_job_at_max_attempts_is_failed(
+    test_session_factory, factories
+) -> None:
+    """최대 시도 횟수를 채운 채 heartbeat가 끊긴 작업은 다시 나눠 주지 않고 FAILED."""
+    [run_id] = await _create_runs(test_session_factory, factories, 1)
+
+    async with test_session_factory() as session:
+        [job] = await queue.claim_jobs(session, "crashed-worker", limit=1)
+        job.attempts = 3
+        job.locked_at = datetime.now(UTC) - timedelta(hours=1)
+        await session.commit()
+
+        assert await queue.claim_jobs(session, "worker-b", limit=1) == []
+
+    async with test_session_factory() as session:
+        job = (await session.execute(select(RunJob))).scalar_one()
+        run = await session.get(Run, run_id)
+    assert job.status == JobStatus.FAILED
+    assert job.locked_by is None
+    assert job.last_error is not None
+    assert run is not None and run.status == RunStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_finish_job_ignores_reclaimed_job(
+    test_session_factory, factories
+) -> None:
+    """다른 워커가 다시 가져간 작업은 이전 워커가 종료 처리하지 못함."""
+    await _create_runs(test_session_factory, factories, 1)
+
+    async with test_session_factory() as session:
+        [job] = await queue.claim_jobs(session, "slow-worker", limit=1)
+        assert job.id is not None
+        job.locked_at = datetime.now(UTC) - timedelta(hours=1)
+        await session.commit()
+        [reclaimed] = await queue.claim_jobs(session, "worker-b", limit=1)
+        assert reclaimed.id == job.id
+
+        assert await queue.finish_job(session, "slow-worker", job.id, "boom") is None
+
+    async with test_session_factory() as session:
+        job = (await session.execute(select(RunJob))).scalar_one()
+    assert (job.status, job.locked_by, job.last_error) == (
+        JobStatus.RUNNING,
+        "worker-b",
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_job_requeued_until_max_attempts(
+    test_session_factory, factories
+) -> None:
+    """실패한 작업은 최대 시도 횟수 전까지 다시 대기열로."""
+    await _create_runs(test_session_factory, factories, 1)
+
+    statuses: list[JobStatus] = []
+    async with test_session_factory() as session:
+        for _ in range(3):
+            [job] = await queue.claim_jobs(session, "worker-a", limit=1)
+            assert job.id is not None
+            statuses.append(
+                await queue.finish_job(session, "worker-a", job.id, error="boom")
+            )
+
+    assert statuses == [JobStatus.QUEUED, JobStatus.QUEUED, JobStatus.FAILED]
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_failed_run_until_max_attempts(
+    test_session_factory, factories
+) -> None:
+    """process_run이 실패하면 작업은 다시 대기열로, Run은 마지막 시도 전까지 RUNNING."""
+    [run_id] = await _create_runs(test_session_factory, factories, 1)
+
+    failing_llm = AsyncMock()
+    failing_llm.generate = AsyncMock(side_effect=Exception("API Error"))
+
+    observed: list[tuple[JobStatus, RunStatus, int, str | None]] = []
+    with (
+        patch("src.runs.service.async_session", test_session_factory),
+        patch("src.runs.service.get_llm_client", return_value=failing_llm),
+    ):
+        worker = RunWorker(
+            worker_id="worker-test", session_factory=test_session_factory
+        )
+        for _ in range(worker.max_attempts):
+            assert await worker.run_once() == 1
+            await worker.drain()
+            async with test_session_factory() as session:
+                job = (await session.execute(select(RunJob))).scalar_one()
+                run = await session.get(Run, run_id)
+                assert run is not None
+                observed.append((job.status, run.status, job.attempts, job.last_error))
+
+    assert worker.max_attempts == 3
+    assert observed == [
+        (JobStatus.QUEUED, RunStatus.RUNNING, 1, "API Error"),
+        (JobStatus.QUEUED, RunStatus.RUNNING, 2, "API Error"),
+        (JobStatus.FAILED, RunStatus.FAILED, 3, "API Error"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_worker_processes_runs_concurrently(
+    test_session_factory, factories
+) -> None:
+    """워커 하나가 여러 Run을 동시에 처리하고 작업을 DONE으로 표시."""
+    run_ids = await _create_runs(test_session_factory, factories, 3)
+
+    mock_llm = AsyncMock()
+    mock_llm.generate = AsyncMock(return_value="y")
+
+    with (
+        patch("src.runs.service.async_session", test_session_factory),
+        patch("src.runs.service.get_llm_client", return_value=mock_llm),
+    ):
+        worker = RunWorker(
+            worker_id="worker-test",
+            concurrency=5,
+            session_factory=test_session_factory,
+        )
+        started = await worker.run_once()
+        await worker.drain()
+
+    assert started == 3
+    async with test_session_factory() as session:
+        jobs = (await session.execute(select(RunJob))).scalars().all()
+        runs = (
+            (await session.execute(select(Run).where(col(Run.id).in_(run_ids))))
+            .scalars()
+            .all()
+        )
+        assert await queue.count_queued(session) == 0
+
+    assert {job.status for job in jobs} == {JobStatus.DONE}
+    assert {run.status for run in runs} == {RunStatus.COMPLETED}
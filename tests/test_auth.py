@@ -1,5 +1,21 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
 import pytest
+from fastapi import Request
+from fastapi.security import HTTPAuthorizationCredentials
 from httpx import AsyncClient
+from jose import jwt
+
+from src.auth.cache import (
+    IdentityCache,
+    TokenCache,
+    get_token_cache,
+    guest_key,
+)
+from src.auth.dependencies import get_current_identity
+from src.auth.models import Guest, User
+from src.auth.service import create_access_token, decode_token
 
 
 @pytest.mark.asyncio
@@ -52,3 +68,94 @@ async def test_nonexistent_guest_cookie_creates_new_guest(client: AsyncClient) -
     data = response.json()
     assert data["guestId"] != fake_uuid
     assert "guest_id" in response.cookies
+
+
+def _request(cookies: dict[str, str] | None = None) -> Request:
+    headers = []
+    if cookies:
+        cookie = "; ".join(f"{k}={v}" for k, v in cookies.items())
+        headers.append((b"cookie", cookie.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.asyncio
+async def test_cached_identity_skips_query(test_session_factory, guest_factory) -> None:
+    """두 번째 요청부터는 Guest/User를 DB에서 다시 조회하지 않음"""
+    guest = await guest_factory()
+    async with test_session_factory() as session:
+        user = User(email="a@example.com", provider_id="google-1")
+        session.add(user)
+        await session.commit()
+        assert user.id is not None
+        user_id = user.id
+    token, _ = create_access_token(user_id, "user")
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    async with test_session_factory() as session:
+        first_guest = await get_current_identity(
+            _request({"guest_id": str(guest.id)}), None, session
+        )
+        first_user = await get_current_identity(_request(), credentials, session)
+
+    no_db = AsyncMock()
+    cached_guest = await get_current_identity(
+        _request({"guest_id": str(guest.id)}), None, no_db
+    )
+    cached_user = await get_current_identity(_request(), credentials, no_db)
+
+    no_db.execute.assert_not_awaited()
+    assert (
+        isinstance(cached_guest, Guest)
+        and cached_guest.id == first_guest.id == guest.id
+    )
+    assert isinstance(cached_user, User) and cached_user.id == first_user.id == user_id
+
+
+def test_identity_cache_invalidate_drops_entry() -> None:
+    """invalidate()한 identity는 TTL 전이라도 반환하지 않음"""
+    cache = IdentityCache(max_size=2, ttl=60)
+    guest = Guest()
+    cache.put(guest_key(guest.id), guest)
+
+    cache.invalidate(guest_key(guest.id))
+
+    assert cache.get(guest_key(guest.id)) is None
+    cache.invalidate(guest_key(guest.id))
+
+
+def test_identity_cache_expires_after_ttl() -> None:
+    """TTL이 지난 identity는 반환하지 않음"""
+    now = [0.0]
+    cache = IdentityCache(max_size=2, ttl=60, clock=lambda: now[0])
+    guest = Guest()
+    cache.put(guest_key(guest.id), guest)
+
+    now[0] = 59.0
+    assert cache.get(guest_key(guest.id)) is guest
+    now[0] = 60.0
+    assert cache.get(guest_key(guest.id)) is None
+
+
+def test_decode_token_memoized_until_expiry() -> None:
+    """검증한 토큰은 서명 검증 없이 재사용하되, 만료된 토큰은 캐시에서도 거부"""
+    token, _ = create_access_token(1, "user")
+    with patch("src.auth.service.jwt.decode", wraps=jwt.decode) as decode:
+        assert decode_token(token) is not None
+        assert decode_token(token) is not None
+        assert decode.call_count == 1
+
+    expiring, expires_at = create_access_token(
+        2, "user", expires_delta=timedelta(seconds=30)
+    )
+    cache = TokenCache(max_size=10, clock=lambda: expires_at.timestamp())
+    payload = decode_token(expiring)
+    assert payload is not None
+    cache.put(expiring, payload)
+    assert cache.get(expiring) is None
+
+
+def test_invalid_token_not_cached() -> None:
+    """검증에 실패한 토큰은 캐시하지 않음"""
+    assert decode_token("not-a-jwt") is None
+    assert get_token_cache().get("not-a-jwt") is None
+    assert len(get_token_cache()) == 0
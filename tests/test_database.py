@@ -0,0 +1,85 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import exc, text
+from sqlalchemy.pool import NullPool, QueuePool
+
+from src.config import Settings
+from src.database import create_engine
+from tests.conftest import TEST_DATABASE_URL
+
+
+def _settings(**overrides: object) -> Settings:
+    return Settings(DATABASE_URL=TEST_DATABASE_URL, **overrides)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_api_and_worker_pools_sized_separately() -> None:
+    """role별로 DB_POOL_SIZE / WORKER_DB_POOL_SIZE 풀을 만들고 공통 설정을 적용"""
+    config = _settings(
+        DB_POOL_SIZE=3,
+        DB_MAX_OVERFLOW=1,
+        WORKER_DB_POOL_SIZE=7,
+        WORKER_DB_MAX_OVERFLOW=0,
+        DB_POOL_RECYCLE=60,
+        DB_POOL_PRE_PING=True,
+    )
+    api = create_engine("api", config)
+    worker = create_engine("worker", config)
+    try:
+        assert isinstance(api.pool, QueuePool) and isinstance(worker.pool, QueuePool)
+        assert (api.pool.size(), api.pool._max_overflow) == (3, 1)
+        assert (worker.pool.size(), worker.pool._max_overflow) == (7, 0)
+        assert api.pool._recycle == 60
+        assert api.pool._pre_ping is True
+        async with worker.connect() as conn:
+            assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+    finally:
+        await api.dispose()
+        await worker.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_records_checkout_wait_and_timeouts() -> None:
+    """checkout 소요 시간은 pool label로 기록되고, 풀이 가득 차면 timeout 카운트"""
+    engine = create_engine(
+        "worker",
+        _settings(WORKER_DB_POOL_SIZE=1, WORKER_DB_MAX_OVERFLOW=0, DB_POOL_TIMEOUT=0.1),
+    )
+    pool = {"pool": "worker"}
+
+    def _sample(name: str) -> float:
+        return REGISTRY.get_sample_value(name, pool) or 0.0
+
+    checkouts_before = _sample("prs_db_pool_checkout_duration_seconds_count")
+    wait_before = _sample("prs_db_pool_checkout_duration_seconds_sum")
+    timeouts_before = _sample("prs_db_pool_timeouts_total")
+    try:
+        async with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+    finally:
+        await engine.dispose()
+
+    assert (
+        _sample("prs_db_pool_checkout_duration_seconds_count") == checkouts_before + 2
+    )
+    assert _sample("prs_db_pool_timeouts_total") == timeouts_before + 1
+    assert _sample("prs_db_pool_checkout_duration_seconds_sum") - wait_before >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_pgbouncer_mode_disables_statement_caches() -> None:
+    """PgBouncer 모드는 prepared statement 캐시를 끄고 풀링을 PgBouncer에 맡김"""
+    engine = create_engine("api", _settings(DB_PGBOUNCER=True))
+    try:
+        assert isinstance(engine.pool, NullPool)
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            adapted = raw.driver_connection
+            assert adapted is not None
+            assert adapted._config.statement_cache_size == 0
+            assert raw.dbapi_connection._prepared_statement_cache is None  # type: ignore[union-attr]
+            assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+    finally:
+        await engine.dispose()
@@ -0,0 +1,134 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.embeddings.cache import EmbeddingCache, text_hash
+from src.prompts.models import OutputSchemaType
+from src.runs.evaluator.semantic_layer import check_semantic
+
+MODEL = "text-embedding-3-small"
+
+
+class TestEmbeddingCacheLRU:
+    """프로세스 내 LRU 계층 테스트"""
+
+    def test_text_hash_is_sha256(self):
+        """키는 텍스트의 sha256 hex"""
+        assert text_hash("abc") == (
+            "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+        )
+
+    def test_get_returns_put_value(self):
+        """저장한 embedding 조회"""
+        cache = EmbeddingCache(max_size=10)
+        cache.put(MODEL, "hello", [0.1, 0.2])
+
+        assert cache.get(MODEL, "hello") == pytest.approx([0.1, 0.2])
+        assert cache.get("other-model", "hello") is None
+
+    def test_least_recently_used_evicted(self):
+        """최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache = EmbeddingCache(max_size=2)
+        cache.put(MODEL, "a", [1.0])
+        cache.put(MODEL, "b", [2.0])
+        cache.get(MODEL, "a")
+        cache.put(MODEL, "c", [3.0])
+
+        assert cache.get(MODEL, "a") == [1.0]
+        assert cache.get(MODEL, "b") is None
+        assert cache.get(MODEL, "c") == [3.0]
+
+    def test_entries_stored_as_float32(self):
+        """embedding은 float32 배열로 보관하고 조회 시 list[float]로 반환"""
+        cache = EmbeddingCache(max_size=10)
+        cache.put(MODEL, "hello", [0.25] * 1536)
+
+        [stored] = cache._entries.values()
+        assert stored.dtype == np.float32
+        assert stored.nbytes == 1536 * 4
+        assert cache.get(MODEL, "hello") == [0.25] * 1536
+
+
+class TestEmbeddingCachePersistence:
+    """pgvector 영구 저장소 계층 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_persist_then_warm_roundtrip(self, test_session_factory):
+        """persist한 embedding을 새 프로세스(빈 LRU)에서 warm으로 적재"""
+        writer = EmbeddingCache(max_size=10)
+        writer.put(MODEL, "기대 출력", [0.25, 0.5, 0.75])
+
+        async with test_session_factory() as session:
+            assert await writer.persist(session, MODEL, ["기대 출력"]) == 1
+            await session.commit()
+
+        # 이미 기록된 항목은 다시 기록하지 않음
+        async with test_session_factory() as session:
+            assert await writer.persist(session, MODEL, ["기대 출력"]) == 0
+
+        reader = EmbeddingCache(max_size=10)
+        async with test_session_factory() as session:
+            loaded = await reader.warm(session, MODEL, ["기대 출력", "없는 텍스트"])
+
+        assert loaded == 1
+        assert reader.get(MODEL, "기대 출력") == [0.25, 0.5, 0.75]
+        assert reader.get(MODEL, "없는 텍스트") is None
+
+    @pytest.mark.asyncio
+    async def test_duplicate_persist_is_ignored(self, test_session_factory):
+        """다른 프로세스가 같은 키를 먼저 기록해도 충돌 없이 무시"""
+        first = EmbeddingCache(max_size=10)
+        second = EmbeddingCache(max_size=10)
+        first.put(MODEL, "same", [1.0, 0.0])
+        second.put(MODEL, "same", [1.0, 0.0])
+
+        async with test_session_factory() as session:
+            await first.persist(session, MODEL, ["same"])
+            await second.persist(session, MODEL, ["same"])
+            await session.commit()
+
+    @pytest.mark.asyncio
+    async def test_persist_writes_only_given_texts(self, test_session_factory):
+        """다른 Run의 embedding은 남겨 두고, rollback된 embedding은 다시 대기"""
+        cache = EmbeddingCache(max_size=10)
+        cache.put(MODEL, "이 Run", [1.0, 0.0])
+        cache.put(MODEL, "다른 Run", [0.0, 1.0])
+
+        async with test_session_factory() as session:
+            assert await cache.persist(session, MODEL, ["이 Run"]) == 1
+            await session.rollback()
+
+        async with test_session_factory() as session:
+            assert await cache.persist(session, MODEL, ["이 Run", "다른 Run"]) == 2
+            await session.commit()
+
+        async with test_session_factory() as session:
+            assert await cache.persist(session, MODEL, ["이 Run", "다른 Run"]) == 0
+
+        reader = EmbeddingCache(max_size=10)
+        async with test_session_factory() as session:
+            assert await reader.warm(session, MODEL, ["이 Run", "다른 Run"]) == 2
+
+
+class TestSemanticLayerUsesCache:
+    """Semantic Layer가 캐시된 embedding을 재사용하는지 검증"""
+
+    def test_cached_text_skips_api_call(self):
+        """캐시에 있는 텍스트는 API를 호출하지 않음"""
+        cache = EmbeddingCache(max_size=10)
+        cache.put(MODEL, "expected", [1.0, 0.0])
+        cache.put(MODEL, "raw", [1.0, 0.0])
+        client = MagicMock()
+
+        with (
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_cache",
+                return_value=cache,
+            ),
+            patch("src.runs.evaluator.semantic_layer._get_client", return_value=client),
+        ):
+            result = check_semantic("raw", "expected", OutputSchemaType.FREEFORM, 0.9)
+
+        assert result.passed is True
+        client.embeddings.create.assert_not_called()
@@ -1,5 +1,7 @@
+import pytest
+
 from src.prompts.models import OutputSchemaType
-from src.runs.evaluator.format_layer import check_format
+from src.runs.evaluator.format_layer import JsonStreamValidator, check_format
 
 
 class TestCheckFormatJsonObject:
@@ -117,3 +119,70 @@ class TestCheckFormatFreeform:
 
         assert result.passed is True
         assert result.parsed_output == "아무 형식이나 상관없음"
+
+
+def _feed_all(validator: JsonStreamValidator, text: str, chunk_size: int = 3) -> bool:
+    return all(
+        validator.feed(text[i : i + chunk_size])
+        for i in range(0, len(text), chunk_size)
+    )
+
+
+class TestJsonStreamValidator:
+    """스트리밍 JSON 점진적 검증 테스트"""
+
+    @pytest.mark.parametrize(
+        "raw_output",
+        [
+            '{"verdict": "TRUE", "items": [1, -2.5e3, null, true], "s": "a\\"b\\u00e9"}',
+            '  {"a": {"b": []}}\n',
+            '```json\n{"a": 1}\n```',
+            '```\n{"a": 1}\n``` 설명',
+            '{"a": NaN, "b": -Infinity}',
+        ],
+    )
+    def test_valid_output_never_aborts(self, raw_output):
+        """check_format을 통과하는 출력은 중단하지 않음"""
+        assert check_format(raw_output, OutputSchemaType.JSON_OBJECT).passed
+        assert _feed_all(JsonStreamValidator(OutputSchemaType.JSON_OBJECT), raw_output)
+
+    @pytest.mark.parametrize(
+        "prefix",
+        [
+            "[",
+            "{'a'",
+            '{"a" 1',
+            '{"a": 01',
+            '{"a": 1.e5',
+            '{"a": tru }',
+            '{"a": 1} 추가 설명',
+            '```json\n{"a": 1}\n```'[:8] + "[",
+            '```JSON\n{"a": 1}',
+        ],
+    )
+    def test_aborts_when_object_impossible(self, prefix):
+        """이어지는 출력과 무관하게 실패가 확정되면 중단"""
+        validator = JsonStreamValidator(OutputSchemaType.JSON_OBJECT)
+
+        assert _feed_all(validator, prefix) is False
+        assert validator.error_message is not None
+        assert not check_format(prefix, OutputSchemaType.JSON_OBJECT).passed
+
+    def test_array_schema(self):
+        """JSON Array 스키마는 배열만 허용"""
+        assert _feed_all(
+            JsonStreamValidator(OutputSchemaType.JSON_ARRAY), '[{"a": 1}, 2]'
+        )
+        assert not JsonStreamValidator(OutputSchemaType.JSON_ARRAY).feed("{")
+
+    def test_prose_prefix_is_not_aborted(self):
+        """문장으로 시작하면 뒤에 코드블록이 올 수 있으므로 중단하지 않음"""
+        validator = JsonStreamValidator(OutputSchemaType.JSON_OBJECT)
+
+        assert validator.feed("결과는 다음과 같습니다:\n")
+        assert validator.feed('```json\n{"a": 1}\n```')
+
+    def test_non_json_schema_rejected(self):
+        """JSON이 아닌 스키마는 생성 불가"""
+        with pytest.raises(ValueError):
+            JsonStreamValidator(OutputSchemaType.FREEFORM)
@@ -0,0 +1,157 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.llm.cache import (
+    CachedLLMClient,
+    MemoryGenerationCache,
+    PostgresGenerationCache,
+    generation_key,
+)
+
+MODEL = "gemini-2.5-flash"
+
+
+class TestGenerationKey:
+    """캐시 키 테스트"""
+
+    def test_same_inputs_same_key(self):
+        """동일 입력 = 동일 키"""
+        assert generation_key(MODEL, "sys", "user", 0.0) == generation_key(
+            MODEL, "sys", "user", 0.0
+        )
+
+    def test_each_input_changes_key(self):
+        """모델/지시문/메시지/temperature 중 하나라도 다르면 다른 키"""
+        base = generation_key(MODEL, "sys", "user", 0.0)
+        assert generation_key("gemini-other", "sys", "user", 0.0) != base
+        assert generation_key(MODEL, "sys2", "user", 0.0) != base
+        assert generation_key(MODEL, "sys", "user2", 0.0) != base
+        assert generation_key(MODEL, "sys", "user", 0.5) != base
+
+
+class TestCachedLLMClient:
+    """생성 캐시 래퍼 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_temperature_zero_uses_cache(self):
+        """temperature=0 반복 호출은 LLM 1회 호출 + hit 집계"""
+        llm = AsyncMock()
+        llm.generate = AsyncMock(return_value="답")
+        client = CachedLLMClient(llm, MODEL, MemoryGenerationCache(max_size=10))
+
+        for _ in range(3):
+            assert await client.generate("sys", "질문", temperature=0.0) == "답"
+
+        assert llm.generate.await_count == 1
+        assert client.stats.take() == (2, 1)
+        assert client.stats.take() == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_nonzero_temperature_bypasses_cache(self):
+        """temperature > 0은 캐시하지 않음"""
+        llm = AsyncMock()
+        llm.generate = AsyncMock(return_value="답")
+        client = CachedLLMClient(llm, MODEL, MemoryGenerationCache(max_size=10))
+
+        await client.generate("sys", "질문", temperature=0.7)
+        await client.generate("sys", "질문", temperature=0.7)
+
+        assert llm.generate.await_count == 2
+        assert client.stats.take() == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_always_caches_nonzero_temperature(self):
+        """always=True면 temperature와 무관하게 캐시"""
+        llm = AsyncMock()
+        llm.generate = AsyncMock(return_value="답")
+        client = CachedLLMClient(
+            llm, MODEL, MemoryGenerationCache(max_size=10), always=True
+        )
+
+        await client.generate("sys", "질문", temperature=0.7)
+        await client.generate("sys", "질문", temperature=0.7)
+
+        assert llm.generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_prepared_keys_are_reused(self):
+        """prepare()로 계산한 key는 generate에서 다시 계산하지 않음"""
+        llm = AsyncMock()
+        llm.generate = AsyncMock(return_value="답")
+        client = CachedLLMClient(llm, MODEL, MemoryGenerationCache(max_size=10))
+
+        keys = client.prepare("sys", ["질문1", "질문2"], 0.0)
+        assert keys == [
+            generation_key(MODEL, "sys", "질문1", 0.0),
+            generation_key(MODEL, "sys", "질문2", 0.0),
+        ]
+        with patch("src.llm.cache.generation_key") as key_fn:
+            await client.generate("sys", "질문1", temperature=0.0)
+        key_fn.assert_not_called()
+        assert client.cache.get(keys[0]) == "답"
+
+    @pytest.mark.asyncio
+    async def test_stream_caches_only_completed_output(self):
+        """끝까지 받은 스트림만 캐시하고, 중단된 스트림은 캐시하지 않음"""
+        from src.llm.stub import StubLLMClient
+
+        stub = StubLLMClient(respond=lambda _: "답변")
+        client = CachedLLMClient(stub, MODEL, MemoryGenerationCache(max_size=10))
+
+        async for _ in client.generate_stream("sys", "중단", temperature=0.0):
+            break
+        chunks = [
+            c async for c in client.generate_stream("sys", "완료", temperature=0.0)
+        ]
+        cached = [
+            c async for c in client.generate_stream("sys", "완료", temperature=0.0)
+        ]
+
+        assert chunks == ["답", "변"]
+        assert cached == ["답변"]
+        assert client.cache.get(client.key_for("sys", "중단", 0.0)) is None
+        assert stub.generate_calls == 2
+
+
+class TestPostgresGenerationCache:
+    """generation_cache 테이블 계층 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_persist_then_warm_roundtrip(self, test_session_factory):
+        """persist한 결과를 빈 LRU에서 warm으로 적재"""
+        key = generation_key(MODEL, "sys", "질문", 0.0)
+        writer = PostgresGenerationCache(max_size=10)
+        writer.put(key, MODEL, "답")
+
+        async with test_session_factory() as session:
+            assert await writer.persist(session, [key]) == 1
+            await session.commit()
+
+        reader = PostgresGenerationCache(max_size=10)
+        async with test_session_factory() as session:
+            assert await reader.warm(session, [key, "missing"]) == 1
+
+        assert reader.get(key) == "답"
+
+    @pytest.mark.asyncio
+    async def test_persist_writes_only_given_keys(self, test_session_factory):
+        """다른 Run의 대기 결과는 이 트랜잭션이 rollback돼도 남아 있다가 그 Run이 기록"""
+        own_key = generation_key(MODEL, "sys", "이 Run", 0.0)
+        other_key = generation_key(MODEL, "sys", "다른 Run", 0.0)
+        cache = PostgresGenerationCache(max_size=10)
+        cache.put(own_key, MODEL, "답1")
+        cache.put(other_key, MODEL, "답2")
+
+        async with test_session_factory() as session:
+            assert await cache.persist(session, [own_key]) == 1
+            await session.rollback()
+
+        async with test_session_factory() as session:
+            assert await cache.persist(session, [own_key, other_key]) == 1
+            await session.commit()
+
+        reader = PostgresGenerationCache(max_size=10)
+        async with test_session_factory() as session:
+            assert await reader.warm(session, [own_key, other_key]) == 1
+        assert reader.get(other_key) == "답2"
@@ -0,0 +1,123 @@
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from google.genai import types
+
+from src.config import get_settings
+from src.llm import BatchRequest, wait_for_batch
+from src.llm.base import BatchJobState
+from src.llm.errors import LLMError
+from src.llm.gemini import GeminiClient
+from src.llm.stub import StubLLMClient
+
+
+def _requests(n: int) -> list[BatchRequest]:
+    return [
+        BatchRequest(key=str(i), system_instruction="", user_message=f"q{i}")
+        for i in range(n)
+    ]
+
+
+class TestWaitForBatch:
+    """배치 작업 polling 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_polls_until_done_and_returns_results(self):
+        """완료될 때까지 polling 후 key별 결과 반환, 실패한 요청은 누락"""
+        client = StubLLMClient(
+            respond=str.upper, polls_until_done=3, failed_keys=frozenset({"1"})
+        )
+        job_id = await client.submit_batch(_requests(3))
+
+        results = await wait_for_batch(client, job_id, poll_interval=0, timeout=10)
+
+        assert results == {"0": "Q0", "2": "Q2"}
+        assert client._polls[job_id] == 3
+        assert client.generate_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_job_raises(self, monkeypatch):
+        """작업 자체가 실패하면 LLMError"""
+        client = StubLLMClient()
+        job_id = await client.submit_batch(_requests(1))
+
+        async def failed(_job_id: str) -> BatchJobState:
+            return BatchJobState.FAILED
+
+        monkeypatch.setattr(client, "get_batch_state", failed)
+
+        with pytest.raises(LLMError):
+            await wait_for_batch(client, job_id, poll_interval=0, timeout=10)
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises(self):
+        """timeout이 지나도 끝나지 않으면 LLMError"""
+        client = StubLLMClient(polls_until_done=1_000_000)
+        job_id = await client.submit_batch(_requests(1))
+
+        with pytest.raises(LLMError):
+            await wait_for_batch(client, job_id, poll_interval=0.01, timeout=0.05)
+
+
+class TestGeminiBatch:
+    """Gemini 배치 제출 - 크기에 따라 inline 요청 또는 JSONL 파일"""
+
+    @pytest.fixture
+    def gemini(self, monkeypatch) -> GeminiClient:
+        monkeypatch.setattr(get_settings(), "GOOGLE_API_KEY", "test-key")
+        client = GeminiClient()
+        aio = client.client.aio
+        monkeypatch.setattr(
+            aio.batches, "create", AsyncMock(return_value=types.BatchJob(name="job"))
+        )
+        monkeypatch.setattr(
+            aio.files, "upload", AsyncMock(return_value=types.File(name="files/in"))
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_small_batch_submitted_inline(self, gemini):
+        """inline 한도 이하면 요청을 InlinedRequest로 제출"""
+        assert await gemini.submit_batch(_requests(3)) == "job"
+
+        src = gemini.client.aio.batches.create.await_args.kwargs["src"]
+        assert [r.metadata for r in src] == [{"key": "0"}, {"key": "1"}, {"key": "2"}]
+        gemini.client.aio.files.upload.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_large_batch_uploaded_as_jsonl(self, gemini, monkeypatch):
+        """inline 한도를 넘으면 JSONL 파일을 업로드해 파일 입력으로 제출"""
+        monkeypatch.setattr(get_settings(), "LLM_BATCH_INLINE_MAX_BYTES", 100)
+
+        assert await gemini.submit_batch(_requests(3)) == "job"
+
+        assert gemini.client.aio.batches.create.await_args.kwargs["src"] == "files/in"
+        uploaded = gemini.client.aio.files.upload.await_args.kwargs["file"]
+        lines = [json.loads(line) for line in uploaded.getvalue().splitlines()]
+        assert [line["key"] for line in lines] == ["0", "1", "2"]
+        assert lines[1]["request"]["contents"][0]["parts"][0]["text"] == "q1"
+
+    @pytest.mark.asyncio
+    async def test_file_results_read_from_dest_file(self, gemini, monkeypatch):
+        """파일로 받은 결과는 key별 응답 텍스트로, 오류 응답은 제외"""
+        job = types.BatchJob(
+            name="job", dest=types.BatchJobDestination(file_name="files/out")
+        )
+        output = "\n".join(
+            json.dumps(line)
+            for line in [
+                {
+                    "key": "0",
+                    "response": {
+                        "candidates": [{"content": {"parts": [{"text": "답"}]}}]
+                    },
+                },
+                {"key": "1", "error": {"code": 400, "message": "bad"}},
+            ]
+        ).encode()
+        aio = gemini.client.aio
+        monkeypatch.setattr(aio.batches, "get", AsyncMock(return_value=job))
+        monkeypatch.setattr(aio.files, "download", AsyncMock(return_value=output))
+
+        assert await gemini.get_batch_results("job") == {"0": "답"}
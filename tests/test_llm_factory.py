@@ -0,0 +1,68 @@
+import pytest
+
+from src.config import get_settings
+from src.llm import factory
+from src.llm.gemini import GeminiClient
+from src.llm.ratelimit import RateLimitedLLMClient
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """API 키가 설정된 빈 레지스트리."""
+    monkeypatch.setattr(get_settings(), "GOOGLE_API_KEY", "test-key")
+    monkeypatch.setattr(factory, "_clients", {})
+    monkeypatch.setattr(factory, "_base_clients", {})
+    monkeypatch.setattr(factory, "_http_clients", {})
+    return factory
+
+
+class TestLLMClientRegistry:
+    """프로세스 전역 LLM 클라이언트 레지스트리 테스트"""
+
+    def test_same_model_returns_same_client(self, registry):
+        """같은 모델 = 같은 클라이언트 인스턴스"""
+        client = registry.get_llm_client("gemini-2.5-flash")
+
+        assert isinstance(client, RateLimitedLLMClient)
+        assert isinstance(client.client, GeminiClient)
+        assert registry.get_llm_client("gemini-2.5-flash") is client
+
+    def test_models_of_same_provider_share_pool(self, registry):
+        """같은 provider의 다른 모델은 HTTP 연결 풀 공유"""
+        registry.get_llm_client("gemini-2.5-flash")
+        registry.get_llm_client("gemini-2.5-pro")
+
+        assert len(registry._clients) == 2
+        assert list(registry._http_clients) == ["gemini"]
+
+    def test_pool_limits_from_settings(self, registry, monkeypatch):
+        """연결 풀 크기는 설정값 사용"""
+        monkeypatch.setattr(get_settings(), "LLM_MAX_CONNECTIONS", 7)
+        registry.get_llm_client("gemini-2.5-flash")
+
+        pool = registry._http_clients["gemini"]._transport._pool
+        assert pool._max_connections == 7
+
+    def test_unsupported_model_raises(self, registry):
+        """지원하지 않는 모델은 ValueError"""
+        with pytest.raises(ValueError):
+            registry.get_llm_client("gpt-4o")
+
+    def test_batch_client_is_unwrapped_provider_client(self, registry):
+        """배치 클라이언트는 속도 제한 래퍼가 아닌 provider 클라이언트 자체"""
+        client = registry.get_batch_llm_client("gemini-2.5-flash")
+
+        assert isinstance(client, GeminiClient)
+        assert registry.get_llm_client("gemini-2.5-flash").client is client
+
+    @pytest.mark.asyncio
+    async def test_close_clears_registry_and_pools(self, registry):
+        """종료 시 클라이언트와 연결 풀 모두 정리"""
+        registry.get_llm_client("gemini-2.5-flash")
+        http_client = registry._http_clients["gemini"]
+
+        await registry.close_llm_clients()
+
+        assert registry._clients == {}
+        assert registry._http_clients == {}
+        assert http_client.is_closed
@@ -1,5 +1,6 @@
+from src.common.constraints import validate_constraints
 from src.common.types import LogicConstraint
-from src.runs.evaluator.logic_layer import check_logic
+from src.runs.evaluator.logic_layer import check_logic, compile_constraints
 
 
 class TestCheckLogicContains:
@@ -184,3 +185,102 @@ class TestCheckLogicEdgeCases:
         result = check_logic(parsed_output, constraints)
 
         assert result.passed is False
+
+
+class TestConstraintPlan:
+    """컴파일된 constraint plan 테스트"""
+
+    def test_plan_matches_check_logic(self):
+        """같은 plan을 여러 row에 재사용해도 결과는 row별 검사와 동일"""
+        constraints: list[LogicConstraint] = [
+            {"type": "regex", "target": "code", "pattern": r"^[A-Z]{3}$"},
+            {"type": "range", "target": "score", "min": 0, "max": 10},
+            {"type": "max_length", "target": "code", "value": 3},
+        ]
+        plan = compile_constraints(constraints)
+        rows = [
+            {"code": "ABC", "score": 5},
+            {"code": "abcd", "score": 11},
+            {"score": "x"},
+        ]
+
+        for row in rows:
+            assert (
+                plan.evaluate(row).model_dump()
+                == check_logic(row, constraints).model_dump()
+            )
+        assert [plan.evaluate(row).passed for row in rows] == [True, False, False]
+        assert compile_constraints(plan) is plan
+
+    def test_passing_rows_share_result(self):
+        """모두 통과한 row는 미리 만든 결과를 공유"""
+        plan = compile_constraints([{"type": "contains", "target": "a", "value": "x"}])
+
+        assert plan.evaluate({"a": "x1"}) is plan.evaluate({"a": "x2"})
+
+    def test_invalid_regex_fails_every_row(self):
+        """이미 저장된 잘못된 정규식은 row 검사 시 실패로 기록"""
+        plan = compile_constraints([{"type": "regex", "target": "a", "pattern": "("}])
+
+        result = plan.evaluate({"a": "x"})
+
+        assert result.passed is False
+        assert result.results[0].message.startswith("잘못된 정규식 패턴")
+
+    def test_validate_constraints_reports_invalid_regex(self):
+        """저장 전 검증은 잘못된 정규식의 위치와 오류를 반환"""
+        errors = validate_constraints(
+            [
+                {"type": "regex", "target": "a", "pattern": "^ok$"},
+                {"type": "regex", "target": "b", "pattern": "[a-"},
+            ]
+        )
+
+        assert len(errors) == 1
+        assert errors[0].startswith("constraints[1]")
+
+    def test_validate_constraints_reports_invalid_range_and_max_length(self):
+        """숫자가 아닌 range 경계와 정수가 아닌 max_length는 저장 전에 거부"""
+        errors = validate_constraints(
+            [
+                {"type": "range", "target": "a", "min": 0, "max": "10"},
+                {"type": "range", "target": "b", "min": "low"},
+                {"type": "range", "target": "c", "min": 5, "max": 1},
+                {"type": "max_length", "target": "d", "value": 3},
+                {"type": "max_length", "target": "e", "value": "many"},
+                {"type": "max_length", "target": "f", "value": 2.5},
+                {"type": "max_length", "target": "g", "value": -1},
+            ]
+        )
+
+        assert [error.split(":")[0] for error in errors] == [
+            "constraints[1]",
+            "constraints[2]",
+            "constraints[4]",
+            "constraints[5]",
+            "constraints[6]",
+        ]
+
+    def test_invalid_max_length_fails_only_that_constraint(self):
+        """이미 저장된 잘못된 max_length는 plan 컴파일을 중단하지 않고 해당 constraint만 실패"""
+        plan = compile_constraints(
+            [
+                {"type": "contains", "target": "a", "value": "x"},
+                {"type": "max_length", "target": "a", "value": "many"},
+            ]
+        )
+
+        result = plan.evaluate({"a": "x"})
+
+        assert result.passed is False
+        assert result.results[0].passed is True
+        assert result.results[1].message.startswith("잘못된 최대 길이")
+
+    def test_invalid_range_bound_fails_every_row(self):
+        """이미 저장된 숫자가 아닌 range 경계는 row 검사 시 실패로 기록"""
+        plan = compile_constraints([{"type": "range", "target": "a", "max": "high"}])
+
+        result = plan.evaluate({"a": 1})
+
+        assert result.passed is False
+        assert result.results[0].message.startswith("잘못된 범위 값")
@@ -0,0 +1,38 @@
+import asyncio
+import urllib.error
+import urllib.request
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import start_http_server
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_pool_and_queue(client: AsyncClient) -> None:
+    """/metrics는 텍스트 형식으로 연결 풀·작업 큐·LLM 지표 노출"""
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=")
+    body = response.text
+    assert "prs_run_queue_depth 0.0" in body
+    assert "# TYPE prs_llm_request_duration_seconds histogram" in body
+    assert "# TYPE prs_db_pool_connections gauge" in body
+    assert 'prs_db_pool_connections{pool="api",state="size"}' in body
+
+
+@pytest.mark.asyncio
+async def test_worker_metrics_server_serves_registry() -> None:
+    """워커용 HTTP 서버(start_http_server)는 같은 registry를 노출"""
+    server, thread = start_http_server(0, "127.0.0.1")
+    port = server.server_port
+    try:
+        body = await asyncio.to_thread(
+            lambda: urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics").read()
+        )
+    finally:
+        server.shutdown()
+        thread.join()
+
+    assert b"# TYPE prs_run_rows_processed_total counter" in body
+    assert b"# TYPE prs_worker_active_runs gauge" in body
@@ -46,6 +46,50 @@ async def test_create_profile_with_constraints(
     assert len(data["globalConstraints"]) == 2
 
 
+@pytest.mark.asyncio
+async def test_invalid_regex_constraint_rejected(
+    client: AsyncClient, guest_cookies: dict[str, str]
+) -> None:
+    """잘못된 정규식 constraint는 생성/수정 시 422."""
+    invalid = [{"type": "regex", "target": "verdict", "pattern": "(TRUE"}]
+
+    create_response = await client.post(
+        "/evaluator-profiles",
+        json={"name": "정규식", "globalConstraints": invalid},
+        cookies=guest_cookies,
+    )
+    profile_id = (
+        await client.post("/evaluator-profiles", json={"name": "정상"}, cookies=guest_cookies)
+    ).json()["id"]
+    update_response = await client.patch(
+        f"/evaluator-profiles/{profile_id}",
+        json={"globalConstraints": invalid},
+        cookies=guest_cookies,
+    )
+
+    assert create_response.status_code == 422
+    assert "잘못된 정규식 패턴" in create_response.text
+    assert update_response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_invalid_max_length_constraint_rejected(
+    client: AsyncClient, guest_cookies: dict[str, str]
+) -> None:
+    """정수가 아닌 max_length 값은 생성 시 422."""
+    response = await client.post(
+        "/evaluator-profiles",
+        json={
+            "name": "길이",
+            "globalConstraints": [{"type": "max_length", "target": "code", "value": "many"}],
+        },
+        cookies=guest_cookies,
+    )
+
+    assert response.status_code == 422
+    assert "정수가 아닌 값" in response.text
+
+
 @pytest.mark.asyncio
 async def test_list_profiles(
     client: AsyncClient, guest_cookies: dict[str, str]
@@ -0,0 +1,285 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.common.trace import start_trace
+from src.llm.errors import RateLimitError, RetryableLLMError
+from src.llm.ratelimit import (
+    AdaptiveConcurrency,
+    ModelRateLimiter,
+    RateLimitedLLMClient,
+    TokenBucket,
+)
+
+
+class FlakyLLMClient:
+    """처음 failures번은 429를 던지는 가짜 LLM 클라이언트 (동시 호출 수 기록)."""
+
+    def __init__(self, failures: int, latency: float = 0.0):
+        self.failures = failures
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_mid_stream = False
+
+    async def generate(
+        self,
+        system_instruction: str,  # noqa: ARG002
+        user_message: str,
+        temperature: float = 1.0,  # noqa: ARG002
+    ) -> str:
+        self.calls += 1
+        call = self.calls
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if call <= self.failures:
+                raise RateLimitError()
+            return f"echo:{user_message}"
+        finally:
+            self.in_flight -= 1
+
+    async def generate_stream(
+        self,
+        system_instruction: str,
+        user_message: str,
+        temperature: float = 1.0,
+    ) -> AsyncIterator[str]:
+        output = await self.generate(system_instruction, user_message, temperature)
+        for char in output:
+            yield char
+            if self.fail_mid_stream:
+                raise RetryableLLMError()
+
+    async def aclose(self) -> None:
+        pass
+
+
+def make_limiter(
+    concurrency: int = 4,
+    rpm: int = 60_000,
+    tpm: int = 10_000_000,
+    cooldown: float = 0.0,
+) -> ModelRateLimiter:
+    return ModelRateLimiter(
+        requests_per_minute=rpm,
+        tokens_per_minute=tpm,
+        concurrency=AdaptiveConcurrency(
+            initial=concurrency,
+            minimum=1,
+            maximum=concurrency,
+            latency_target=10.0,
+            cooldown=cooldown,
+        ),
+    )
+
+
+class TestTokenBucket:
+    """토큰 버킷 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill_when_empty(self):
+        """용량을 다 쓰면 refill될 때까지 대기"""
+        bucket = TokenBucket(capacity=2, refill_rate=20)
+
+        started = time.perf_counter()
+        for _ in range(3):
+            await bucket.acquire()
+        elapsed = time.perf_counter() - started
+
+        assert elapsed >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_large_request_clamped_to_capacity(self):
+        """capacity보다 큰 요청도 영원히 대기하지 않음"""
+        bucket = TokenBucket(capacity=10, refill_rate=1000)
+        await asyncio.wait_for(bucket.acquire(100), timeout=1)
+
+
+class TestAdaptiveConcurrency:
+    """AIMD 동시성 한도 테스트"""
+
+    def test_rate_limit_halves_and_success_grows_slowly(self):
+        """429 = 절반, 성공 = +1/limit"""
+        concurrency = AdaptiveConcurrency(
+            initial=8, minimum=1, maximum=8, latency_target=1.0, cooldown=0.0
+        )
+
+        concurrency.on_rate_limited()
+        assert concurrency.limit == 4
+
+        for _ in range(4):
+            concurrency.on_success(latency=0.1)
+        assert 4.9 < concurrency.limit < 5.1
+
+    def test_slow_response_decreases_limit(self):
+        """지연 목표 초과 응답 = 한도 감소"""
+        concurrency = AdaptiveConcurrency(
+            initial=8, minimum=1, maximum=8, latency_target=1.0, cooldown=0.0
+        )
+        concurrency.on_success(latency=5.0)
+        assert concurrency.limit == 4
+
+    def test_cooldown_ignores_burst_of_rate_limits(self):
+        """동시에 도착한 429들은 한 번만 감소"""
+        concurrency = AdaptiveConcurrency(
+            initial=8, minimum=1, maximum=8, latency_target=1.0, cooldown=60.0
+        )
+        for _ in range(5):
+            concurrency.on_rate_limited()
+        assert concurrency.limit == 4
+
+    def test_limit_bounded(self):
+        """한도는 minimum~maximum 범위 유지"""
+        concurrency = AdaptiveConcurrency(
+            initial=2, minimum=1, maximum=2, latency_target=1.0, cooldown=0.0
+        )
+        for _ in range(10):
+            concurrency.on_rate_limited()
+        assert concurrency.limit == 1
+        for _ in range(100):
+            concurrency.on_success(latency=0.1)
+        assert concurrency.limit == 2
+
+
+class TestRateLimitedLLMClient:
+    """속도 제한 + 재시도 래퍼 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_retries_429_until_success(self):
+        """429는 재시도 후 성공, 동시성 한도는 감소"""
+        fake = FlakyLLMClient(failures=2)
+        limiter = make_limiter(concurrency=4)
+        client = RateLimitedLLMClient(fake, limiter, max_retries=5, base_delay=0.001)
+
+        assert await client.generate("sys", "질문", 0.0) == "echo:질문"
+        assert fake.calls == 3
+        assert limiter.concurrency.limit < 4
+
+    @pytest.mark.asyncio
+    async def test_retries_and_queue_wait_recorded_in_trace(self):
+        """활성 row trace에 재시도·429 횟수와 슬롯 대기 시간 기록"""
+        fake = FlakyLLMClient(failures=2)
+        client = RateLimitedLLMClient(
+            fake, make_limiter(), max_retries=5, base_delay=0.001
+        )
+
+        with start_trace() as trace:
+            await client.generate("sys", "질문", 0.0)
+
+        assert trace.counts == {"llm_retries": 2, "llm_rate_limited": 2}
+        assert trace.timings["llm_queue"] >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_latency_and_retries_recorded_per_model(self):
+        """모델 label별 재시도·429 카운터와 성공 요청 지연 히스토그램 기록"""
+        fake = FlakyLLMClient(failures=2)
+        client = RateLimitedLLMClient(
+            fake, make_limiter(), max_retries=5, base_delay=0.001, model="metrics-test"
+        )
+
+        await client.generate("sys", "질문", 0.0)
+
+        model = {"model": "metrics-test"}
+        sample = REGISTRY.get_sample_value
+        assert sample("prs_llm_retries_total", {**model, "reason": "rate_limited"}) == 2
+        assert sample("prs_llm_rate_limited_total", model) == 2
+        assert sample("prs_llm_request_duration_seconds_count", model) == 1
+        assert sample("prs_llm_in_flight_requests", model) == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        """재시도 횟수 초과 시 예외 전파"""
+        fake = FlakyLLMClient(failures=10)
+        client = RateLimitedLLMClient(
+            fake, make_limiter(), max_retries=2, base_delay=0.001
+        )
+
+        with pytest.raises(RateLimitError):
+            await client.generate("sys", "질문", 0.0)
+        assert fake.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_after_respected(self):
+        """429의 retry_after만큼 대기 후 재시도"""
+        client = RateLimitedLLMClient(
+            FlakyLLMClient(failures=0), make_limiter(), base_delay=100.0
+        )
+        assert client._backoff(0, RateLimitError(retry_after=0.5)) == 0.5
+        assert 0 <= client._backoff(3, RetryableLLMError()) <= 60.0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_shared_across_callers(self):
+        """같은 limiter를 쓰는 호출들은 동시성 한도를 공유"""
+        fake = FlakyLLMClient(failures=0, latency=0.01)
+        limiter = make_limiter(concurrency=3)
+        run_a = RateLimitedLLMClient(fake, limiter)
+        run_b = RateLimitedLLMClient(fake, limiter)
+
+        await asyncio.gather(
+            *(run_a.generate("sys", str(i), 0.0) for i in range(10)),
+            *(run_b.generate("sys", str(i), 0.0) for i in range(10)),
+        )
+
+        assert fake.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_rpm_budget_paces_requests(self):
+        """RPM 예산을 넘는 요청은 refill될 때까지 대기"""
+        fake = FlakyLLMClient(failures=0)
+        # 분당 1200 = 초당 20 요청, 버스트 용량 1200 → 용량을 먼저 비움
+        limiter = make_limiter(rpm=1200)
+        await limiter.requests.acquire(1200)
+        client = RateLimitedLLMClient(fake, limiter)
+
+        started = time.perf_counter()
+        for i in range(3):
+            await client.generate("sys", str(i), 0.0)
+
+        assert time.perf_counter() - started >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_run_survives_burst_of_429s(self):
+        """동시 요청 중 429가 섞여도 모든 요청 성공"""
+        fake = FlakyLLMClient(failures=5, latency=0.001)
+        client = RateLimitedLLMClient(
+            fake, make_limiter(concurrency=8), max_retries=10, base_delay=0.001
+        )
+
+        results = await asyncio.gather(
+            *(client.generate("sys", str(i), 0.0) for i in range(20))
+        )
+
+        assert results == [f"echo:{i}" for i in range(20)]
+        assert fake.calls == 25
+
+    @pytest.mark.asyncio
+    async def test_stream_retries_before_first_chunk(self):
+        """첫 조각 전의 429는 재시도"""
+        fake = FlakyLLMClient(failures=2)
+        client = RateLimitedLLMClient(fake, make_limiter(), base_delay=0.001)
+
+        chunks = [chunk async for chunk in client.generate_stream("sys", "질문", 0.0)]
+
+        assert "".join(chunks) == "echo:질문"
+        assert fake.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_does_not_retry_after_first_chunk(self):
+        """조각을 이미 내보낸 뒤의 오류는 재시도하지 않고 전파"""
+        fake = FlakyLLMClient(failures=0)
+        fake.fail_mid_stream = True
+        client = RateLimitedLLMClient(fake, make_limiter(), base_delay=0.001)
+
+        chunks: list[str] = []
+        with pytest.raises(RetryableLLMError):
+            async for chunk in client.generate_stream("sys", "질문", 0.0):
+                chunks.append(chunk)
+
+        assert chunks == ["e"]
+        assert fake.calls == 1
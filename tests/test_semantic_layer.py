@@ -1,7 +1,23 @@
+import asyncio
 from unittest.mock import patch
 
+import httpx
+import numpy as np
+import openai
+import pytest
+
+from src.embeddings.cache import EmbeddingCache
 from src.prompts.models import OutputSchemaType
-from src.runs.evaluator.semantic_layer import check_semantic
+from src.runs.evaluator.semantic_layer import (
+    check_semantic,
+    check_semantic_async,
+    check_semantic_batch,
+    check_semantic_batch_async,
+    cosine_similarities,
+    score_semantic_batch,
+    score_semantic_batch_async,
+)
+from tests.conftest import FakeEmbeddingClient
 
 EMBEDDING_PATH = "src.runs.evaluator.semantic_layer.get_embedding"
 
@@ -95,3 +111,258 @@ class TestCheckSemanticLabelSkip:
         assert result.passed is True
         assert result.semantic_score == 1.0
         mock_get_embedding.assert_not_called()
+
+
+BATCH_EMBEDDINGS_PATH = "src.runs.evaluator.semantic_layer.get_embeddings"
+
+
+def _response(status_code: int) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        request=httpx.Request("POST", "https://api.openai.com/v1/embeddings"),
+    )
+
+
+def _bad_request() -> openai.BadRequestError:
+    return openai.BadRequestError(
+        "maximum context length exceeded", response=_response(400), body=None
+    )
+
+
+class TestCheckSemanticBatch:
+    """배치 Semantic 검증 테스트"""
+
+    @patch(BATCH_EMBEDDINGS_PATH)
+    def test_pairs_chunked_per_request(self, mock_get_embeddings):
+        """요청당 batch_size개 텍스트씩 묶어서 요청"""
+        mock_get_embeddings.side_effect = lambda texts: [[1.0, 0.0] for _ in texts]
+        pairs = [(f"raw{i}", f"expected{i}") for i in range(5)]
+
+        results = check_semantic_batch(
+            pairs, OutputSchemaType.FREEFORM, threshold=0.8, batch_size=4
+        )
+
+        assert len(results) == 5
+        assert all(r.passed for r in results)
+        assert [len(c.args[0]) for c in mock_get_embeddings.call_args_list] == [4, 4, 2]
+
+    @patch(BATCH_EMBEDDINGS_PATH)
+    def test_scores_distributed_back_to_pairs(self, mock_get_embeddings):
+        """각 쌍의 점수가 입력 순서대로 반환"""
+        mock_get_embeddings.return_value = [
+            [1.0, 0.0],
+            [1.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ]
+
+        results = check_semantic_batch(
+            [("a", "a"), ("b", "c")], OutputSchemaType.FREEFORM, threshold=0.8
+        )
+
+        assert results[0].semantic_score == 1.0
+        assert results[1].semantic_score == 0.0
+        assert results[1].passed is False
+
+    @patch(BATCH_EMBEDDINGS_PATH)
+    def test_failed_request_only_affects_its_chunk(self, mock_get_embeddings):
+        """실패한 요청의 쌍만 오류 결과"""
+        mock_get_embeddings.side_effect = [
+            Exception("API rate limit exceeded"),
+            [[1.0, 0.0], [1.0, 0.0]],
+        ]
+
+        results = check_semantic_batch(
+            [("a", "a"), ("b", "b")],
+            OutputSchemaType.FREEFORM,
+            threshold=0.8,
+            batch_size=2,
+        )
+
+        assert results[0].passed is False
+        assert results[0].error_message is not None
+        assert results[1].passed is True
+
+    @patch(BATCH_EMBEDDINGS_PATH)
+    def test_rejected_request_fails_only_bad_pair(self, mock_get_embeddings):
+        """4xx로 거부된 묶음은 나눠서 다시 요청해 문제 쌍만 오류 결과"""
+
+        def _embed(texts: list[str]) -> list[list[float]]:
+            if "too long" in texts:
+                raise _bad_request()
+            return [[1.0, 0.0] for _ in texts]
+
+        mock_get_embeddings.side_effect = _embed
+        pairs = [("a", "a"), ("b", "b"), ("too long", "c"), ("d", "d")]
+
+        scores = score_semantic_batch(
+            pairs, OutputSchemaType.FREEFORM, threshold=0.8, batch_size=8
+        )
+
+        assert scores.passed.tolist() == [True, True, False, True]
+        assert list(scores.errors) == [2]
+        assert scores.scores.tolist() == [1.0, 1.0, 0.0, 1.0]
+
+    @patch(BATCH_EMBEDDINGS_PATH)
+    def test_transient_error_is_not_bisected(self, mock_get_embeddings):
+        """429 같은 일시적 오류는 묶음을 나누지 않고 한 번만 요청"""
+        mock_get_embeddings.side_effect = openai.RateLimitError(
+            "rate limited", response=_response(429), body=None
+        )
+
+        scores = score_semantic_batch(
+            [("a", "a"), ("b", "b")], OutputSchemaType.FREEFORM, threshold=0.8
+        )
+
+        assert list(scores.errors) == [0, 1]
+        assert mock_get_embeddings.call_count == 1
+
+    @patch(BATCH_EMBEDDINGS_PATH)
+    def test_label_type_skips_embedding(self, mock_get_embeddings):
+        """Label 타입은 embedding 호출 없이 통과"""
+        results = check_semantic_batch(
+            [("TRUE", "TRUE")], OutputSchemaType.LABEL, threshold=0.8
+        )
+
+        assert results[0].semantic_score == 1.0
+        mock_get_embeddings.assert_not_called()
+
+
+class TestScoreSemanticBatch:
+    """columnar 배치 점수 - 행렬 연산 한 번으로 계산"""
+
+    def test_cosine_similarities_row_wise(self):
+        """행별 코사인 유사도, 영벡터 행은 0.0"""
+        a = np.array([[1.0, 0.0], [3.0, 4.0], [0.0, 0.0]])
+        b = np.array([[2.0, 0.0], [4.0, -3.0], [1.0, 1.0]])
+
+        assert cosine_similarities(a, b).tolist() == [1.0, 0.0, 0.0]
+
+    @patch(BATCH_EMBEDDINGS_PATH)
+    def test_failed_chunk_scores_zero(self, mock_get_embeddings):
+        """실패한 묶음의 쌍은 점수 0.0, 오류 메시지와 함께 실패"""
+        mock_get_embeddings.side_effect = [
+            [[1.0, 0.0], [1.0, 0.0]],
+            Exception("API rate limit exceeded"),
+            [[1.0, 0.0], [0.6, 0.8]],
+        ]
+
+        scores = score_semantic_batch(
+            [("a", "a"), ("b", "b"), ("c", "d")],
+            OutputSchemaType.FREEFORM,
+            threshold=0.5,
+            batch_size=2,
+        )
+
+        assert scores.scores.tolist() == pytest.approx([1.0, 0.0, 0.6])
+        assert scores.passed.tolist() == [True, False, True]
+        assert list(scores.errors) == [1]
+        assert scores.result(1).error_message is not None
+
+
+class TestCheckSemanticAsync:
+    """비동기 Semantic 검증 - 이벤트 루프를 막지 않음"""
+
+    @pytest.mark.asyncio
+    async def test_async_batch_uses_async_client(self):
+        """비동기 배치는 EmbeddingClient.embed로 요청"""
+        client = FakeEmbeddingClient()
+        cache = EmbeddingCache(max_size=100)
+
+        with (
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                return_value=client,
+            ),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_cache",
+                return_value=cache,
+            ),
+        ):
+            results = await check_semantic_batch_async(
+                [("a", "x"), ("b", "x")], OutputSchemaType.FREEFORM, threshold=0.8
+            )
+
+        assert [r.semantic_score for r in results] == [1.0, 1.0]
+        assert client.calls == [["a", "x", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_async_rejected_request_fails_only_bad_pair(self):
+        """비동기 배치도 4xx로 거부된 묶음을 나눠 문제 쌍만 오류 결과"""
+
+        class RejectingClient(FakeEmbeddingClient):
+            async def embed(self, texts):
+                if "too long" in texts:
+                    self.calls.append(list(texts))
+                    raise _bad_request()
+                return await super().embed(texts)
+
+        client = RejectingClient()
+        with (
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                return_value=client,
+            ),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_cache",
+                return_value=EmbeddingCache(max_size=100),
+            ),
+        ):
+            scores = await score_semantic_batch_async(
+                [("a", "x"), ("too long", "x"), ("b", "x"), ("c", "x")],
+                OutputSchemaType.FREEFORM,
+                threshold=0.8,
+            )
+
+        assert scores.passed.tolist() == [True, False, True, True]
+        assert list(scores.errors) == [1]
+        assert "maximum context length" in (scores.result(1).error_message or "")
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        """embedding 요청 대기 중에도 다른 작업이 진행됨"""
+        client = FakeEmbeddingClient(latency=0.05)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        with (
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                return_value=client,
+            ),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_cache",
+                return_value=EmbeddingCache(max_size=100),
+            ),
+        ):
+            await asyncio.gather(
+                check_semantic_async("raw", "expected", OutputSchemaType.FREEFORM, 0.8),
+                ticker(),
+            )
+
+        assert ticks == 5
+
+    @pytest.mark.asyncio
+    async def test_client_error_returns_error_message(self):
+        """클라이언트 생성/요청 실패 시 error_message 반환"""
+        with (
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                side_effect=Exception("Missing credentials"),
+            ),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_cache",
+                return_value=EmbeddingCache(max_size=100),
+            ),
+        ):
+            result = await check_semantic_async(
+                "raw", "expected", OutputSchemaType.FREEFORM, 0.8
+            )
+
+        assert result.passed is False
+        assert result.error_message is not None
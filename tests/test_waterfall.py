@@ -1,9 +1,17 @@
 from unittest.mock import patch
 
+import pytest
+
 from src.common.types import LogicConstraint
+from src.embeddings.cache import EmbeddingCache
 from src.prompts.models import OutputSchemaType
-from src.runs.evaluator.waterfall import evaluate_waterfall
+from src.runs.evaluator.waterfall import (
+    evaluate_waterfall,
+    evaluate_waterfall_async,
+    evaluate_waterfall_batch,
+)
 from src.runs.models import ResultStatus
+from tests.conftest import FakeEmbeddingClient
 
 
 class TestWaterfallFormatFail:
@@ -144,3 +152,108 @@ class TestWaterfallLabel:
         assert result.semantic_result is not None
         assert result.semantic_result.semantic_score == 1.0
         assert result.status == ResultStatus.PASS
+
+
+class TestWaterfallBatch:
+    """배치 평가 - Format 통과 row만 묶어서 Semantic 검사"""
+
+    @patch("src.runs.evaluator.semantic_layer.get_embeddings")
+    def test_batch_embeds_only_format_survivors(self, mock_embeddings):
+        """Format 실패 row는 embedding 요청에서 제외"""
+        mock_embeddings.side_effect = lambda texts: [[1.0, 0.0] for _ in texts]
+
+        results = evaluate_waterfall_batch(
+            raw_outputs=['{"verdict": "TRUE"}', "invalid json", '{"verdict": "FALSE"}'],
+            expected_outputs=['{"verdict": "TRUE"}'] * 3,
+            output_schema=OutputSchemaType.JSON_OBJECT,
+            threshold=0.5,
+            constraints=[{"type": "contains", "target": "verdict", "value": "TRUE"}],
+        )
+
+        assert [r.status for r in results] == [
+            ResultStatus.PASS,
+            ResultStatus.FORMAT,
+            ResultStatus.LOGIC,
+        ]
+        mock_embeddings.assert_called_once()
+        assert "invalid json" not in mock_embeddings.call_args.args[0]
+
+    @patch("src.runs.evaluator.semantic_layer.get_embeddings")
+    def test_batch_result_is_columnar(self, mock_embeddings):
+        """점수는 배열, Logic 결과는 Semantic 통과 row만 보관"""
+        mock_embeddings.return_value = [
+            [1.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 0.0],
+        ]
+
+        result = evaluate_waterfall_batch(
+            raw_outputs=['{"verdict": "TRUE"}', "invalid json", '{"verdict": "NO"}'],
+            expected_outputs=['{"verdict": "TRUE"}'] * 3,
+            output_schema=OutputSchemaType.JSON_OBJECT,
+            threshold=0.5,
+            constraints=[{"type": "contains", "target": "verdict", "value": "TRUE"}],
+        )
+
+        assert result.statuses == [
+            ResultStatus.PASS,
+            ResultStatus.FORMAT,
+            ResultStatus.SEMANTIC,
+        ]
+        assert result.semantic_scores.tolist() == [1.0, 0.0, 0.0]
+        assert list(result.logic_results) == [0]
+        assert result[1].semantic_result is None
+        assert result[2].semantic_result is not None
+        assert result[2].semantic_result.passed is False
+        assert result[2].logic_result is None
+
+    @patch("src.runs.evaluator.semantic_layer.get_embeddings")
+    def test_known_format_errors_skip_format_check(self, mock_embeddings):
+        """format_errors로 전달한 row는 다시 검사하지 않고 FORMAT"""
+        mock_embeddings.side_effect = lambda texts: [[1.0, 0.0] for _ in texts]
+
+        result = evaluate_waterfall_batch(
+            raw_outputs=['{"verdict": "TRUE"}', '{"verdict": "TR'],
+            expected_outputs=['{"verdict": "TRUE"}'] * 2,
+            output_schema=OutputSchemaType.JSON_OBJECT,
+            threshold=0.5,
+            constraints=[],
+            format_errors={1: "생성 중단"},
+        )
+
+        assert result.statuses == [ResultStatus.PASS, ResultStatus.FORMAT]
+        assert result.format_results[1].error_message == "생성 중단"
+        assert len(mock_embeddings.call_args.args[0]) == 2
+
+
+class TestWaterfallAsync:
+    """비동기 평가 - 비동기 Embedding 클라이언트 사용"""
+
+    @pytest.mark.asyncio
+    async def test_async_waterfall_pass(self):
+        """비동기 경로도 동일한 fail-fast 판정"""
+        client = FakeEmbeddingClient()
+
+        with (
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_client",
+                return_value=client,
+            ),
+            patch(
+                "src.runs.evaluator.semantic_layer.get_embedding_cache",
+                return_value=EmbeddingCache(max_size=100),
+            ),
+        ):
+            result = await evaluate_waterfall_async(
+                raw_output='{"verdict": "TRUE"}',
+                output_schema=OutputSchemaType.JSON_OBJECT,
+                expected_output='{"verdict": "TRUE"}',
+                threshold=0.5,
+                constraints=[
+                    {"type": "contains", "target": "verdict", "value": "TRUE"}
+                ],
+            )
+
+        assert result.status == ResultStatus.PASS
+        assert len(client.calls) == 1